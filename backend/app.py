@@ -545,6 +545,9 @@ async def get_context(days: int = 30) -> Dict[str, object]:
 # Sensor Manager Endpoints (Phase 5)
 _sensor_manager = None
 
+# Status/health polled by dashboards may be this many milliseconds old
+STATUS_CACHE_TTL_MS = 500
+
 
 def get_sensor_manager():
     """Get or create the global sensor manager instance."""
@@ -573,7 +576,7 @@ async def get_manager_status() -> Dict[str, object]:
     """
     try:
         manager = get_sensor_manager()
-        return manager.get_all_status()
+        return manager.get_all_status(ttl_ms=STATUS_CACHE_TTL_MS)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -641,7 +644,7 @@ async def get_manager_health() -> Dict[str, object]:
     """
     try:
         manager = get_sensor_manager()
-        return manager.get_health()
+        return manager.get_health(ttl_ms=STATUS_CACHE_TTL_MS)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -48,12 +48,11 @@ Usage:
 Optimized for Raspberry Pi 5 deployment with graceful hardware detection.
 """
 
-from datetime import datetime
 from typing import Dict, Any, Optional
 import logging
 import random
 
-from .base import BaseSensor, SensorError
+from .base import BaseSensor, SensorError, iso_now
 
 logger = logging.getLogger(__name__)
 
@@ -410,7 +409,7 @@ class AirQualitySensor(BaseSensor):
             self._last_reading = ppm
 
             return {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": iso_now(),
                 "sensor_type": "air_quality",
                 "raw_value": avg_raw,
                 "ppm": round(ppm, 2),
@@ -610,7 +609,7 @@ class AirQualitySensor(BaseSensor):
         self._last_reading = ppm
 
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_now(),
             "sensor_type": "air_quality",
             "raw_value": round(raw_value, 2),
             "ppm": round(ppm, 2),
@@ -42,13 +42,66 @@ Optimized for Raspberry Pi 5 deployment with graceful hardware detection.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from enum import Enum
+from collections import deque
 from datetime import datetime
+import json
 import logging
+import threading
+import time
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+__all__ = [
+    "iso_now",
+    "SensorStatus",
+    "SensorError",
+    "SensorUnavailableError",
+    "SensorConfigError",
+    "BaseSensor",
+]
+
+# (epoch second, ISO 8601 prefix) of the most recent iso_now() call
+_iso_prefix_cache: Tuple[int, str] = (-1, "")
+
+
+def iso_now() -> str:
+    """
+    Return the current local time as an ISO 8601 string with microseconds.
+
+    The date/time prefix is formatted at most once per wall-clock second and
+    reused by later calls in the same second; only the microsecond suffix is
+    formatted per call. The cache is a single tuple, so concurrent callers
+    need no lock.
+
+    Returns:
+        str: Timestamp such as '2025-01-01T12:00:00.123456'
+    """
+    global _iso_prefix_cache
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_seconds, prefix = _iso_prefix_cache
+    if cached_seconds != seconds:
+        prefix = datetime.fromtimestamp(seconds).isoformat()
+        _iso_prefix_cache = (seconds, prefix)
+    return f"{prefix}.{nanos // 1000:06d}"
+
+
+def _encode_default(obj: Any) -> Any:
+    """Convert NumPy values and datetimes that msgpack/json cannot encode."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if hasattr(obj, "tolist"):  # NumPy scalars and arrays
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not serializable")
+
 
 class SensorStatus(Enum):
     """Sensor status enumeration."""
@@ -76,6 +129,39 @@ class SensorConfigError(SensorError):
 
 
 
+class _HistoryBuffer:
+    """
+    Bounded, thread-safe history of recent sensor readings.
+
+    Filled by a sensor's background sampler thread; readers take the freshest
+    entry instead of triggering a capture themselves.
+    """
+
+    def __init__(self, capacity: int = 8):
+        self._items: deque = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+
+    def append(self, data: Dict[str, Any]) -> None:
+        """Store a reading stamped with the current monotonic time."""
+        with self._lock:
+            self._items.append((time.monotonic(), data))
+
+    def latest(self, max_age: float) -> Optional[Dict[str, Any]]:
+        """
+        Return the newest reading if it is at most max_age seconds old.
+
+        Returns:
+            The reading, or None if the buffer is empty or the reading expired
+        """
+        with self._lock:
+            if not self._items:
+                return None
+            timestamp, data = self._items[-1]
+        if time.monotonic() - timestamp > max_age:
+            return None
+        return data
+
+
 class BaseSensor(ABC):
     """
     Abstract base class for all sensors.
@@ -90,6 +176,7 @@ class BaseSensor(ABC):
         config: Sensor configuration dictionary
         error_message: Last error message if status is ERROR
         mock_mode: Whether sensor is running in mock/simulation mode
+        sample_hz: Background sampling rate, or None to capture on every read()
     """
 
     def __init__(self, name: str, sensor_type: str, config: Optional[Dict[str, Any]] = None):
@@ -101,6 +188,9 @@ class BaseSensor(ABC):
             sensor_type: Type identifier (camera, microphone, etc.)
             config: Optional configuration dictionary
                 - 'mock_mode' (bool): Enable mock/simulation mode (default: False)
+                - 'sample_hz' (float): Capture in a background thread at this rate
+                  and serve read() from the freshest buffered sample (default: None)
+                - 'history_size' (int): Buffered samples kept when sampling (default: 8)
                 - Other sensor-specific configuration options
         """
         self.name = name
@@ -110,6 +200,14 @@ class BaseSensor(ABC):
         self.error_message: Optional[str] = None
         self.mock_mode = self.config.get("mock_mode", False)
         self._start_time: Optional[datetime] = None
+        self._start_monotonic: Optional[float] = None
+
+        # Optional background sampling (read scheduler + history buffer)
+        self.sample_hz: Optional[float] = self.config.get("sample_hz")
+        self._history: Optional[_HistoryBuffer] = None
+        self._sampler_thread: Optional[threading.Thread] = None
+        self._sampler_stop = threading.Event()
+        self._capture_lock = threading.Lock()
 
         logger.info(f"Initialized {self.name} ({self.sensor_type}, mock_mode={self.mock_mode})")
 
@@ -199,67 +297,66 @@ class BaseSensor(ABC):
         Returns:
             bool: True if started successfully (real or mock mode), False otherwise
         """
+        if self.status == SensorStatus.ACTIVE or self.status == SensorStatus.MOCK_MODE:
+            logger.warning(f"{self.name} is already active")
+            return True
+
         try:
-            if self.status == SensorStatus.ACTIVE or self.status == SensorStatus.MOCK_MODE:
-                logger.warning(f"{self.name} is already active")
-                return True
+            status, reason = self._decide_start_state()
+        except SensorUnavailableError as e:
+            # Hardware explicitly unavailable, use mock mode
+            status, reason = SensorStatus.MOCK_MODE, f"hardware unavailable: {e}"
+            self.error_message = None  # Clear error since we're in mock mode
+        except Exception as e:
+            # Unexpected error, use mock mode as last resort
+            logger.error(f"{self.name} error during start: {e}", exc_info=True)
+            status, reason = SensorStatus.MOCK_MODE, f"hardware error: {e}"
+            self.error_message = f"Hardware error (using mock mode): {str(e)}"
 
-            # Check if mock mode is explicitly requested
-            if self.mock_mode:
-                logger.info(f"Starting {self.name} in MOCK_MODE (explicitly requested)")
-                self.status = SensorStatus.MOCK_MODE
-                self._start_time = datetime.now()
-                logger.info(f"{self.name} started successfully in mock mode")
-                return True
+        self.status = status
+        if status == SensorStatus.MOCK_MODE:
+            self.mock_mode = True
+        self._mark_started()
 
-            # Check hardware availability
-            if not self.check_hardware_available():
-                logger.warning(f"{self.name} hardware not available, falling back to MOCK_MODE")
-                self.status = SensorStatus.MOCK_MODE
-                self.mock_mode = True
-                self._start_time = datetime.now()
-                return True
+        if self.sample_hz:
+            self._start_sampler()
 
-            # Try to initialize real hardware
-            logger.info(f"Starting {self.name} with real hardware...")
-            if self.initialize():
-                self.status = SensorStatus.ACTIVE
-                self._start_time = datetime.now()
-                logger.info(f"{self.name} started successfully")
-                return True
-            else:
-                # Initialization failed, fall back to mock mode
-                logger.warning(f"{self.name} initialization failed, falling back to MOCK_MODE")
-                self.status = SensorStatus.MOCK_MODE
-                self.mock_mode = True
-                self._start_time = datetime.now()
-                return True
+        if reason:
+            logger.warning(f"{self.name} started in MOCK_MODE ({reason})")
+        else:
+            logger.info(f"{self.name} started successfully ({status.value})")
+        return True
 
-        except SensorUnavailableError as e:
-            # Hardware explicitly unavailable, use mock mode
-            logger.warning(f"{self.name} hardware unavailable: {e}, using MOCK_MODE")
-            self.status = SensorStatus.MOCK_MODE
-            self.mock_mode = True
-            self.error_message = None  # Clear error since we're in mock mode
-            self._start_time = datetime.now()
-            return True
+    def _decide_start_state(self) -> Tuple[SensorStatus, Optional[str]]:
+        """
+        Decide which status start() should enter.
 
-        except Exception as e:
-            # Unexpected error, try mock mode as last resort
-            logger.error(
-                f"{self.name} error during start: {e}, attempting MOCK_MODE", exc_info=True
-            )
-            try:
-                self.status = SensorStatus.MOCK_MODE
-                self.mock_mode = True
-                self.error_message = f"Hardware error (using mock mode): {str(e)}"
-                self._start_time = datetime.now()
-                return True
-            except Exception as fallback_error:
-                self.status = SensorStatus.ERROR
-                self.error_message = str(e)
-                logger.error(f"{self.name} failed to start even in mock mode: {fallback_error}")
-                return False
+        Checks are short-circuited in order: explicit mock mode, hardware
+        detection, then hardware initialization. Exceptions raised by
+        initialize() propagate to start().
+
+        Returns:
+            Tuple of (target status, mock fallback reason or None)
+        """
+        if self.mock_mode:
+            return SensorStatus.MOCK_MODE, None
+        if not self.check_hardware_available():
+            return SensorStatus.MOCK_MODE, "hardware not available"
+
+        logger.info(f"Starting {self.name} with real hardware...")
+        if not self.initialize():
+            return SensorStatus.MOCK_MODE, "initialization failed"
+        return SensorStatus.ACTIVE, None
+
+    def _mark_started(self) -> None:
+        """
+        Record the sensor start time.
+
+        Uptime is measured against the monotonic clock; the wall-clock
+        ``_start_time`` is kept for human-readable logging only.
+        """
+        self._start_time = datetime.now()
+        self._start_monotonic = time.monotonic()
 
     def stop(self) -> bool:
         """
@@ -274,9 +371,11 @@ class BaseSensor(ABC):
                 return True
 
             logger.info(f"Stopping {self.name}...")
+            self._stop_sampler()
             if self.cleanup():
                 self.status = SensorStatus.INACTIVE
                 self._start_time = None
+                self._start_monotonic = None
                 logger.info(f"{self.name} stopped successfully")
                 return True
             else:
@@ -311,23 +410,102 @@ class BaseSensor(ABC):
         if self.status == SensorStatus.UNAVAILABLE:
             raise SensorError(f"{self.name} hardware is unavailable")
 
+        history = self._history  # Read once; stop() may drop it concurrently
+        if history is not None:
+            data = history.latest(max_age=2.0 / self.sample_hz)
+            if data is not None:
+                return dict(data)
+
+        return self._read_now()
+
+    def read_packed(self, fmt: str = "msgpack") -> bytes:
+        """
+        Read data from the sensor as a compact binary payload.
+
+        The format is chosen by the caller, never by what happens to be
+        installed, so the consumer always knows how to decode the bytes.
+
+        Args:
+            fmt: "msgpack" (requires the optional msgpack package, see the
+                ``msgpack`` extra) or "json" for compact UTF-8 JSON
+
+        Returns:
+            bytes: Serialized reading (same content as read())
+
+        Raises:
+            SensorError: If sensor is not active or msgpack is not installed
+            ValueError: If fmt is not a supported format
+        """
+        if fmt == "msgpack":
+            if not MSGPACK_AVAILABLE:
+                raise SensorError(
+                    "read_packed(fmt='msgpack') requires msgpack "
+                    "(pip install cv-mindcare[msgpack])"
+                )
+            return msgpack.packb(self.read(), use_bin_type=True, default=_encode_default)
+        if fmt == "json":
+            data = self.read()
+            return json.dumps(data, separators=(",", ":"), default=_encode_default).encode("utf-8")
+        raise ValueError(f"Unsupported packed format: {fmt!r}")
+
+    def _read_now(self) -> Dict[str, Any]:
+        """
+        Capture a fresh reading, bypassing the history buffer.
+
+        Returns:
+            Dict containing sensor data
+
+        Raises:
+            SensorError: If capture fails
+        """
         try:
-            if self.status == SensorStatus.MOCK_MODE or self.mock_mode:
-                # Use mock data
-                data = self.capture_mock_data()
-                data["mock_mode"] = True
-                return data
-            else:
-                # Use real hardware
-                data = self.capture()
-                data["mock_mode"] = False
-                return data
+            with self._capture_lock:
+                if self.status == SensorStatus.MOCK_MODE or self.mock_mode:
+                    # Use mock data
+                    data = self.capture_mock_data()
+                    data["mock_mode"] = True
+                else:
+                    # Use real hardware
+                    data = self.capture()
+                    data["mock_mode"] = False
+            return data
         except Exception as e:
             self.status = SensorStatus.ERROR
             self.error_message = str(e)
             logger.error(f"{self.name} capture error: {e}", exc_info=True)
             raise SensorError(f"Failed to read from {self.name}: {e}")
 
+    def _start_sampler(self) -> None:
+        """Start the background thread that fills the history buffer."""
+        self._stop_sampler()  # A restart from ERROR skips stop(); retire the old thread
+        self._history = _HistoryBuffer(self.config.get("history_size", 8))
+        self._sampler_stop.clear()
+        self._sampler_thread = threading.Thread(
+            target=self._sampler_loop, daemon=True, name=f"{self.sensor_type}-sampler"
+        )
+        self._sampler_thread.start()
+        logger.info(f"{self.name} background sampling at {self.sample_hz} Hz")
+
+    def _stop_sampler(self) -> None:
+        """Stop the background sampler thread and drop buffered readings."""
+        self._sampler_stop.set()
+        if self._sampler_thread is not None and self._sampler_thread.is_alive():
+            self._sampler_thread.join(timeout=2.0 / self.sample_hz + 1.0)
+        self._sampler_thread = None
+        self._history = None
+
+    def _sampler_loop(self) -> None:
+        """Capture at sample_hz until stopped (runs in background thread)."""
+        period = 1.0 / self.sample_hz
+        history = self._history
+        while not self._sampler_stop.is_set():
+            if self.is_active():
+                try:
+                    history.append(self._read_now())
+                except SensorError:
+                    pass  # Already logged; read() reports the error state
+            self._sampler_stop.wait(period)
+
     def get_status(self) -> Dict[str, Any]:
         """
         Get current sensor status.
@@ -353,9 +531,11 @@ class BaseSensor(ABC):
             "config": self.config,
         }
 
-        if self._start_time and self.status in [SensorStatus.ACTIVE, SensorStatus.MOCK_MODE]:
-            uptime = (datetime.now() - self._start_time).total_seconds()
-            result["uptime_seconds"] = uptime
+        if self._start_monotonic is not None and self.status in [
+            SensorStatus.ACTIVE,
+            SensorStatus.MOCK_MODE,
+        ]:
+            result["uptime_seconds"] = time.monotonic() - self._start_monotonic
         else:
             result["uptime_seconds"] = 0
 
@@ -379,6 +559,15 @@ class BaseSensor(ABC):
         """
         return self.status in [SensorStatus.ACTIVE, SensorStatus.MOCK_MODE]
 
+    def is_sampling(self) -> bool:
+        """
+        Check if a background sampler is filling the history buffer.
+
+        Returns:
+            bool: True if read() returns buffered samples instead of capturing
+        """
+        return self._history is not None
+
     def update_config(self, config: Dict[str, Any]) -> bool:
         """
         Update sensor configuration.
@@ -12,6 +12,10 @@ from typing import Optional, Dict
 class CameraSensor:
     """Camera sensor for face detection and emotion analysis."""
 
+    # HSV bounds for green (Hue: 40-80, Saturation: 40-255, Value: 40-255)
+    LOWER_GREEN = np.array([40, 40, 40], dtype=np.uint8)
+    UPPER_GREEN = np.array([80, 255, 255], dtype=np.uint8)
+
     def __init__(self, camera_index: int = 0):
         """
         Initialize camera sensor.
@@ -151,13 +155,8 @@ class CameraSensor:
             # Convert to HSV color space
             hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
 
-            # Define range for green color
-            # Hue: 40-80 (green range), Saturation: 40-255, Value: 40-255
-            lower_green = np.array([40, 40, 40])
-            upper_green = np.array([80, 255, 255])
-
             # Create mask for green pixels
-            mask = cv2.inRange(hsv, lower_green, upper_green)
+            mask = cv2.inRange(hsv, self.LOWER_GREEN, self.UPPER_GREEN)
 
             # Calculate percentage
             total_pixels = frame.shape[0] * frame.shape[1]
@@ -7,17 +7,81 @@ Includes automatic mock mode fallback for development without hardware.
 """
 
 import numpy as np
-from datetime import datetime
+from bisect import bisect
+from itertools import accumulate
 from typing import Dict, Any, Optional
 import logging
 import random
+import time
+
+try:
+    import cv2
+
+    CV2_AVAILABLE = True
+except ImportError:
+    cv2 = None
+    CV2_AVAILABLE = False
+
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Import base sensor
-from .base import BaseSensor, SensorUnavailableError
+from .base import BaseSensor, SensorUnavailableError, iso_now
 
 logger = logging.getLogger(__name__)
 
 
+# Explicit kernel signatures: contiguous full frames and strided downsampled views
+_GREEN_KERNEL_SIGNATURES = (
+    "int64(uint8[:, :, ::1], int64, int64, float64, float64, float64, float64)",
+    "int64(uint8[:, :, :], int64, int64, float64, float64, float64, float64)",
+)
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True, parallel=True, fastmath=True)
+    def _count_green_pixels(frame, r_idx, b_idx, h_lo, h_hi, s_min, v_min):
+        """
+        Count green pixels in one fused BGR/RGB -> HSV -> threshold pass.
+
+        Uses OpenCV's 8-bit HSV convention (hue 0-180, saturation and value
+        0-255) without materialising the HSV image or the mask.
+        """
+        height, width = frame.shape[0], frame.shape[1]
+        count = 0
+        for i in numba.prange(height):
+            for j in range(width):
+                r = np.float32(frame[i, j, r_idx])
+                g = np.float32(frame[i, j, 1])
+                b = np.float32(frame[i, j, b_idx])
+
+                v = max(r, g, b)
+                if v < v_min:
+                    continue
+                diff = v - min(r, g, b)
+                # Compare against OpenCV's rounded 8-bit saturation and hue
+                if diff == 0 or diff * 255.0 / v + 0.5 < s_min:
+                    continue
+
+                if v == r:
+                    h = 60.0 * (g - b) / diff
+                elif v == g:
+                    h = 120.0 + 60.0 * (b - r) / diff
+                else:
+                    h = 240.0 + 60.0 * (r - g) / diff
+                if h < 0:
+                    h += 360.0
+                h *= 0.5
+
+                if h_lo - 0.5 <= h < h_hi + 0.5:
+                    count += 1
+        return count
+
+
 class CameraSensor(BaseSensor):
     """
     Camera sensor for greenery detection using HSV color analysis.
@@ -42,8 +106,39 @@ class CameraSensor(BaseSensor):
         - green_hue_range (tuple): HSV hue range for green (default: (35, 85))
         - saturation_min (int): Minimum saturation for green detection (default: 40)
         - value_min (int): Minimum value for green detection (default: 40)
+        - analysis_downsample (int): Shrink frames by this factor per axis before
+          greenery analysis (default: 4, 1 disables)
+        - fast_greenery (bool): Threshold on BGR green dominance instead of HSV
+          (default: False)
+        - picamera2_yuv (bool): Capture YUV420 from picamera2 and detect green on
+          the U/V planes, skipping RGB and HSV conversion (default: False)
+        - use_numba (bool): Use the fused Numba HSV/threshold kernel when numba
+          is installed (default: False)
+        - numba_threads (int): Cap on the cores the Numba kernel splits rows
+          across (default: None, all cores)
+        - min_interval_s (float): Minimum seconds between real captures; calls
+          arriving sooner return the previous result (default: 0, disabled)
     """
 
+    # Minimum amount G must exceed R and B by in the green-dominance tests
+    GREEN_DOMINANCE_MARGIN = 15
+
+    # U and V must both fall below this for a YUV420 pixel to count as green
+    YUV_GREEN_CHROMA_MAX = 120
+
+    # Mock greenery scenarios: (min %, max %, name)
+    MOCK_SCENARIOS = (
+        (0, 5, "indoor_no_plants"),  # Indoor with no plants
+        (5, 15, "indoor_few_plants"),  # Indoor with few small plants
+        (15, 30, "indoor_many_plants"),  # Indoor with several plants
+        (30, 50, "near_window"),  # Near window with view
+        (50, 80, "outdoor_partial"),  # Outdoor with partial greenery
+        (80, 100, "outdoor_full"),  # Full outdoor/garden view
+    )
+
+    # Cumulative scenario weights (favor indoor scenarios), built once
+    MOCK_CUM_WEIGHTS = tuple(accumulate([0.25, 0.35, 0.20, 0.10, 0.07, 0.03]))
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize camera sensor."""
         super().__init__(name="Camera Sensor", sensor_type="camera", config=config)
@@ -66,13 +161,82 @@ class CameraSensor(BaseSensor):
         self.green_hue_range = self.config.get("green_hue_range", (35, 85))
         self.saturation_min = self.config.get("saturation_min", 40)
         self.value_min = self.config.get("value_min", 40)
+        self._update_hsv_bounds()
+
+        # Downsample factor applied before greenery analysis (1 = full resolution)
+        self.analysis_downsample = max(1, int(self.config.get("analysis_downsample", 4)))
+
+        # Threshold on BGR green dominance instead of HSV (faster, approximate)
+        self.fast_greenery = self.config.get("fast_greenery", False)
+
+        # Stream picamera2 frames as YUV420 and threshold the chroma planes
+        self.picamera2_yuv = self.config.get("picamera2_yuv", False)
+
+        # Fused Numba kernel instead of cvtColor + inRange (requires numba)
+        self.use_numba = self.config.get("use_numba", False)
+        if self.use_numba and not NUMBA_AVAILABLE:
+            logger.warning("use_numba requested but numba is not installed; using OpenCV")
+        self.numba_threads = self.config.get("numba_threads")
+
+        # Rate limit: serve the previous result to callers polling faster than this
+        self.min_interval_s = float(self.config.get("min_interval_s", 0))
+        self._last_capture_t = 0.0
+        self._last_result: Optional[Dict[str, Any]] = None
 
         # Hardware objects
         self.cap = None
         self.picam = None
 
+        # Reusable OpenCV frame buffer (filled in place by cap.read)
+        self._frame_buf: Optional[np.ndarray] = None
+
+        # Captured frame shape, recorded from the initialization test frame
+        self._frame_shape: Optional[tuple] = None
+
+        # HSV and mask output buffers for the OpenCV greenery path
+        self._hsv_buf: Optional[np.ndarray] = None
+        self._hsv_mask_buf: Optional[np.ndarray] = None
+
+        # Scratch buffers for the NumPy greenery fallback
+        self._dominance_buf: Optional[np.ndarray] = None
+        self._mask_buf: Optional[np.ndarray] = None
+        self._cmp_buf: Optional[np.ndarray] = None
+
         logger.info(f"CameraSensor initialized (backend={self.backend}, index={self.camera_index})")
 
+    def _update_hsv_bounds(self) -> None:
+        """Build the cv2.inRange bounds and reported hsv_params from the HSV parameters."""
+        self._lower_green = np.array(
+            [self.green_hue_range[0], self.saturation_min, self.value_min], dtype=np.uint8
+        )
+        self._upper_green = np.array([self.green_hue_range[1], 255, 255], dtype=np.uint8)
+
+        # Built once per parameter change; readings get their own copy
+        self._hsv_params = {
+            "hue_range": self.green_hue_range,
+            "saturation_min": self.saturation_min,
+            "value_min": self.value_min,
+        }
+
+    def update_config(self, config: Dict[str, Any]) -> bool:
+        """
+        Update sensor configuration and refresh the HSV detection bounds.
+
+        Args:
+            config: New configuration dictionary
+
+        Returns:
+            bool: True if configuration updated successfully
+        """
+        if not super().update_config(config):
+            return False
+
+        self.green_hue_range = self.config.get("green_hue_range", self.green_hue_range)
+        self.saturation_min = self.config.get("saturation_min", self.saturation_min)
+        self.value_min = self.config.get("value_min", self.value_min)
+        self._update_hsv_bounds()
+        return True
+
     def check_hardware_available(self) -> bool:
         """
         Check if camera hardware is available.
@@ -113,9 +277,11 @@ class CameraSensor(BaseSensor):
 
     def _check_opencv_available(self) -> bool:
         """Check if OpenCV camera is available."""
-        try:
-            import cv2
+        if not CV2_AVAILABLE:
+            logger.debug("OpenCV (cv2) not installed")
+            return False
 
+        try:
             test_cap = cv2.VideoCapture(self.camera_index)
             available = test_cap.isOpened()
             test_cap.release()
@@ -138,6 +304,13 @@ class CameraSensor(BaseSensor):
         Raises:
             SensorUnavailableError: If hardware cannot be initialized
         """
+        ready = self._initialize_backend()
+        if ready and self.use_numba and NUMBA_AVAILABLE:
+            self._warm_up_numba()
+        return ready
+
+    def _initialize_backend(self) -> bool:
+        """Initialize the configured camera backend, auto-detecting if requested."""
         if self.backend == "auto":
             # Try picamera2 first (native RPi camera), then fallback to OpenCV
             logger.info("Auto-detecting camera backend...")
@@ -165,9 +338,10 @@ class CameraSensor(BaseSensor):
 
     def _initialize_opencv(self) -> bool:
         """Initialize OpenCV camera backend."""
-        try:
-            import cv2
+        if not CV2_AVAILABLE:
+            raise SensorUnavailableError("OpenCV (cv2) not installed")
 
+        try:
             self.cap = cv2.VideoCapture(self.camera_index)
 
             if not self.cap.isOpened():
@@ -183,11 +357,10 @@ class CameraSensor(BaseSensor):
                 self.cap.release()
                 raise SensorUnavailableError("Cannot capture test frame")
 
+            self._frame_shape = frame.shape
             logger.info(f"OpenCV camera initialized (resolution={frame.shape[1]}x{frame.shape[0]})")
             return True
 
-        except ImportError:
-            raise SensorUnavailableError("OpenCV (cv2) not installed")
         except Exception as e:
             if self.cap:
                 self.cap.release()
@@ -199,8 +372,9 @@ class CameraSensor(BaseSensor):
             from picamera2 import Picamera2
 
             self.picam = Picamera2()
+            frame_format = "YUV420" if self.picamera2_yuv else "RGB888"
             config = self.picam.create_preview_configuration(
-                main={"size": self.resolution, "format": "RGB888"}
+                main={"size": self.resolution, "format": frame_format}
             )
             self.picam.configure(config)
             self.picam.start()
@@ -211,7 +385,11 @@ class CameraSensor(BaseSensor):
                 self.picam.stop()
                 raise SensorUnavailableError("Cannot capture test frame")
 
-            logger.info(f"Picamera2 initialized (resolution={frame.shape[1]}x{frame.shape[0]})")
+            self._frame_shape = frame.shape
+            logger.info(
+                f"Picamera2 initialized (format={frame_format}, "
+                f"resolution={self.resolution[0]}x{self.resolution[1]})"
+            )
             return True
 
         except ImportError:
@@ -242,6 +420,10 @@ class CameraSensor(BaseSensor):
         """
         from .base import SensorError
 
+        now = time.monotonic()
+        if self._last_result is not None and now - self._last_capture_t < self.min_interval_s:
+            return dict(self._last_result)
+
         # Capture frame
         if self.backend == "picamera2":
             frame = self._capture_picamera2()
@@ -251,33 +433,48 @@ class CameraSensor(BaseSensor):
         if frame is None:
             raise SensorError("Failed to capture frame")
 
+        if self._frame_shape is None:
+            self._frame_shape = frame.shape
+
         # Analyze greenery
         greenery_pct = self._analyze_greenery(frame)
 
-        return {
-            "timestamp": datetime.now().isoformat(),
+        result = {
+            "timestamp": iso_now(),
             "sensor_type": "camera",
             "greenery_percentage": round(greenery_pct, 2),
             "resolution": self.resolution,
-            "frame_shape": frame.shape,
-            "hsv_params": {
-                "hue_range": self.green_hue_range,
-                "saturation_min": self.saturation_min,
-                "value_min": self.value_min,
-            },
+            "frame_shape": self._frame_shape,
+            "hsv_params": dict(self._hsv_params),
         }
 
+        if self.min_interval_s > 0:
+            self._last_capture_t = now
+            self._last_result = dict(result)
+
+        return result
+
     def _capture_opencv(self) -> Optional[np.ndarray]:
-        """Capture frame using OpenCV."""
+        """
+        Capture frame using OpenCV.
+
+        Frames are decoded into a single reusable buffer, so the returned
+        array is overwritten by the next capture. Callers that keep a frame
+        across calls must copy it.
+        """
         if self.cap is None or not self.cap.isOpened():
             logger.error("OpenCV camera not initialized")
             return None
 
-        ret, frame = self.cap.read()
+        if self._frame_buf is None:
+            ret, frame = self.cap.read()
+        else:
+            ret, frame = self.cap.read(self._frame_buf)
         if not ret or frame is None:
             logger.error("Failed to capture frame")
             return None
 
+        self._frame_buf = frame
         return frame
 
     def _capture_picamera2(self) -> Optional[np.ndarray]:
@@ -298,51 +495,256 @@ class CameraSensor(BaseSensor):
         Analyze greenery percentage using HSV color space.
 
         Algorithm:
-        1. Convert frame to HSV color space
-        2. Define green color range (hue: 35-85°, saturation: 40-255, value: 40-255)
+        1. Downsample by analysis_downsample (area interpolation) and convert to HSV
+        2. Use the precomputed green range (hue: 35-85°, saturation: 40-255, value: 40-255)
         3. Create binary mask of green pixels
         4. Calculate percentage of green pixels
 
+        Alternative paths:
+        - picamera2_yuv: threshold the YUV420 chroma planes (_analyze_greenery_yuv)
+        - fast_greenery: skip HSV and threshold BGR/RGB channels directly
+          (_green_dominance_mask)
+        - use_numba: run steps 1-4 as one fused Numba pass over a strided view
+          (_analyze_greenery_numba)
+        - No OpenCV: pure-NumPy green-dominance test (_analyze_greenery_numpy)
+
         Args:
             frame: BGR or RGB image array
 
         Returns:
             float: Percentage of green pixels (0-100)
         """
-        try:
-            import cv2
+        if frame.ndim == 2 and self.backend == "picamera2" and self.picamera2_yuv:
+            return self._analyze_greenery_yuv(frame)
+
+        if self.use_numba and NUMBA_AVAILABLE:
+            return self._analyze_greenery_numba(frame)
 
+        if not CV2_AVAILABLE:
+            return self._analyze_greenery_numpy(frame)
+
+        try:
             # Convert to HSV (handle both BGR and RGB)
             if len(frame.shape) == 3 and frame.shape[2] == 3:
-                # Assume BGR from OpenCV or RGB from picamera2
-                # picamera2 gives RGB, OpenCV gives BGR
-                if self.backend == "picamera2":
-                    hsv = cv2.cvtColor(frame, cv2.COLOR_RGB2HSV)
+                # Greenery is a frame-wide ratio, so area-averaged pixels give
+                # the same answer at a fraction of the HSV/inRange cost
+                factor = self.analysis_downsample
+                height, width = frame.shape[:2]
+                if factor > 1 and width >= factor and height >= factor:
+                    frame = cv2.resize(
+                        frame, (width // factor, height // factor), interpolation=cv2.INTER_AREA
+                    )
+
+                if self.fast_greenery:
+                    mask = self._green_dominance_mask(frame)
                 else:
-                    hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
+                    # Write into buffers reused while the analysis shape stays the same
+                    shape = frame.shape[:2]
+                    if self._hsv_buf is None or self._hsv_buf.shape[:2] != shape:
+                        self._hsv_buf = np.empty(frame.shape, dtype=np.uint8)
+                        self._hsv_mask_buf = np.empty(shape, dtype=np.uint8)
+
+                    # Assume BGR from OpenCV or RGB from picamera2
+                    # picamera2 gives RGB, OpenCV gives BGR
+                    if self.backend == "picamera2":
+                        code = cv2.COLOR_RGB2HSV
+                    else:
+                        code = cv2.COLOR_BGR2HSV
+                    hsv = cv2.cvtColor(frame, code, dst=self._hsv_buf)
+
+                    # Create mask for green pixels
+                    mask = cv2.inRange(
+                        hsv, self._lower_green, self._upper_green, dst=self._hsv_mask_buf
+                    )
             else:
                 logger.error(f"Unexpected frame shape: {frame.shape}")
                 return 0.0
 
-            # Define HSV range for green
-            lower_green = np.array([self.green_hue_range[0], self.saturation_min, self.value_min])
-            upper_green = np.array([self.green_hue_range[1], 255, 255])
+            # Calculate percentage
+            total_pixels = mask.size
+            green_pixels = cv2.countNonZero(mask)
+            percentage = (green_pixels / total_pixels) * 100.0
 
-            # Create mask for green pixels
-            mask = cv2.inRange(hsv, lower_green, upper_green)
+            logger.debug(
+                "Greenery analysis: %d/%d = %.2f%%", green_pixels, total_pixels, percentage
+            )
+            return percentage
+
+        except Exception as e:
+            logger.error(f"Greenery analysis failed: {e}")
+            return 0.0
+
+    def _green_dominance_mask(self, frame: np.ndarray) -> np.ndarray:
+        """
+        Build a green mask directly from BGR/RGB channels with OpenCV.
+
+        Same rule as _analyze_greenery_numpy: G must exceed R and B by
+        GREEN_DOMINANCE_MARGIN and be at least value_min. Uses OpenCV's
+        saturating arithmetic, so no widening to int16 is needed.
+
+        Args:
+            frame: BGR or RGB image array
+
+        Returns:
+            np.ndarray: uint8 mask (255 = green)
+        """
+        # picamera2 gives RGB, OpenCV gives BGR
+        if self.backend == "picamera2":
+            r, g, b = cv2.split(frame)
+        else:
+            b, g, r = cv2.split(frame)
+
+        margin = self.GREEN_DOMINANCE_MARGIN
+        mask = cv2.compare(g, cv2.add(r, margin), cv2.CMP_GT)
+        mask = cv2.bitwise_and(mask, cv2.compare(g, cv2.add(b, margin), cv2.CMP_GT))
+        _, bright = cv2.threshold(g, self.value_min - 1, 255, cv2.THRESH_BINARY)
+        return cv2.bitwise_and(mask, bright)
+
+    def _analyze_greenery_yuv(self, frame: np.ndarray) -> float:
+        """
+        Analyze greenery percentage on a picamera2 YUV420 frame.
+
+        Green lies in the negative-chroma quadrant, so a pixel counts as green
+        when both U and V are below YUV_GREEN_CHROMA_MAX. The chroma planes
+        are already subsampled 2x per axis, so no resize is needed.
+
+        Args:
+            frame: YUV420 planar array of shape (height * 3 / 2, width)
+
+        Returns:
+            float: Percentage of green pixels (0-100)
+        """
+        try:
+            height = frame.shape[0] * 2 // 3
+            width = frame.shape[1]
+
+            # U plane then V plane, each (height/2, width/2), after the Y plane
+            chroma = frame[height:].reshape(2, height // 2, width // 2)
+            threshold = self.YUV_GREEN_CHROMA_MAX - 1
+            _, u_mask = cv2.threshold(chroma[0], threshold, 255, cv2.THRESH_BINARY_INV)
+            _, v_mask = cv2.threshold(chroma[1], threshold, 255, cv2.THRESH_BINARY_INV)
+            mask = cv2.bitwise_and(u_mask, v_mask)
 
-            # Calculate percentage
             total_pixels = mask.size
-            green_pixels = np.count_nonzero(mask)
+            green_pixels = cv2.countNonZero(mask)
+            percentage = (green_pixels / total_pixels) * 100.0
+
+            logger.debug(
+                "Greenery analysis (yuv): %d/%d = %.2f%%", green_pixels, total_pixels, percentage
+            )
+            return percentage
+
+        except Exception as e:
+            logger.error(f"Greenery analysis failed: {e}")
+            return 0.0
+
+    def _warm_up_numba(self) -> None:
+        """
+        Compile the Numba kernel before the first real frame.
+
+        Both declared uint8 layouts are compiled up front, so no type
+        inference or JIT happens in capture() and the contiguous variant can
+        use aligned vector loads. With cache=True this is a disk load after
+        the first run.
+        """
+        for signature in _GREEN_KERNEL_SIGNATURES:
+            _count_green_pixels.compile(signature)
+
+    def _analyze_greenery_numba(self, frame: np.ndarray) -> float:
+        """
+        Analyze greenery percentage with the fused Numba kernel.
+
+        Args:
+            frame: BGR or RGB image array
+
+        Returns:
+            float: Percentage of green pixels (0-100)
+        """
+        if frame.ndim != 3 or frame.shape[2] != 3:
+            logger.error(f"Unexpected frame shape: {frame.shape}")
+            return 0.0
+
+        try:
+            factor = self.analysis_downsample
+            view = frame[::factor, ::factor] if factor > 1 else frame
+
+            # Numba's thread count is per calling thread, so apply it here
+            if self.numba_threads:
+                numba.set_num_threads(min(int(self.numba_threads), numba.config.NUMBA_NUM_THREADS))
+
+            # picamera2 gives RGB, OpenCV gives BGR
+            r_idx, b_idx = (0, 2) if self.backend == "picamera2" else (2, 0)
+            green_pixels = _count_green_pixels(
+                view,
+                r_idx,
+                b_idx,
+                float(self.green_hue_range[0]),
+                float(self.green_hue_range[1]),
+                float(self.saturation_min),
+                float(self.value_min),
+            )
+            total_pixels = view.shape[0] * view.shape[1]
             percentage = (green_pixels / total_pixels) * 100.0
 
-            logger.debug(f"Greenery analysis: {green_pixels}/{total_pixels} = {percentage:.2f}%")
+            logger.debug(
+                "Greenery analysis (numba): %d/%d = %.2f%%", green_pixels, total_pixels, percentage
+            )
             return percentage
 
         except Exception as e:
             logger.error(f"Greenery analysis failed: {e}")
             return 0.0
 
+    def _analyze_greenery_numpy(self, frame: np.ndarray) -> float:
+        """
+        Approximate greenery percentage without OpenCV.
+
+        Skips the HSV transform and classifies a pixel as green when its green
+        channel exceeds both red and blue by GREEN_DOMINANCE_MARGIN and is at
+        least value_min bright. Comparisons run in place on buffers that are
+        reused while the frame shape stays the same.
+
+        Args:
+            frame: BGR or RGB image array
+
+        Returns:
+            float: Percentage of green pixels (0-100)
+        """
+        if frame.ndim != 3 or frame.shape[2] != 3:
+            logger.error(f"Unexpected frame shape: {frame.shape}")
+            return 0.0
+
+        # picamera2 gives RGB, OpenCV gives BGR
+        if self.backend == "picamera2":
+            r, g, b = frame[..., 0], frame[..., 1], frame[..., 2]
+        else:
+            b, g, r = frame[..., 0], frame[..., 1], frame[..., 2]
+
+        shape = frame.shape[:2]
+        if self._dominance_buf is None or self._dominance_buf.shape != shape:
+            self._dominance_buf = np.empty(shape, dtype=np.int16)
+            self._mask_buf = np.empty(shape, dtype=bool)
+            self._cmp_buf = np.empty(shape, dtype=bool)
+
+        dominance, mask, cmp = self._dominance_buf, self._mask_buf, self._cmp_buf
+        margin = self.GREEN_DOMINANCE_MARGIN
+
+        np.add(r, margin, out=dominance, dtype=np.int16)
+        np.greater(g, dominance, out=mask)
+        np.add(b, margin, out=dominance, dtype=np.int16)
+        np.greater(g, dominance, out=cmp)
+        np.logical_and(mask, cmp, out=mask)
+        np.greater_equal(g, self.value_min, out=cmp)
+        np.logical_and(mask, cmp, out=mask)
+
+        green_pixels = np.count_nonzero(mask)
+        percentage = (green_pixels / mask.size) * 100.0
+
+        logger.debug(
+            "Greenery analysis (numpy): %d/%d = %.2f%%", green_pixels, mask.size, percentage
+        )
+        return percentage
+
     def capture_mock_data(self) -> Dict[str, Any]:
         """
         Generate realistic mock camera data.
@@ -352,32 +754,19 @@ class CameraSensor(BaseSensor):
         Returns:
             Dict with same structure as capture()
         """
-        # Generate realistic greenery percentage based on common scenarios
-        scenarios = [
-            (0, 5, "indoor_no_plants"),  # Indoor with no plants
-            (5, 15, "indoor_few_plants"),  # Indoor with few small plants
-            (15, 30, "indoor_many_plants"),  # Indoor with several plants
-            (30, 50, "near_window"),  # Near window with view
-            (50, 80, "outdoor_partial"),  # Outdoor with partial greenery
-            (80, 100, "outdoor_full"),  # Full outdoor/garden view
-        ]
-
-        # Weighted random selection (favor indoor scenarios)
-        weights = [0.25, 0.35, 0.20, 0.10, 0.07, 0.03]
-        scenario = random.choices(scenarios, weights=weights)[0]
+        # Weighted random scenario via bisect on the precomputed cumulative weights
+        cum_weights = self.MOCK_CUM_WEIGHTS
+        index = bisect(cum_weights, random.random() * cum_weights[-1])
+        scenario = self.MOCK_SCENARIOS[min(index, len(cum_weights) - 1)]
         greenery_pct = random.uniform(scenario[0], scenario[1])
 
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_now(),
             "sensor_type": "camera",
             "greenery_percentage": round(greenery_pct, 2),
             "resolution": self.resolution,
             "frame_shape": (self.resolution[1], self.resolution[0], 3),  # Height, Width, Channels
-            "hsv_params": {
-                "hue_range": self.green_hue_range,
-                "saturation_min": self.saturation_min,
-                "value_min": self.value_min,
-            },
+            "hsv_params": dict(self._hsv_params),
             "mock_scenario": scenario[2],
         }
 
@@ -393,6 +782,9 @@ class CameraSensor(BaseSensor):
                 self.cap.release()
                 self.cap = None
                 logger.info("OpenCV camera released")
+            self._frame_buf = None
+            self._frame_shape = None
+            self._last_result = None
 
             if self.picam is not None:
                 self.picam.stop()
@@ -430,7 +822,7 @@ def get_camera_reading(camera_index: int = 0, backend: str = "opencv") -> Dict[s
     except Exception as e:
         sensor.stop()
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_now(),
             "sensor_type": "camera",
             "greenery_percentage": 0.0,
             "error": str(e),
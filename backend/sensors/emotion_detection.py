@@ -6,9 +6,14 @@ Provides real-time emotion detection using DeepFace library with multiple model
 
 import numpy as np
 import cv2
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+from typing import Dict, Any, Optional, List, Tuple
 import logging
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     from deepface import DeepFace
@@ -18,7 +23,15 @@ except ImportError:
     DEEPFACE_AVAILABLE = False
     logging.warning("DeepFace not available. Install with: pip install deepface")
 
-from .base import BaseSensor, SensorUnavailableError
+try:
+    from tflite_runtime.interpreter import Interpreter as TFLiteInterpreter
+
+    TFLITE_AVAILABLE = True
+except ImportError:
+    TFLiteInterpreter = None
+    TFLITE_AVAILABLE = False
+
+from .base import BaseSensor, SensorUnavailableError, iso_now
 
 logger = logging.getLogger(__name__)
 
@@ -29,8 +42,33 @@ class EmotionDetector(BaseSensor):
 
     Supports multiple models and provides real-time emotion classification
     from webcam feed with confidence scoring.
+
+    Inference runs on a background worker thread: capture() only grabs a
+    frame, hands it to the worker (dropping any frame still waiting) and
+    returns the most recent analysis result.
+
+    Configuration options:
+        - analysis_size: (width, height) frames are downscaled to before
+          inference (default: (320, 240)); face coordinates are reported in
+          original frame units
+        - tflite_model_path: Path to a quantized emotion model exported with
+          scripts/export_emotion_tflite.py (default: None). When set, faces
+          are found with OpenCV's Haar cascade and classified by the TFLite
+          interpreter; DeepFace.analyze is used as a fallback on error
+        - detect_interval: Frames between full face detections (default: 5);
+          in between, the last face box is cropped and only classified.
+          1 detects on every frame
+        - min_interval_s: Minimum seconds between real captures; calls arriving
+          sooner return the previous result (default: 0, disabled)
+        - inference_cpus: CPU ids the inference worker is pinned to (Linux
+          only). Default: the last two cores of the process affinity mask when
+          it allows 4 or more, so capture keeps the first ones; empty disables
+          pinning
     """
 
+    # Seconds capture() waits for the very first inference result
+    FIRST_RESULT_TIMEOUT = 10.0
+
     # Available DeepFace models
     AVAILABLE_MODELS = [
         "VGG-Face",
@@ -47,6 +85,9 @@ class EmotionDetector(BaseSensor):
     # Emotion categories (DeepFace standard)
     EMOTIONS = ["angry", "disgust", "fear", "happy", "sad", "surprise", "neutral"]
 
+    # Dirichlet concentration per emotion for mock readings (mostly neutral/happy)
+    MOCK_CONCENTRATION = (0.4, 0.2, 0.3, 2.0, 0.6, 0.4, 3.0)
+
     def __init__(
         self,
         camera_index: int = 0,
@@ -74,9 +115,52 @@ class EmotionDetector(BaseSensor):
         self.confidence_threshold = confidence_threshold
         self.cap: Optional[cv2.VideoCapture] = None
 
-        # Emotion history for smoothing
-        self.emotion_history: List[Dict[str, float]] = []
+        # Emotion history for smoothing (ring buffer, one row per sample)
         self.history_size = 10
+        self._hist = np.zeros((self.history_size, len(self.EMOTIONS)), dtype=np.float32)
+        self._hist_idx = 0
+        self._hist_count = 0
+        self._hist_lock = threading.Lock()
+
+        # Frames larger than this are downscaled before inference
+        width, height = self.config.get("analysis_size", (320, 240))
+        self.analysis_size = (int(width), int(height))
+
+        # CPU cores reserved for the inference worker (Linux only)
+        self.inference_cpus = self._default_inference_cpus()
+        if "inference_cpus" in self.config:
+            self.inference_cpus = set(self.config["inference_cpus"] or ())
+
+        # Background inference worker (latest frame in, latest result out)
+        self._frame_q: "queue.Queue[np.ndarray]" = queue.Queue(maxsize=1)
+        self._result_lock = threading.Lock()
+        self._latest_result: Optional[Dict[str, Any]] = None
+        self._result_ready = threading.Event()
+        self._infer_stop = threading.Event()
+        self._infer_thread: Optional[threading.Thread] = None
+
+        # The TFLite interpreter, the DeepFace model and the face box cache are
+        # not thread-safe; the worker and analyze_images() share them
+        self._infer_lock = threading.Lock()
+
+        # DeepFace emotion model, built once in initialize()
+        self._emotion_model: Optional[Any] = None
+
+        # Optional TFLite emotion model (loaded in initialize())
+        self.tflite_model_path: Optional[str] = self.config.get("tflite_model_path")
+        self._use_tflite = bool(self.tflite_model_path)
+        self._tflite: Optional[Any] = None
+        self._face_cascade: Optional[Any] = None
+
+        # Temporal face box cache: detect every N frames, classify crops between
+        self._detect_interval = max(1, int(self.config.get("detect_interval", 5)))
+        self._last_bbox: Optional[Dict[str, int]] = None
+        self._frames_since_detect = 0
+
+        # Rate limit: serve the previous result to callers polling faster than this
+        self.min_interval_s = float(self.config.get("min_interval_s", 0))
+        self._last_capture_t = 0.0
+        self._last_result: Optional[Dict[str, Any]] = None
 
         # Validate model name
         if model_name not in self.AVAILABLE_MODELS:
@@ -108,6 +192,15 @@ class EmotionDetector(BaseSensor):
             if not ret or frame is None:
                 raise SensorUnavailableError(f"Camera {self.camera_index} failed to capture frame")
 
+            self._configure_tf_threads()
+
+            if self._use_tflite and self._tflite is None:
+                self._load_tflite()
+            if self._emotion_model is None and not self._use_tflite:
+                self._emotion_model = self._build_emotion_model()
+
+            self._start_worker()
+
             logger.info(f"Emotion detector initialized with {self.model_name} model")
             return True
 
@@ -129,34 +222,49 @@ class EmotionDetector(BaseSensor):
         """
         if not self.is_active():
             return {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": iso_now(),
                 "sensor_type": self.sensor_type,
                 "available": False,
                 "error": "Sensor not active",
             }
 
+        now = time.monotonic()
+        if self._last_result is not None and now - self._last_capture_t < self.min_interval_s:
+            return dict(self._last_result)
+
         try:
             # Capture frame
             ret, frame = self.cap.read()
             if not ret or frame is None:
                 return {
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": iso_now(),
                     "sensor_type": self.sensor_type,
                     "available": False,
                     "error": "Failed to capture frame",
                 }
 
-            # Analyze emotions
-            result = self._analyze_frame(frame)
-            result["timestamp"] = datetime.now().isoformat()
+            # Hand the frame to the inference worker, replacing a stale one
+            self._submit_frame(frame)
+
+            # Return the most recent analysis (wait once for the first one)
+            if not self._result_ready.is_set():
+                self._result_ready.wait(self.FIRST_RESULT_TIMEOUT)
+            with self._result_lock:
+                latest = self._latest_result
+            result = dict(latest) if latest is not None else self._no_face_result()
+            result["timestamp"] = iso_now()
             result["sensor_type"] = self.sensor_type
 
+            if self.min_interval_s > 0:
+                self._last_capture_t = now
+                self._last_result = dict(result)
+
             return result
 
         except Exception as e:
             logger.error(f"Error during emotion capture: {e}")
             return {
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": iso_now(),
                 "sensor_type": self.sensor_type,
                 "available": False,
                 "error": str(e),
@@ -170,12 +278,17 @@ class EmotionDetector(BaseSensor):
             bool: True if cleanup successful
         """
         try:
+            self._stop_worker()
+
             if self.cap:
                 self.cap.release()
                 self.cap = None
 
-            # Clear emotion history
-            self.emotion_history.clear()
+            # Clear emotion history and the cached face box
+            self._hist_idx = 0
+            self._hist_count = 0
+            self._last_bbox = None
+            self._last_result = None
 
             logger.info("Emotion detector cleaned up successfully")
             return True
@@ -184,80 +297,425 @@ class EmotionDetector(BaseSensor):
             logger.error(f"Error during emotion detector cleanup: {e}")
             return False
 
-    def _analyze_frame(self, frame: np.ndarray) -> Dict[str, Any]:
+    def _build_emotion_model(self) -> Optional[Any]:
         """
-        Analyze a single frame for emotions.
+        Build DeepFace's emotion model ahead of the first frame.
+
+        DeepFace keeps built models in a module-level cache, so loading it here
+        moves the graph construction out of the first analyze() call and keeps
+        the weights resident for every later frame.
+
+        Returns:
+            The emotion model, or None if it could not be built
+        """
+        try:
+            try:
+                return DeepFace.build_model(task="facial_attribute", model_name="Emotion")
+            except TypeError:
+                # Older DeepFace releases take only the model name
+                return DeepFace.build_model("Emotion")
+        except Exception as e:
+            logger.warning(f"Could not preload emotion model: {e}")
+            return None
+
+    @staticmethod
+    def _allowed_cpus() -> set:
+        """Return the CPU ids this process may run on, or an empty set if unknown."""
+        try:
+            return set(os.sched_getaffinity(0))
+        except (AttributeError, OSError):
+            return set()
+
+    @classmethod
+    def _default_inference_cpus(cls) -> set:
+        """Return the last two allowed cores when at least four are allowed, else none."""
+        allowed = sorted(cls._allowed_cpus())
+        if not hasattr(os, "sched_setaffinity") or len(allowed) < 4:
+            return set()
+        return set(allowed[-2:])
+
+    def _configure_tf_threads(self) -> None:
+        """
+        Size TensorFlow's thread pools to the cores reserved for inference.
+
+        The intra-op pool matches the reserved cores only when the worker can
+        actually be pinned to them; otherwise it uses all but one allowed core.
+        Only applies when DeepFace has already imported TensorFlow, and only
+        before its runtime starts; later calls are ignored by TensorFlow.
+        """
+        tf = sys.modules.get("tensorflow")
+        if tf is None:
+            return
+
+        allowed = self._allowed_cpus()
+        if self.inference_cpus and self.inference_cpus <= allowed:
+            intra_threads = len(self.inference_cpus)
+        else:
+            intra_threads = max(1, (len(allowed) or os.cpu_count() or 2) - 1)
+        try:
+            tf.config.threading.set_inter_op_parallelism_threads(1)
+            tf.config.threading.set_intra_op_parallelism_threads(intra_threads)
+        except (RuntimeError, AttributeError) as e:
+            logger.debug(f"TensorFlow threading already configured: {e}")
+
+    def _load_tflite(self) -> None:
+        """Load the TFLite emotion model and face cascade, or disable the TFLite path."""
+        try:
+            interpreter_cls = TFLiteInterpreter
+            if interpreter_cls is None:
+                import tensorflow as tf
+
+                interpreter_cls = tf.lite.Interpreter
+
+            interpreter = interpreter_cls(model_path=self.tflite_model_path)
+            interpreter.allocate_tensors()
+
+            cascade_path = cv2.data.haarcascades + "haarcascade_frontalface_default.xml"
+            cascade = cv2.CascadeClassifier(cascade_path)
+            if cascade.empty():
+                raise RuntimeError(f"Failed to load face cascade: {cascade_path}")
+
+            self._tflite = interpreter
+            self._face_cascade = cascade
+            logger.info(f"Loaded TFLite emotion model: {self.tflite_model_path}")
+        except Exception as e:
+            logger.warning(f"TFLite emotion model unavailable, using DeepFace: {e}")
+            self._use_tflite = False
+
+    def _detect_face(self, frame: np.ndarray) -> Optional[Dict[str, int]]:
+        """
+        Find the largest face with the Haar cascade DeepFace's opencv backend uses.
 
         Args:
             frame: OpenCV frame (BGR format)
 
         Returns:
-            Dict with emotion analysis results
+            Face region dict with x, y, w, h, or None if no face was found
         """
-        try:
-            # DeepFace expects RGB, OpenCV uses BGR
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-
-            # Analyze emotions
-            result = DeepFace.analyze(
-                img_path=rgb_frame,
-                actions=["emotion"],
-                enforce_detection=False,
-                detector_backend="opencv",
-                silent=True,
-            )
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        faces = self._face_cascade.detectMultiScale(gray, scaleFactor=1.1, minNeighbors=10)
+        if len(faces) == 0:
+            return None
 
-            # Handle both single face and multiple faces
-            if isinstance(result, list):
-                if len(result) == 0:
-                    return self._no_face_result()
-                # Use first detected face
-                result = result[0]
+        x, y, w, h = max(faces, key=lambda f: f[2] * f[3])
+        return {"x": int(x), "y": int(y), "w": int(w), "h": int(h)}
 
-            # Extract emotion data
-            emotions = result.get("emotion", {})
-            region = result.get("region", {})
+    def _infer_tflite(self, face_crop: np.ndarray) -> np.ndarray:
+        """
+        Classify a face crop with the TFLite emotion model.
 
-            # Find dominant emotion
-            dominant_emotion = max(emotions.items(), key=lambda x: x[1])
+        Args:
+            face_crop: BGR face image
 
-            # Calculate overall confidence
-            confidence = dominant_emotion[1] / 100.0  # Convert percentage to 0-1
+        Returns:
+            float32 probabilities in EMOTIONS order
+        """
+        input_detail = self._tflite.get_input_details()[0]
+        output_detail = self._tflite.get_output_details()[0]
+        height, width = input_detail["shape"][1:3]
+
+        gray = cv2.cvtColor(face_crop, cv2.COLOR_BGR2GRAY)
+        gray = cv2.resize(gray, (int(width), int(height)), interpolation=cv2.INTER_AREA)
+        tensor = (gray.astype(np.float32) / 255.0).reshape(input_detail["shape"])
+
+        # Fully integer models take quantized input
+        if input_detail["dtype"] != np.float32:
+            scale, zero_point = input_detail["quantization"]
+            tensor = np.round(tensor / scale + zero_point)
+        self._tflite.set_tensor(input_detail["index"], tensor.astype(input_detail["dtype"]))
+        self._tflite.invoke()
+
+        scores = self._tflite.get_tensor(output_detail["index"])[0].astype(np.float32)
+        if output_detail["dtype"] != np.float32:
+            scale, zero_point = output_detail["quantization"]
+            scores = (scores - zero_point) * scale
+
+        return scores / (float(scores.sum()) or 1.0)
+
+    def _start_worker(self) -> None:
+        """Start the background inference thread."""
+        self._infer_stop.clear()
+        self._result_ready.clear()
+        self._latest_result = None
+        self._infer_thread = threading.Thread(
+            target=self._infer_loop, daemon=True, name="EmotionInference"
+        )
+        self._infer_thread.start()
+
+    def _stop_worker(self) -> None:
+        """Stop the background inference thread and drop pending frames."""
+        self._infer_stop.set()
+        if self._infer_thread is not None and self._infer_thread.is_alive():
+            self._infer_thread.join(timeout=5.0)
+        self._infer_thread = None
+        try:
+            self._frame_q.get_nowait()
+        except queue.Empty:
+            pass
 
-            # Add to history for smoothing
-            self._update_history(emotions)
+    def _submit_frame(self, frame: np.ndarray) -> None:
+        """Queue a frame for inference, discarding any frame not yet picked up."""
+        try:
+            self._frame_q.put_nowait(frame)
+        except queue.Full:
+            try:
+                self._frame_q.get_nowait()
+            except queue.Empty:
+                pass
+            self._frame_q.put_nowait(frame)
+
+    def _infer_loop(self) -> None:
+        """Analyze queued frames and publish the latest result (worker thread)."""
+        if self.inference_cpus:
+            try:
+                # pid 0 is the calling thread on Linux
+                os.sched_setaffinity(0, self.inference_cpus)
+            except (AttributeError, OSError, ValueError) as e:
+                logger.warning(f"Could not pin emotion inference thread: {e}")
+
+        while not self._infer_stop.is_set():
+            try:
+                frame = self._frame_q.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            result = self._analyze_frame(frame, track=True)
+            with self._result_lock:
+                self._latest_result = result
+            self._result_ready.set()
+
+    def _analyze_frame(self, frame: np.ndarray, track: bool = False) -> Dict[str, Any]:
+        """
+        Analyze a single frame for emotions.
 
-            # Get smoothed emotions
-            smoothed_emotions = self._get_smoothed_emotions()
-            smoothed_dominant = max(smoothed_emotions.items(), key=lambda x: x[1])
+        Args:
+            frame: OpenCV frame (BGR format)
+            track: Reuse and update the cached face box (consecutive camera
+                frames only)
 
-            return {
-                "available": True,
-                "face_detected": True,
-                "dominant_emotion": dominant_emotion[0],
-                "dominant_confidence": round(confidence, 3),
-                "emotions": {k: round(v / 100.0, 3) for k, v in emotions.items()},
-                "smoothed_dominant_emotion": smoothed_dominant[0],
-                "smoothed_emotions": smoothed_emotions,
-                "face_coordinates": {
-                    "x": region.get("x", 0),
-                    "y": region.get("y", 0),
-                    "w": region.get("w", 0),
-                    "h": region.get("h", 0),
+        Returns:
+            Dict with emotion analysis results
+        """
+        try:
+            # Downscale once; DeepFace resizes to the model input anyway
+            orig_h, orig_w = frame.shape[:2]
+            target_w, target_h = self.analysis_size
+            scale_x = scale_y = 1.0
+            if orig_w > target_w or orig_h > target_h:
+                frame = cv2.resize(frame, (target_w, target_h), interpolation=cv2.INTER_AREA)
+                scale_x = orig_w / target_w
+                scale_y = orig_h / target_h
+
+            with self._infer_lock:
+                inferred = self._infer_emotions(frame, track)
+                # A confidence drop may mean the face moved; re-detect next frame
+                if (
+                    track
+                    and inferred is not None
+                    and float(inferred[0].max()) < self.confidence_threshold
+                ):
+                    self._last_bbox = None
+            if inferred is None:
+                return self._no_face_result()
+            probs, region = inferred
+
+            return self._face_result(
+                probs,
+                {
+                    "x": int(round(region.get("x", 0) * scale_x)),
+                    "y": int(round(region.get("y", 0) * scale_y)),
+                    "w": int(round(region.get("w", 0) * scale_x)),
+                    "h": int(round(region.get("h", 0) * scale_y)),
                 },
-                "model_used": self.model_name,
-                "meets_threshold": confidence >= self.confidence_threshold,
-            }
+            )
 
         except ValueError as e:
             # No face detected
-            logger.debug(f"No face detected: {e}")
+            logger.debug("No face detected: %s", e)
             return self._no_face_result()
 
         except Exception as e:
             logger.error(f"Error analyzing frame: {e}")
             return {"available": False, "error": str(e)}
 
+    def _infer_emotions(
+        self, frame: np.ndarray, track: bool = False
+    ) -> Optional[Tuple[np.ndarray, Dict[str, int]]]:
+        """
+        Run face detection and emotion classification on a frame.
+
+        Args:
+            frame: OpenCV frame (BGR format)
+            track: Reuse the cached face box between detections
+
+        Returns:
+            Tuple of (float32 probabilities in EMOTIONS order, face region),
+            or None if no face was found
+        """
+        if track and self._last_bbox is not None:
+            if self._frames_since_detect < self._detect_interval:
+                probs = self._classify_face(self._crop(frame, self._last_bbox))
+                if probs is not None:
+                    self._frames_since_detect += 1
+                    return probs, self._last_bbox
+
+        region: Optional[Dict[str, int]] = None
+        probs = None
+        if self._use_tflite and self._tflite is not None:
+            try:
+                region = self._detect_face(frame)
+                if region is None:
+                    if track:
+                        self._last_bbox = None
+                    return None
+                probs = self._infer_tflite(self._crop(frame, region))
+            except Exception as e:
+                logger.warning(f"TFLite emotion inference failed, using DeepFace: {e}")
+
+        if probs is None:
+            inferred = self._analyze_deepface(frame)
+            if inferred is None:
+                if track:
+                    self._last_bbox = None
+                return None
+            probs, region = inferred
+
+        if track:
+            # enforce_detection=False reports the whole frame when no face is found
+            frame_h, frame_w = frame.shape[:2]
+            found = region.get("w", 0) < frame_w or region.get("h", 0) < frame_h
+            self._last_bbox = dict(region) if found and region.get("w") else None
+            self._frames_since_detect = 1
+
+        return probs, region
+
+    @staticmethod
+    def _crop(frame: np.ndarray, region: Dict[str, int]) -> np.ndarray:
+        """Return the face region of a frame as a view."""
+        x, y = max(0, region["x"]), max(0, region["y"])
+        return frame[y : y + region["h"], x : x + region["w"]]
+
+    def _classify_face(self, face_crop: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Classify an already located face without running detection.
+
+        Args:
+            face_crop: BGR face image
+
+        Returns:
+            float32 probabilities in EMOTIONS order, or None if no standalone
+            classifier is loaded or classification failed
+        """
+        if face_crop.size == 0:
+            return None
+
+        try:
+            if self._use_tflite and self._tflite is not None:
+                return self._infer_tflite(face_crop)
+
+            if self._emotion_model is not None:
+                # Same preprocessing DeepFace applies: 48x48 gray in [0, 1]
+                model = getattr(self._emotion_model, "model", self._emotion_model)
+                gray = cv2.cvtColor(face_crop, cv2.COLOR_BGR2GRAY)
+                gray = cv2.resize(gray, (48, 48), interpolation=cv2.INTER_AREA)
+                tensor = (gray.astype(np.float32) / 255.0).reshape(1, 48, 48, 1)
+                scores = np.asarray(model.predict(tensor, verbose=0)[0], dtype=np.float32)
+                if scores.shape != (len(self.EMOTIONS),):
+                    return None
+                return scores / (float(scores.sum()) or 1.0)
+        except Exception as e:
+            logger.debug("Face crop classification failed, re-detecting: %s", e)
+
+        return None
+
+    def _analyze_deepface(self, frame: np.ndarray) -> Optional[Tuple[np.ndarray, Dict[str, int]]]:
+        """
+        Run DeepFace's combined detection and emotion analysis.
+
+        Args:
+            frame: OpenCV frame (BGR format)
+
+        Returns:
+            Tuple of (float32 probabilities in EMOTIONS order, face region),
+            or None if no face was found
+        """
+        # DeepFace treats ndarray input as BGR, like OpenCV
+        result = DeepFace.analyze(
+            img_path=frame,
+            actions=["emotion"],
+            enforce_detection=False,
+            detector_backend="opencv",
+            silent=True,
+        )
+
+        # Handle both single face and multiple faces
+        if isinstance(result, list):
+            if len(result) == 0:
+                return None
+            # Use first detected face
+            result = result[0]
+
+        emotions = result.get("emotion")
+        if not emotions:
+            return None
+
+        # DeepFace reports percentages keyed by name
+        probs = np.array([emotions.get(e, 0.0) for e in self.EMOTIONS], dtype=np.float32)
+        return probs * np.float32(0.01), result.get("region", {})
+
+    def _face_result(self, probs: np.ndarray, face_coordinates: Dict[str, int]) -> Dict[str, Any]:
+        """
+        Record probabilities in the history and build the result for a detected face.
+
+        Args:
+            probs: float32 probabilities in EMOTIONS order
+            face_coordinates: Face box in original frame units
+
+        Returns:
+            Dict with emotion analysis results
+        """
+        dominant_idx = int(probs.argmax())
+        confidence = float(probs[dominant_idx])
+
+        # Add to history and smooth (frames may arrive from several threads)
+        with self._hist_lock:
+            self._update_history(probs)
+            smoothed = self._get_smoothed_vec()
+
+        return {
+            "available": True,
+            "face_detected": True,
+            "dominant_emotion": self.EMOTIONS[dominant_idx],
+            "dominant_confidence": round(confidence, 3),
+            "emotions": self._vec_to_dict(probs),
+            "smoothed_dominant_emotion": self.EMOTIONS[int(smoothed.argmax())],
+            "smoothed_emotions": self._vec_to_dict(smoothed),
+            "face_coordinates": face_coordinates,
+            "model_used": self.model_name,
+            "meets_threshold": confidence >= self.confidence_threshold,
+        }
+
+    def capture_mock_data(self) -> Dict[str, Any]:
+        """
+        Generate realistic mock emotion data.
+
+        Draws emotion probabilities that lean towards neutral and happy, and
+        feeds them through the same history smoothing as real frames.
+
+        Returns:
+            Dict with same structure as capture()
+        """
+        probs = np.random.dirichlet(self.MOCK_CONCENTRATION).astype(np.float32)
+        width, height = self.analysis_size
+        size = min(width, height) // 2
+        result = self._face_result(
+            probs,
+            {"x": (width - size) // 2, "y": (height - size) // 2, "w": size, "h": size},
+        )
+        result["timestamp"] = iso_now()
+        result["sensor_type"] = self.sensor_type
+        return result
+
     def _no_face_result(self) -> Dict[str, Any]:
         """Return result structure when no face is detected."""
         return {
@@ -273,21 +731,35 @@ class EmotionDetector(BaseSensor):
             "meets_threshold": False,
         }
 
-    def _update_history(self, emotions: Dict[str, float]) -> None:
+    def _vec_to_dict(self, vec: np.ndarray) -> Dict[str, float]:
+        """Convert a probability vector to the {emotion: score} form used in results."""
+        return dict(zip(self.EMOTIONS, np.round(vec.astype(np.float64), 3).tolist()))
+
+    def _update_history(self, probs: np.ndarray) -> None:
         """
         Update emotion history for smoothing.
 
         Args:
-            emotions: Current emotion scores
+            probs: Current probabilities (0-1) in EMOTIONS order
         """
-        # Normalize emotions to 0-1 range
-        normalized = {k: v / 100.0 for k, v in emotions.items()}
+        # Overwrite the oldest sample
+        self._hist[self._hist_idx] = probs
 
-        self.emotion_history.append(normalized)
+        self._hist_idx = (self._hist_idx + 1) % self.history_size
+        self._hist_count = min(self._hist_count + 1, self.history_size)
 
-        # Keep only recent history
-        if len(self.emotion_history) > self.history_size:
-            self.emotion_history.pop(0)
+    def _get_smoothed_vec(self) -> np.ndarray:
+        """
+        Calculate smoothed emotion probabilities from history.
+
+        Returns:
+            float32 mean probabilities in EMOTIONS order (zeros without history)
+        """
+        if self._hist_count == 0:
+            return np.zeros(len(self.EMOTIONS), dtype=np.float32)
+
+        # Average every emotion column at once
+        return self._hist[: self._hist_count].mean(axis=0)
 
     def _get_smoothed_emotions(self) -> Dict[str, float]:
         """
@@ -296,16 +768,7 @@ class EmotionDetector(BaseSensor):
         Returns:
             Dict of smoothed emotion scores
         """
-        if not self.emotion_history:
-            return {emotion: 0.0 for emotion in self.EMOTIONS}
-
-        # Calculate average for each emotion
-        smoothed = {}
-        for emotion in self.EMOTIONS:
-            scores = [h.get(emotion, 0.0) for h in self.emotion_history]
-            smoothed[emotion] = round(np.mean(scores), 3)
-
-        return smoothed
+        return self._vec_to_dict(self._get_smoothed_vec())
 
     def analyze_image(self, image_path: str) -> Dict[str, Any]:
         """
@@ -318,12 +781,12 @@ class EmotionDetector(BaseSensor):
             Dict with emotion analysis results
         """
         try:
-            frame = cv2.imread(image_path)
+            frame = self._read_image(image_path)
             if frame is None:
                 return {"available": False, "error": f"Failed to load image: {image_path}"}
 
             result = self._analyze_frame(frame)
-            result["timestamp"] = datetime.now().isoformat()
+            result["timestamp"] = iso_now()
             result["sensor_type"] = self.sensor_type
             result["source"] = image_path
 
@@ -333,6 +796,44 @@ class EmotionDetector(BaseSensor):
             logger.error(f"Error analyzing image: {e}")
             return {"available": False, "error": str(e)}
 
+    def analyze_images(self, image_paths: List[str], workers: int = 4) -> List[Dict[str, Any]]:
+        """
+        Analyze emotions from several image files concurrently.
+
+        File reads and JPEG decoding release the GIL, so a thread pool overlaps
+        them with inference on another image. Inference itself runs one frame
+        at a time (shared with the live worker), since the models are not
+        thread-safe.
+
+        Args:
+            image_paths: Paths to image files
+            workers: Number of worker threads
+
+        Returns:
+            List of analysis results in the same order as image_paths
+        """
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            return list(executor.map(self.analyze_image, image_paths))
+
+    @staticmethod
+    def _read_image(image_path: str) -> Optional[np.ndarray]:
+        """
+        Read and decode an image file in one pass.
+
+        Args:
+            image_path: Path to image file
+
+        Returns:
+            BGR image array, or None if the file is missing or not an image
+        """
+        try:
+            data = np.fromfile(image_path, dtype=np.uint8)
+        except OSError:
+            return None
+        if data.size == 0:
+            return None
+        return cv2.imdecode(data, cv2.IMREAD_COLOR)
+
     def get_emotion_distribution(self) -> Dict[str, Any]:
         """
         Get emotion distribution from recent history.
@@ -340,7 +841,7 @@ class EmotionDetector(BaseSensor):
         Returns:
             Dict with emotion statistics
         """
-        if not self.emotion_history:
+        if self._hist_count == 0:
             return {
                 "samples": 0,
                 "distribution": {emotion: 0.0 for emotion in self.EMOTIONS},
@@ -354,7 +855,7 @@ class EmotionDetector(BaseSensor):
         most_frequent = max(distribution.items(), key=lambda x: x[1])
 
         return {
-            "samples": len(self.emotion_history),
+            "samples": self._hist_count,
             "distribution": distribution,
             "most_frequent": most_frequent[0],
             "most_frequent_score": most_frequent[1],
@@ -4,15 +4,28 @@ Microphone Sensor Module
 Handles audio capture and sound level analysis.
 """
 
+import math
+import queue
+import threading
 import sounddevice as sd
 import numpy as np
 from typing import Optional, Dict, List
 import time
+from functools import lru_cache
+
+from .microphone_sensor import _classify, _classify_array
+
+# Linear map of the -60..0 dB range onto 0-100
+_DB_NORM_SCALE = 100.0 / 60.0
+_DB_NORM_OFFSET = 60.0 * _DB_NORM_SCALE
 
 
 class MicrophoneSensor:
     """Microphone sensor for sound level monitoring."""
 
+    # Seconds an availability check stays valid
+    AVAILABILITY_TTL = 30.0
+
     def __init__(self, device_index: Optional[int] = None, sample_rate: int = 44100):
         """
         Initialize microphone sensor.
@@ -24,27 +37,48 @@ class MicrophoneSensor:
         self.device_index = device_index
         self.sample_rate = sample_rate
         self.duration = 1.0  # Duration of each sample in seconds
+        self._avail_cache = (None, False)  # (monotonic timestamp, result)
+        self._hw_ok: Optional[bool] = None  # Availability confirmed for the hot path
 
     def is_available(self) -> bool:
         """
         Check if microphone is available.
 
+        Device enumeration is slow, so the result is cached for
+        AVAILABILITY_TTL seconds.
+
         Returns:
             True if microphone can be accessed, False otherwise
         """
+        now = time.monotonic()
+        ts, available = self._avail_cache
+        if ts is not None and now - ts < self.AVAILABILITY_TTL:
+            return available
+
         try:
             devices = sd.query_devices()
             if self.device_index is not None:
                 device = sd.query_devices(self.device_index)
-                return device["max_input_channels"] > 0
+                available = device["max_input_channels"] > 0
             else:
-                # Check for any input device
-                input_devices = [
-                    d for d in devices if isinstance(d, dict) and d.get("max_input_channels", 0) > 0
-                ]
-                return len(input_devices) > 0
-        except:
-            return False
+                # Check for any input device (stops at the first match)
+                available = any(d.get("max_input_channels", 0) > 0 for d in devices)
+        except Exception:
+            available = False
+
+        self._avail_cache = (now, available)
+        return available
+
+    def refresh_availability(self) -> bool:
+        """
+        Re-probe the microphone, e.g. after a device was plugged in or removed.
+
+        Returns:
+            True if microphone can be accessed, False otherwise
+        """
+        self._avail_cache = (None, False)
+        self._hw_ok = self.is_available()
+        return self._hw_ok
 
     def get_device_info(self) -> Optional[Dict]:
         """
@@ -58,7 +92,7 @@ class MicrophoneSensor:
                 return sd.query_devices(self.device_index)
             else:
                 return sd.query_devices(kind="input")
-        except:
+        except Exception:
             return None
 
     def record_sample(self, duration: Optional[float] = None) -> Optional[np.ndarray]:
@@ -98,17 +132,21 @@ class MicrophoneSensor:
         Returns:
             Average dB level
         """
-        # Calculate RMS (Root Mean Square)
-        rms = np.sqrt(np.mean(audio_data**2))
+        # Calculate RMS (Root Mean Square); dot fuses square-and-sum with no temporary
+        x = np.ascontiguousarray(audio_data, dtype=np.float32).ravel()
+        rms = math.sqrt(float(np.dot(x, x)) / x.size) if x.size else 0.0
 
         # Convert to dB (relative to max amplitude of 1.0)
         # Add small epsilon to avoid log(0)
-        epsilon = 1e-10
-        db = 20 * np.log10(rms + epsilon)
+        db = 20.0 * math.log10(rms + 1e-10)
 
         # Normalize to a more intuitive range (0-100)
-        # Assuming -60 dB to 0 dB range
-        db_normalized = max(0, min(100, (db + 60) * 100 / 60))
+        # Assuming -60 dB to 0 dB range: (db + 60) * 100/60 folded into one FMA
+        db_normalized = db * _DB_NORM_SCALE + _DB_NORM_OFFSET
+        if db_normalized < 0:
+            db_normalized = 0.0
+        elif db_normalized > 100:
+            db_normalized = 100.0
 
         return round(db_normalized, 2)
 
@@ -125,28 +163,23 @@ class MicrophoneSensor:
             - available: whether measurement was successful
             - error: error message if any
         """
-        if not self.is_available():
-            return {"avg_db": 0.0, "available": False, "error": "Microphone not available"}
+        # Probe once; afterwards a failed recording is the signal to re-check
+        if not self._hw_ok:
+            self._hw_ok = self.is_available()
+            if not self._hw_ok:
+                return {"avg_db": 0.0, "available": False, "error": "Microphone not available"}
 
         audio_data = self.record_sample(duration)
 
         if audio_data is None:
+            self._hw_ok = None
             return {"avg_db": 0.0, "available": False, "error": "Failed to record audio"}
 
         try:
             db_level = self.calculate_db_level(audio_data)
 
             # Classify noise level
-            if db_level < 30:
-                classification = "Quiet"
-            elif db_level < 50:
-                classification = "Normal"
-            elif db_level < 70:
-                classification = "Moderate"
-            elif db_level < 85:
-                classification = "Noisy"
-            else:
-                classification = "Very Noisy"
+            classification = _classify(db_level)
 
             return {"avg_db": db_level, "classification": classification, "available": True}
         except Exception as e:
@@ -164,16 +197,143 @@ class MicrophoneSensor:
 
         Returns:
             List of sound level measurements
+
+        Audio is streamed: the stream callback queues one block per interval
+        and a worker thread analyzes it while the next block is recorded, so
+        each measurement costs only its recording time. Falls back to one
+        long recording split into intervals if the stream cannot be started.
+        Intervals whose block never arrived are reported as unavailable.
         """
-        measurements = []
+        n_blocks = max(1, math.ceil(duration / interval))
+        blocks: queue.Queue = queue.Queue()
+        measurements: List[Dict[str, any]] = []
+        done = threading.Event()
+
+        def on_block(indata, frames, time_info, status):
+            # Audio thread: copy and hand off, nothing else
+            blocks.put((time.time(), indata.copy()))
+
+        def analyze():
+            try:
+                while len(measurements) < n_blocks:
+                    item = blocks.get()
+                    if item is None:
+                        break
+                    timestamp, block = item
+                    try:
+                        db_level = self.calculate_db_level(block)
+                    except Exception as e:
+                        print(f"Error analyzing audio block: {e}")
+                        measurements.append(
+                            {
+                                "avg_db": 0.0,
+                                "available": False,
+                                "error": str(e),
+                                "timestamp": timestamp,
+                            }
+                        )
+                        continue
+                    measurements.append(
+                        {
+                            "avg_db": db_level,
+                            "classification": _classify(db_level),
+                            "available": True,
+                            "timestamp": timestamp,
+                        }
+                    )
+            finally:
+                done.set()
+
+        stream = None
+        try:
+            stream = sd.InputStream(
+                samplerate=self.sample_rate,
+                channels=1,
+                device=self.device_index,
+                dtype="float32",
+                blocksize=int(interval * self.sample_rate),
+                callback=on_block,
+            )
+            stream.start()
+        except Exception as e:
+            print(f"Error opening audio stream: {e}")
+            if stream is not None:
+                stream.close()
+            return self._monitor_single_capture(duration, interval)
+
+        worker = threading.Thread(target=analyze, daemon=True)
+        worker.start()
+        try:
+            done.wait(timeout=n_blocks * interval + 2.0)
+        finally:
+            stream.close()  # Aborts the stream if still running
+            blocks.put(None)
+            worker.join(timeout=1.0)
+
+        results = measurements[:n_blocks]
+        missing = n_blocks - len(results)
+        if missing:
+            now = time.time()
+            results.extend(
+                {
+                    "avg_db": 0.0,
+                    "available": False,
+                    "error": "No audio received",
+                    "timestamp": now,
+                }
+                for _ in range(missing)
+            )
+        return results
+
+    def _monitor_single_capture(self, duration: float, interval: float) -> List[Dict[str, any]]:
+        """
+        Record the whole period in one capture and reduce it per interval with NumPy.
+
+        Used when a stream cannot be opened: one device open instead of one per
+        interval, and a single vectorized RMS over all windows.
+        """
+        n_windows = max(1, math.ceil(duration / interval))
+        window = int(interval * self.sample_rate)
         start_time = time.time()
 
-        while time.time() - start_time < duration:
-            measurement = self.get_sound_level(interval)
-            measurement["timestamp"] = time.time()
-            measurements.append(measurement)
+        try:
+            recording = sd.rec(
+                n_windows * window,
+                samplerate=self.sample_rate,
+                channels=1,
+                device=self.device_index,
+                dtype="float32",
+            )
+            sd.wait()
+        except Exception as e:
+            print(f"Error recording audio: {e}")
+            return [
+                {
+                    "avg_db": 0.0,
+                    "available": False,
+                    "error": "Failed to record audio",
+                    "timestamp": time.time(),
+                }
+            ]
+
+        # Per-window sum of squares in one pass, then the same dB curve as
+        # calculate_db_level
+        windows = recording[:, 0].reshape(n_windows, window)
+        sum_sq = np.einsum("ij,ij->i", windows, windows).astype(np.float64)
+        db = 20.0 * np.log10(np.sqrt(sum_sq / window) + 1e-10)
+        db_levels = np.clip(db * _DB_NORM_SCALE + _DB_NORM_OFFSET, 0.0, 100.0).round(2)
 
-        return measurements
+        return [
+            {
+                "avg_db": level,
+                "classification": classification,
+                "available": True,
+                "timestamp": start_time + (i + 1) * interval,
+            }
+            for i, (level, classification) in enumerate(
+                zip(db_levels.tolist(), _classify_array(db_levels))
+            )
+        ]
 
     def get_average_level(self, measurements: List[Dict[str, any]]) -> Dict[str, any]:
         """
@@ -186,24 +346,47 @@ class MicrophoneSensor:
             Dictionary with average statistics
         """
         if not measurements:
-            return {"avg_db": 0.0, "min_db": 0.0, "max_db": 0.0, "samples": 0}
-
-        db_values = [m.get("avg_db", 0) for m in measurements if m.get("available", False)]
+            return {
+                "avg_db": 0.0,
+                "min_db": 0.0,
+                "max_db": 0.0,
+                "samples": 0,
+                "classifications": [],
+            }
 
-        if not db_values:
-            return {"avg_db": 0.0, "min_db": 0.0, "max_db": 0.0, "samples": 0}
+        db_values = np.fromiter(
+            (m.get("avg_db", 0) for m in measurements if m.get("available", False)),
+            dtype=np.float32,
+            count=-1,
+        )
+
+        if db_values.size == 0:
+            return {
+                "avg_db": 0.0,
+                "min_db": 0.0,
+                "max_db": 0.0,
+                "samples": 0,
+                "classifications": [],
+            }
 
         return {
-            "avg_db": round(np.mean(db_values), 2),
-            "min_db": round(min(db_values), 2),
-            "max_db": round(max(db_values), 2),
-            "samples": len(db_values),
+            "avg_db": round(float(db_values.mean()), 2),
+            "min_db": round(float(db_values.min()), 2),
+            "max_db": round(float(db_values.max()), 2),
+            "samples": int(db_values.size),
+            "classifications": _classify_array(db_values),
         }
 
 
 # Convenience functions
 
 
+@lru_cache(maxsize=8)
+def _get_sensor(device_index: Optional[int] = None) -> MicrophoneSensor:
+    """Shared sensor per device, so its availability cache survives between calls."""
+    return MicrophoneSensor(device_index)
+
+
 def get_sound_reading(device_index: Optional[int] = None, duration: float = 1.0) -> Dict[str, any]:
     """
     Get a single sound level reading.
@@ -215,7 +398,7 @@ def get_sound_reading(device_index: Optional[int] = None, duration: float = 1.0)
     Returns:
         Sound level dictionary
     """
-    sensor = MicrophoneSensor(device_index)
+    sensor = _get_sensor(device_index)
     return sensor.get_sound_level(duration)
 
 
@@ -229,7 +412,7 @@ def check_microphone_available(device_index: Optional[int] = None) -> bool:
     Returns:
         True if microphone is available
     """
-    sensor = MicrophoneSensor(device_index)
+    sensor = _get_sensor(device_index)
     return sensor.is_available()
 
 
@@ -250,7 +433,7 @@ def list_audio_devices() -> List[Dict]:
                 "sample_rate": d["default_samplerate"],
             }
             for i, d in enumerate(devices)
-            if isinstance(d, dict) and d.get("max_input_channels", 0) > 0
+            if d.get("max_input_channels", 0) > 0
         ]
-    except:
+    except Exception:
         return []
@@ -7,17 +7,81 @@ noise classification. Supports both sounddevice (development) and ALSA
 without hardware.
 """
 
+import atexit
+import math
 import numpy as np
-from datetime import datetime
+from bisect import bisect
+from collections import OrderedDict
+from itertools import accumulate
 from typing import Dict, Any, Optional
 import logging
 import random
+import select
+import threading
+import time
+
+try:
+    import numba
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 # Import base sensor
-from .base import BaseSensor, SensorUnavailableError
+from .base import BaseSensor, SensorStatus, SensorUnavailableError, iso_now
 
 logger = logging.getLogger(__name__)
 
+# Scale factor mapping 16-bit PCM to [-1, 1)
+INT16_TO_FLOAT = np.float32(1.0 / 32768.0)
+
+# Noise classification: upper bounds (exclusive) of each band on the 0-100 scale
+_DB_BINS = np.array([30, 50, 70, 85], dtype=np.float32)
+_DB_LABELS = ("Quiet", "Normal", "Moderate", "Noisy", "Very Noisy")
+
+
+def _classify(db: float) -> str:
+    """Map a normalized dB level to its noise classification."""
+    return _DB_LABELS[int(np.searchsorted(_DB_BINS, db, side="right"))]
+
+
+def _classify_array(db_values) -> list:
+    """Vectorized :func:`_classify` for a batch of normalized dB levels."""
+    idx = np.searchsorted(_DB_BINS, np.asarray(db_values, dtype=np.float32), side="right")
+    return [_DB_LABELS[i] for i in idx.tolist()]
+
+
+if NUMBA_AVAILABLE:
+
+    @numba.njit(cache=True, fastmath=True)
+    def _rms_db_kernel(x, db_ref):
+        """
+        Compute RMS, raw dB and normalized 0-100 dB in one pass over x.
+
+        The sum of squares is a single loop LLVM vectorizes; x must be a
+        non-empty 1-D float32 array.
+        """
+        s = 0.0
+        for i in range(x.shape[0]):
+            s += x[i] * x[i]
+        rms = math.sqrt(s / x.shape[0])
+        raw_db = 20.0 * math.log10(rms + 1e-10)
+        norm = (raw_db - db_ref) * 100.0 / abs(db_ref)
+        if norm < 0.0:
+            norm = 0.0
+        elif norm > 100.0:
+            norm = 100.0
+        return rms, raw_db, norm
+
+    @numba.njit(cache=True)
+    def _sumsq_i16(x):
+        """Sum of squares of int16 PCM with an int64 accumulator (exact, no float pass)."""
+        s = np.int64(0)
+        for i in range(x.shape[0]):
+            v = np.int64(x[i])
+            s += v * v
+        return s
+
 
 class MicrophoneSensor(BaseSensor):
     """
@@ -27,6 +91,9 @@ class MicrophoneSensor(BaseSensor):
     - sounddevice - for development and general use
     - ALSA (pyalsaaudio) - for Raspberry Pi (lower overhead)
 
+    The sounddevice backend keeps one input stream open and writes it into a
+    ring buffer; capture() analyzes the most recent sample_duration seconds.
+
     Features:
     - RMS amplitude dB calculation
     - Noise classification (Quiet, Normal, Moderate, Noisy, Very Noisy)
@@ -41,8 +108,27 @@ class MicrophoneSensor(BaseSensor):
         - sample_duration (float): Sample duration in seconds (default: 1.0)
         - mock_mode (bool): Force mock mode (default: False)
         - db_reference (float): Reference dB level for normalization (default: -60.0)
+        - use_numba (bool): Compute RMS and dB with a fused Numba kernel when
+          numba is installed (default: False)
+        - period_ms (float): ALSA period length in milliseconds (default: 20)
     """
 
+    # Seconds a hardware availability probe stays valid
+    AVAILABILITY_TTL = 30.0
+
+    # Mock noise scenarios: (min dB, max dB, name)
+    MOCK_SCENARIOS = (
+        (0, 20, "Silent room/library"),
+        (20, 35, "Quiet office/bedroom"),
+        (35, 50, "Normal conversation/office"),
+        (50, 65, "Busy office/traffic"),
+        (65, 80, "Noisy street/restaurant"),
+        (80, 95, "Very noisy traffic/construction"),
+    )
+
+    # Cumulative scenario weights (favor normal office scenarios), built once
+    MOCK_CUM_WEIGHTS = tuple(accumulate([0.10, 0.25, 0.35, 0.20, 0.08, 0.02]))
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """Initialize microphone sensor."""
         super().__init__(name="Microphone Sensor", sensor_type="microphone", config=config)
@@ -53,11 +139,33 @@ class MicrophoneSensor(BaseSensor):
         self.sample_rate = self.config.get("sample_rate", 44100)
         self.sample_duration = self.config.get("sample_duration", 1.0)
         self.db_reference = self.config.get("db_reference", -60.0)
+        # Linear map of db_reference..0 dB onto 0-100: normalized = raw * scale + offset
+        self._db_scale = 100.0 / abs(self.db_reference)
+        self._db_offset = -self.db_reference * self._db_scale
+
+        # Short ALSA periods keep the blocking tail of each capture small
+        self.period_ms = self.config.get("period_ms", 20)
+        self._period_frames = max(1, int(self.sample_rate * self.period_ms / 1000))
+        self._poll_fds: list = []
+
+        # Fused Numba RMS/dB kernel instead of NumPy (requires numba)
+        self.use_numba = self.config.get("use_numba", False)
+        if self.use_numba and not NUMBA_AVAILABLE:
+            logger.warning("use_numba requested but numba is not installed; using NumPy")
 
         # Hardware objects
         self.stream = None
         self.alsa_device = None
 
+        # (monotonic timestamp, result) of the last hardware probe
+        self._avail_cache: tuple = (None, False)
+
+        # Ring buffer fed by the sounddevice stream callback
+        self._ring: Optional[np.ndarray] = None
+        self._ring_pos = 0
+        self._ring_filled = 0
+        self._ring_ready = threading.Event()
+
         logger.info(
             f"MicrophoneSensor initialized (backend={self.backend}, rate={self.sample_rate}Hz)"
         )
@@ -66,9 +174,23 @@ class MicrophoneSensor(BaseSensor):
         """
         Check if microphone hardware is available.
 
+        Device enumeration is slow, so the result is cached for
+        AVAILABILITY_TTL seconds; cleanup() invalidates it.
+
         Returns:
             bool: True if microphone can be accessed
         """
+        now = time.monotonic()
+        ts, available = self._avail_cache
+        if ts is not None and now - ts < self.AVAILABILITY_TTL:
+            return available
+
+        available = self._probe_hardware()
+        self._avail_cache = (now, available)
+        return available
+
+    def _probe_hardware(self) -> bool:
+        """Enumerate capture devices for the configured backend."""
         if self.backend == "alsa":
             try:
                 import alsaaudio
@@ -94,13 +216,8 @@ class MicrophoneSensor(BaseSensor):
                     device = sd.query_devices(self.device_index)
                     available = device.get("max_input_channels", 0) > 0
                 else:
-                    # Check for any input device
-                    input_devices = [
-                        d
-                        for d in devices
-                        if isinstance(d, dict) and d.get("max_input_channels", 0) > 0
-                    ]
-                    available = len(input_devices) > 0
+                    # Check for any input device (stops at the first match)
+                    available = any(d.get("max_input_channels", 0) > 0 for d in devices)
 
                 if available:
                     logger.info("Sounddevice microphone detected")
@@ -122,9 +239,17 @@ class MicrophoneSensor(BaseSensor):
             SensorUnavailableError: If hardware cannot be initialized
         """
         if self.backend == "alsa":
-            return self._initialize_alsa()
+            ready = self._initialize_alsa()
         else:
-            return self._initialize_sounddevice()
+            ready = self._initialize_sounddevice()
+
+        if ready and self.use_numba and NUMBA_AVAILABLE:
+            # Compile (or load from cache) before the first real capture
+            if self.backend == "alsa":
+                _sumsq_i16(np.zeros(16, dtype=np.int16))
+            else:
+                _rms_db_kernel(np.zeros(16, dtype=np.float32), float(self.db_reference))
+        return ready
 
     def _initialize_sounddevice(self) -> bool:
         """Initialize sounddevice backend."""
@@ -144,20 +269,29 @@ class MicrophoneSensor(BaseSensor):
                 if default_device.get("max_input_channels", 0) <= 0:
                     raise SensorUnavailableError("Default device has no input channels")
 
-            # Test recording
-            test_recording = sd.rec(
-                int(0.1 * self.sample_rate),  # 100ms test
+            # Fail early with PortAudio's reason if the device rejects these settings
+            sd.check_input_settings(
+                device=self.device_index, samplerate=self.sample_rate, channels=1, dtype="float32"
+            )
+
+            # Keep one stream open; the callback fills a ring buffer
+            window = int(self.sample_duration * self.sample_rate)
+            self._ring = np.zeros(max(4 * self.sample_rate, 2 * window), dtype=np.float32)
+            self._ring_pos = 0
+            self._ring_filled = 0
+            self._ring_ready.clear()
+
+            self.stream = sd.InputStream(
                 samplerate=self.sample_rate,
                 channels=1,
                 device=self.device_index,
                 dtype="float32",
+                blocksize=int(self.sample_rate * 0.05),  # 50ms blocks
+                callback=self._audio_callback,
             )
-            sd.wait()
-
-            if test_recording is None or len(test_recording) == 0:
-                raise SensorUnavailableError("Test recording failed")
+            self.stream.start()
 
-            logger.info("Sounddevice microphone initialized")
+            logger.info("Sounddevice microphone initialized (streaming)")
             return True
 
         except ImportError:
@@ -180,9 +314,21 @@ class MicrophoneSensor(BaseSensor):
             self.alsa_device.setchannels(1)
             self.alsa_device.setrate(self.sample_rate)
             self.alsa_device.setformat(alsaaudio.PCM_FORMAT_S16_LE)
-            self.alsa_device.setperiodsize(int(self.sample_rate * 0.1))  # 100ms periods
+            # Older pyalsaaudio returns the period size the driver accepted
+            accepted = self.alsa_device.setperiodsize(self._period_frames)
+            if isinstance(accepted, int) and accepted > 0:
+                self._period_frames = accepted
 
-            logger.info(f"ALSA microphone initialized (device={device_name})")
+            # Descriptors to wait on for "period ready" instead of polling read()
+            try:
+                self._poll_fds = list(self.alsa_device.polldescriptors())
+            except (AttributeError, OSError):
+                self._poll_fds = []
+
+            logger.info(
+                f"ALSA microphone initialized (device={device_name}, "
+                f"period={self._period_frames} frames)"
+            )
             return True
 
         except ImportError:
@@ -210,20 +356,21 @@ class MicrophoneSensor(BaseSensor):
         """
         from .base import SensorError
 
-        # Capture audio
+        # Capture and analyze audio; ALSA PCM is analyzed as int16 without a float copy
         if self.backend == "alsa":
-            audio_data = self._capture_alsa()
+            audio_data = self._capture_alsa_i16()
+            analyze = self._analyze_audio_i16
         else:
             audio_data = self._capture_sounddevice()
+            analyze = self._analyze_audio
 
         if audio_data is None or len(audio_data) == 0:
             raise SensorError("Failed to capture audio data")
 
-        # Analyze audio
-        rms, raw_db, normalized_db, classification = self._analyze_audio(audio_data)
+        rms, raw_db, normalized_db, classification = analyze(audio_data)
 
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_now(),
             "sensor_type": "microphone",
             "db_level": normalized_db,
             "raw_db": round(raw_db, 2),
@@ -233,8 +380,50 @@ class MicrophoneSensor(BaseSensor):
             "sample_duration": self.sample_duration,
         }
 
+    def _audio_callback(self, indata, frames, time_info, status) -> None:
+        """Copy a block from the input stream into the ring buffer (audio thread)."""
+        if status:
+            logger.debug("Audio stream status: %s", status)
+
+        ring = self._ring
+        size = ring.size
+        samples = indata[-size:, 0]
+        count = len(samples)
+
+        pos = self._ring_pos
+        end = pos + count
+        if end <= size:
+            ring[pos:end] = samples
+        else:
+            split = size - pos
+            ring[pos:] = samples[:split]
+            ring[: end - size] = samples[split:]
+
+        self._ring_pos = end % size
+        self._ring_filled = min(self._ring_filled + count, size)
+        if self._ring_filled >= int(self.sample_duration * self.sample_rate):
+            self._ring_ready.set()
+
+    def _read_ring(self) -> Optional[np.ndarray]:
+        """Return a copy of the latest sample_duration seconds from the ring buffer."""
+        window = int(self.sample_duration * self.sample_rate)
+
+        # Right after start, wait until the stream has delivered a full window
+        if not self._ring_ready.wait(self.sample_duration + 1.0):
+            logger.error("Audio stream delivered no data")
+            return None
+
+        ring, pos = self._ring, self._ring_pos
+        start = pos - window
+        if start >= 0:
+            return ring[start:pos].copy()
+        return np.concatenate((ring[start:], ring[:pos]))
+
     def _capture_sounddevice(self) -> Optional[np.ndarray]:
         """Capture audio using sounddevice."""
+        if self.stream is not None:
+            return self._read_ring()
+
         try:
             import sounddevice as sd
 
@@ -247,14 +436,26 @@ class MicrophoneSensor(BaseSensor):
             )
             sd.wait()
 
-            return recording.flatten()
+            # Mono column of a C-ordered (N, 1) array: contiguous view, no copy
+            return recording[:, 0]
 
         except Exception as e:
             logger.error(f"Sounddevice capture failed: {e}")
             return None
 
     def _capture_alsa(self) -> Optional[np.ndarray]:
-        """Capture audio using ALSA."""
+        """Capture audio using ALSA, normalized to float32 in [-1, 1]."""
+        buf = self._capture_alsa_i16()
+        if buf is None:
+            return None
+
+        # Convert to float32 and normalize to [-1, 1] in a single pass
+        audio = np.empty(buf.size, dtype=np.float32)
+        np.multiply(buf, INT16_TO_FLOAT, out=audio, casting="unsafe")
+        return audio
+
+    def _capture_alsa_i16(self) -> Optional[np.ndarray]:
+        """Capture raw 16-bit PCM samples using ALSA."""
         if self.alsa_device is None:
             logger.error("ALSA device not initialized")
             return None
@@ -262,28 +463,37 @@ class MicrophoneSensor(BaseSensor):
         try:
             # Calculate number of samples needed
             total_samples = int(self.sample_duration * self.sample_rate)
-            audio_data = []
-
-            # Read data in chunks with timeout protection
-            max_iterations = int(total_samples / 4410) + 100  # Allow ~100ms periods + margin
-            iteration = 0
-
-            while len(audio_data) < total_samples and iteration < max_iterations:
-                length, data = self.alsa_device.read()
-                if length > 0:
-                    # Convert bytes to numpy array (16-bit PCM)
-                    samples = np.frombuffer(data, dtype=np.int16)
-                    audio_data.extend(samples)
-                iteration += 1
-
-            if len(audio_data) < total_samples:
-                logger.warning(
-                    f"ALSA capture incomplete: {len(audio_data)}/{total_samples} samples"
-                )
-
-            # Convert to float32 and normalize to [-1, 1]
-            audio_array = np.array(audio_data[:total_samples], dtype=np.float32) / 32768.0
-            return audio_array
+            buf = np.empty(total_samples, dtype=np.int16)
+            raw = memoryview(buf).cast("B")  # Byte view of buf for raw PCM copies
+            total_bytes = raw.nbytes
+            collected = 0
+
+            # Sleep in poll() until a period is ready; a wall-clock deadline
+            # bounds the capture if the device stalls
+            poller = None
+            if self._poll_fds:
+                poller = select.poll()
+                for fd, events in self._poll_fds:
+                    poller.register(fd, events)
+            poll_timeout_ms = max(1, int(2 * self.period_ms))
+            deadline = time.monotonic() + 2 * self.sample_duration + poll_timeout_ms / 1000
+
+            while collected < total_bytes:
+                if poller is None or poller.poll(poll_timeout_ms):
+                    length, data = self.alsa_device.read()
+                    if length > 0:
+                        # memcpy the period's bytes into buf; no per-period ndarray
+                        n = min(len(data), total_bytes - collected)
+                        raw[collected : collected + n] = data[:n]
+                        collected += n
+                if time.monotonic() > deadline:
+                    break
+
+            offset = collected // 2
+            if offset < total_samples:
+                logger.warning(f"ALSA capture incomplete: {offset}/{total_samples} samples")
+
+            return buf[:offset]
 
         except Exception as e:
             logger.error(f"ALSA capture failed: {e}")
@@ -306,33 +516,29 @@ class MicrophoneSensor(BaseSensor):
             tuple: (rms, raw_db, normalized_db, classification)
         """
         try:
-            # Calculate RMS amplitude
-            rms = np.sqrt(np.mean(audio_data**2))
+            # Muted or warming-up devices deliver all-zero blocks; any() stops at
+            # the first non-zero sample, so real audio costs almost nothing here
+            if audio_data.size == 0 or not audio_data.any():
+                return self._silence()
 
-            # Convert to dB (add epsilon to avoid log(0))
-            epsilon = 1e-10
-            raw_db = 20 * np.log10(rms + epsilon)
+            x = np.ascontiguousarray(audio_data, dtype=np.float32).ravel()
 
-            # Normalize to 0-100 range
-            # Assuming typical range from db_reference (default -60) to 0 dB
-            normalized_db = max(
-                0, min(100, (raw_db - self.db_reference) * 100 / abs(self.db_reference))
-            )
+            if self.use_numba and NUMBA_AVAILABLE:
+                rms, raw_db, normalized_db = _rms_db_kernel(x, float(self.db_reference))
+            else:
+                # Calculate RMS amplitude; dot fuses square-and-sum with no temporary
+                rms = math.sqrt(float(np.dot(x, x)) / x.size)
+                raw_db, normalized_db = self._rms_to_db(rms)
 
             # Classify noise level
-            if normalized_db < 30:
-                classification = "Quiet"
-            elif normalized_db < 50:
-                classification = "Normal"
-            elif normalized_db < 70:
-                classification = "Moderate"
-            elif normalized_db < 85:
-                classification = "Noisy"
-            else:
-                classification = "Very Noisy"
+            classification = _classify(normalized_db)
 
             logger.debug(
-                f"Audio analysis: RMS={rms:.6f}, raw_dB={raw_db:.2f}, norm_dB={normalized_db:.2f}, class={classification}"
+                "Audio analysis: RMS=%.6f, raw_dB=%.2f, norm_dB=%.2f, class=%s",
+                rms,
+                raw_db,
+                normalized_db,
+                classification,
             )
             return (rms, raw_db, normalized_db, classification)
 
@@ -340,6 +546,57 @@ class MicrophoneSensor(BaseSensor):
             logger.error(f"Audio analysis failed: {e}")
             return (0.0, self.db_reference, 0.0, "Unknown")
 
+    def _analyze_audio_i16(self, samples: np.ndarray) -> tuple:
+        """
+        Analyze raw 16-bit PCM; same result as _analyze_audio on the scaled floats.
+
+        The sum of squares is accumulated exactly in int64 over the int16 data
+        (half the bytes of float32) and scaled to [-1, 1] units once at the end.
+
+        Args:
+            samples: 16-bit PCM samples
+
+        Returns:
+            tuple: (rms, raw_db, normalized_db, classification)
+        """
+        try:
+            n = samples.size
+            if not n or not samples.any():
+                return self._silence()
+
+            if self.use_numba and NUMBA_AVAILABLE:
+                sum_sq = int(_sumsq_i16(np.ascontiguousarray(samples).ravel()))
+            else:
+                # int16 squares fit in int32; the total needs int64
+                sum_sq = int(np.square(samples, dtype=np.int32).sum(dtype=np.int64))
+
+            rms = math.sqrt(sum_sq / n) / 32768.0
+            raw_db, normalized_db = self._rms_to_db(rms)
+            return (rms, raw_db, normalized_db, _classify(normalized_db))
+
+        except Exception as e:
+            logger.error(f"Audio analysis failed: {e}")
+            return (0.0, self.db_reference, 0.0, "Unknown")
+
+    def _silence(self) -> tuple:
+        """Analysis result for an empty or all-zero buffer."""
+        raw_db, normalized_db = self._rms_to_db(0.0)
+        return (0.0, raw_db, normalized_db, _classify(normalized_db))
+
+    def _rms_to_db(self, rms: float) -> tuple:
+        """Convert an RMS amplitude to (raw_db, normalized 0-100 dB)."""
+        # Convert to dB (add epsilon to avoid log(0)); math skips ufunc dispatch
+        raw_db = 20.0 * math.log10(rms + 1e-10)
+
+        # Normalize to 0-100 range
+        # Assuming typical range from db_reference (default -60) to 0 dB
+        normalized_db = raw_db * self._db_scale + self._db_offset
+        if normalized_db < 0:
+            normalized_db = 0.0
+        elif normalized_db > 100:
+            normalized_db = 100.0
+        return raw_db, normalized_db
+
     def capture_mock_data(self) -> Dict[str, Any]:
         """
         Generate realistic mock microphone data.
@@ -349,19 +606,10 @@ class MicrophoneSensor(BaseSensor):
         Returns:
             Dict with same structure as capture()
         """
-        # Generate realistic dB levels based on common scenarios
-        scenarios = [
-            (0, 20, "Silent room/library", "Quiet"),
-            (20, 35, "Quiet office/bedroom", "Quiet"),
-            (35, 50, "Normal conversation/office", "Normal"),
-            (50, 65, "Busy office/traffic", "Moderate"),
-            (65, 80, "Noisy street/restaurant", "Noisy"),
-            (80, 95, "Very noisy traffic/construction", "Very Noisy"),
-        ]
-
-        # Weighted random selection (favor normal office scenarios)
-        weights = [0.10, 0.25, 0.35, 0.20, 0.08, 0.02]
-        scenario = random.choices(scenarios, weights=weights)[0]
+        # Weighted random scenario via bisect on the precomputed cumulative weights
+        cum_weights = self.MOCK_CUM_WEIGHTS
+        index = bisect(cum_weights, random.random() * cum_weights[-1])
+        scenario = self.MOCK_SCENARIOS[min(index, len(cum_weights) - 1)]
 
         normalized_db = random.uniform(scenario[0], scenario[1])
 
@@ -370,17 +618,36 @@ class MicrophoneSensor(BaseSensor):
         rms = 10 ** (raw_db / 20.0)
 
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_now(),
             "sensor_type": "microphone",
             "db_level": round(normalized_db, 2),
             "raw_db": round(raw_db, 2),
             "rms_amplitude": round(rms, 6),
-            "noise_classification": scenario[3],
+            "noise_classification": _classify(normalized_db),
             "sample_rate": self.sample_rate,
             "sample_duration": self.sample_duration,
             "mock_scenario": scenario[2],
         }
 
+    def capture_mock_batch(self, k: int) -> tuple:
+        """
+        Generate k mock dB levels in one vectorized draw.
+
+        Uses the same scenario mix as capture_mock_data, for replaying long
+        simulated runs without a Python-level loop per sample.
+
+        Args:
+            k: Number of samples
+
+        Returns:
+            tuple: (normalized dB levels as a float32 array, noise classifications)
+        """
+        cdf = _MOCK_CDF
+        index = np.searchsorted(cdf, _MOCK_RNG.random(k) * cdf[-1], side="right")
+        index = np.minimum(index, len(cdf) - 1)
+        db_levels = _MOCK_RNG.uniform(_MOCK_LO[index], _MOCK_HI[index]).astype(np.float32)
+        return db_levels, _classify_array(db_levels)
+
     def cleanup(self) -> bool:
         """
         Clean up microphone resources.
@@ -397,7 +664,17 @@ class MicrophoneSensor(BaseSensor):
                 self.alsa_device = None
                 logger.info("ALSA device closed")
 
-            self.stream = None
+            if self.stream is not None:
+                try:
+                    self.stream.stop()
+                    self.stream.close()
+                except Exception as e:
+                    logger.warning(f"Error closing audio stream: {e}")
+                self.stream = None
+                logger.info("Audio stream closed")
+            self._ring = None
+            self._ring_ready.clear()
+            self._avail_cache = (None, False)
             return True
 
         except Exception as e:
@@ -405,8 +682,84 @@ class MicrophoneSensor(BaseSensor):
             return False
 
 
+# Scenario tables for capture_mock_batch, derived from the class constants
+_MOCK_LO = np.array([sc[0] for sc in MicrophoneSensor.MOCK_SCENARIOS], dtype=np.float32)
+_MOCK_HI = np.array([sc[1] for sc in MicrophoneSensor.MOCK_SCENARIOS], dtype=np.float32)
+_MOCK_CDF = np.array(MicrophoneSensor.MOCK_CUM_WEIGHTS)
+_MOCK_RNG = np.random.default_rng()
+
+
 # Convenience functions for backward compatibility
 
+# Started sensors reused by the convenience functions, keyed by configuration
+_SENSOR_CACHE_SIZE = 8
+_sensor_cache: "OrderedDict[tuple, MicrophoneSensor]" = OrderedDict()
+_sensor_cache_lock = threading.Lock()
+
+
+def _get_sensor(
+    device_index: Optional[int] = None, backend: str = "sounddevice", duration: float = 1.0
+) -> MicrophoneSensor:
+    """
+    Return a started sensor for this configuration, creating it on first use.
+
+    Reusing the sensor keeps the audio stream open between calls instead of
+    setting the device up and tearing it down for every reading. The least
+    recently used sensor is stopped once more than _SENSOR_CACHE_SIZE
+    configurations are cached. A cached sensor that is no longer active (a
+    failed start or read puts it in an error state) is replaced by a new one,
+    as is one that fell back to mock mode over AVAILABILITY_TTL seconds ago,
+    so a microphone plugged in later is picked up.
+    """
+    key = (device_index, backend, duration)
+    with _sensor_cache_lock:
+        sensor = _sensor_cache.get(key)
+        if sensor is not None:
+            if sensor.is_active() and not _mock_fallback_expired(sensor):
+                _sensor_cache.move_to_end(key)
+                return sensor
+            del _sensor_cache[key]
+            sensor.stop()
+
+        sensor = MicrophoneSensor(
+            config={"device_index": device_index, "backend": backend, "sample_duration": duration}
+        )
+        sensor.start()
+        _sensor_cache[key] = sensor
+
+        if len(_sensor_cache) > _SENSOR_CACHE_SIZE:
+            _, evicted = _sensor_cache.popitem(last=False)
+            evicted.stop()
+        return sensor
+
+
+def _mock_fallback_expired(sensor: MicrophoneSensor) -> bool:
+    """True if the sensor fell back to mock mode long enough ago to re-probe the hardware."""
+    if sensor.status != SensorStatus.MOCK_MODE or sensor.config.get("mock_mode"):
+        return False
+    started = sensor._start_monotonic
+    return started is None or time.monotonic() - started >= sensor.AVAILABILITY_TTL
+
+
+def _discard_sensor(sensor: MicrophoneSensor) -> None:
+    """Stop a cached sensor and drop it, so the next call starts a fresh one."""
+    with _sensor_cache_lock:
+        for key, cached in list(_sensor_cache.items()):
+            if cached is sensor:
+                del _sensor_cache[key]
+    sensor.stop()
+
+
+def _release_sensors() -> None:
+    """Stop and forget every cached sensor."""
+    with _sensor_cache_lock:
+        for sensor in _sensor_cache.values():
+            sensor.stop()
+        _sensor_cache.clear()
+
+
+atexit.register(_release_sensors)
+
 
 def get_microphone_reading(
     device_index: Optional[int] = None, backend: str = "sounddevice", duration: float = 1.0
@@ -422,19 +775,16 @@ def get_microphone_reading(
     Returns:
         Microphone reading dictionary
     """
-    sensor = MicrophoneSensor(
-        config={"device_index": device_index, "backend": backend, "sample_duration": duration}
-    )
-    sensor.start()
-
+    sensor = None
     try:
-        data = sensor.read()
-        sensor.stop()
-        return data
+        sensor = _get_sensor(device_index, backend, duration)
+        return sensor.read()
     except Exception as e:
-        sensor.stop()
+        if sensor is not None:
+            # Don't let one failed read leave a sensor stuck in error state cached
+            _discard_sensor(sensor)
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_now(),
             "sensor_type": "microphone",
             "db_level": 0.0,
             "noise_classification": "Unknown",
@@ -456,6 +806,7 @@ def check_microphone_available(
     Returns:
         True if microphone is available
     """
+    # Probe without starting, so the check doesn't open and hold an input stream
     sensor = MicrophoneSensor(config={"device_index": device_index, "backend": backend})
     return sensor.check_hardware_available()
 
@@ -479,7 +830,7 @@ def list_audio_devices() -> list:
                 "sample_rate": d["default_samplerate"],
             }
             for i, d in enumerate(devices)
-            if isinstance(d, dict) and d.get("max_input_channels", 0) > 0
+            if d.get("max_input_channels", 0) > 0
         ]
-    except:
+    except Exception:
         return []
@@ -14,9 +14,11 @@ Features:
 - Status aggregation
 """
 
+import asyncio
 import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from enum import Enum
@@ -24,6 +26,7 @@ from enum import Enum
 from .camera_sensor import CameraSensor
 from .microphone_sensor import MicrophoneSensor
 from .air_quality import AirQualitySensor
+from .base import SensorStatus, iso_now
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +47,13 @@ except ImportError:
     logger.warning("SimulationController not available")
 
 
+# Sensor states that count as healthy
+_ACTIVE_STATUSES = frozenset((SensorStatus.ACTIVE.value, SensorStatus.MOCK_MODE.value))
+
+# Sensor states that auto-recovery tries to restart
+_RECOVERABLE_STATUSES = frozenset((SensorStatus.ERROR.value, SensorStatus.UNAVAILABLE.value))
+
+
 class ManagerStatus(Enum):
     """Status of the sensor manager."""
 
@@ -54,6 +64,69 @@ class ManagerStatus(Enum):
     ERROR = "error"
 
 
+# Plain-string form of the state checked on every status build
+_STATUS_RUNNING = ManagerStatus.RUNNING.value
+
+
+class SensorSlot:
+    """
+    Per-sensor bookkeeping for SensorManager.
+
+    One record per sensor replaces parallel name-keyed dicts: the polling
+    path touches fixed attribute slots instead of hashing sensor names.
+    """
+
+    __slots__ = (
+        "name",
+        "sensor",
+        "error_count",
+        "retry_count",
+        "last_read_ns",
+        "status_cache",
+        "next_recover_ns",
+        "in_flight",
+        "lock",
+        "_last_read_iso",
+    )
+
+    def __init__(self, name: str, sensor):
+        self.name = name
+        self.sensor = sensor
+        self.error_count = 0
+        self.retry_count = 0
+        self.last_read_ns: Optional[int] = None  # time.monotonic_ns() of last good read
+        # (monotonic ns, dict) of the last sensor.get_status(); cleared on state changes
+        self.status_cache: Optional[tuple] = None
+        self.next_recover_ns = 0  # time.monotonic_ns() before which recovery waits
+        self.lock = threading.Lock()  # Serializes this sensor's reads
+        # (future, monotonic ns submitted) of the latest pooled read; a hung read
+        # keeps it pending, and the slot is not resubmitted until it finishes
+        self.in_flight: Optional[tuple] = None
+        self._last_read_iso: Optional[tuple] = None  # (stamp key, formatted string)
+
+    def last_read_iso(self, wall_offset_ns: int) -> Optional[str]:
+        """
+        Wall-clock ISO 8601 time of the last good read.
+
+        Formatted once per read and reused by every status call until the next.
+
+        Args:
+            wall_offset_ns: time.time_ns() - time.monotonic_ns() of the manager
+
+        Returns:
+            str: Local ISO 8601 timestamp, or None if never read
+        """
+        last_read = self.last_read_ns
+        if last_read is None:
+            return None
+        key = (last_read, wall_offset_ns)
+        cached = self._last_read_iso
+        if cached is None or cached[0] != key:
+            iso = datetime.fromtimestamp((last_read + wall_offset_ns) / 1e9).isoformat()
+            cached = self._last_read_iso = (key, iso)
+        return cached[1]
+
+
 class SensorManager:
     """
     Unified sensor management system.
@@ -68,6 +141,10 @@ class SensorManager:
         - auto_start (bool): Auto-start sensors on manager start (default: True)
         - auto_recover (bool): Auto-recover failed sensors (default: True)
         - max_retries (int): Max sensor restart attempts (default: 3)
+        - demand_driven (bool): Only poll sensors after read_all() consumed the
+          last snapshot (default: False)
+        - max_snapshot_age (float): Seconds before a demand-driven poll reads
+          anyway, so health tracking stays current (default: 30.0)
 
     Usage:
         manager = SensorManager(config={
@@ -80,10 +157,46 @@ class SensorManager:
         manager.stop_all()
     """
 
+    # Fixed attribute layout: no per-instance __dict__, and the polling path's
+    # attribute reads hit slot descriptors instead of a dict
+    __slots__ = (
+        "config",
+        "polling_interval",
+        "auto_start",
+        "auto_recover",
+        "max_retries",
+        "demand_driven",
+        "max_snapshot_age",
+        "camera",
+        "microphone",
+        "air_quality",
+        "_status",
+        "_status_value",
+        "running",
+        "_lock",
+        "_state_lock",
+        "_sim_lock",
+        "_status_cache",
+        "_last_snapshot",
+        "_snapshot_consumed",
+        "_read_pool",
+        "_polling_thread",
+        "_wakeup",
+        "_start_ns",
+        "_wall_offset_ns",
+        "_slots",
+        "_slot_map",
+        "simulation_controller",
+        "simulation_mode",
+        "_read_all",
+    )
+
     # Class constants
+    SENSOR_NAMES = ("camera", "microphone", "air_quality")
     THREAD_STOP_TIMEOUT = 5.0  # Seconds to wait for polling thread shutdown
     HEALTH_ERROR_PENALTY = 10  # Health score penalty per error
     HEALTH_ERROR_MAX_PENALTY = 30  # Maximum penalty from errors
+    RECOVERY_BACKOFF = 1.0  # Seconds before retrying a failed recovery; doubles per retry
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         """
@@ -99,6 +212,8 @@ class SensorManager:
         self.auto_start = self.config.get("auto_start", True)
         self.auto_recover = self.config.get("auto_recover", True)
         self.max_retries = self.config.get("max_retries", 3)
+        self.demand_driven = self.config.get("demand_driven", False)
+        self.max_snapshot_age = self.config.get("max_snapshot_age", 30.0)
 
         # Initialize sensors
         self.camera = CameraSensor(self.config.get("camera", {}))
@@ -108,24 +223,56 @@ class SensorManager:
         # State management
         self.status = ManagerStatus.STOPPED
         self.running = False
-        self._lock = threading.RLock()  # Use reentrant lock to prevent deadlock
+        self._lock = threading.RLock()  # Lifecycle transitions; reentrant to prevent deadlock
+        # Each slot's lock serializes that sensor's reads without blocking the
+        # others; _state_lock guards the counters and is only held for updates.
+        # Status and health take no lock: they read single attributes (status,
+        # running, polling_interval, simulation_mode, counters), which is atomic
+        # under the GIL, so they never wait behind a slow read or transition.
+        self._state_lock = threading.Lock()
+        # The simulation controller is not thread-safe; this serializes its use
+        # without tying simulated reads to the lifecycle lock
+        self._sim_lock = threading.Lock()
+
+        # (monotonic ns, dict) of the last get_all_status() result
+        self._status_cache: Optional[tuple] = None
+
+        # (monotonic ns, dict) of the polling loop's last read; in demand-driven
+        # mode read_all() serves it and sets _snapshot_consumed to ask for another
+        self._last_snapshot: Optional[tuple] = None
+        self._snapshot_consumed = threading.Event()
+
+        # Persistent pool so the sensors' blocking reads overlap (created on first use)
+        self._read_pool: Optional[ThreadPoolExecutor] = None
         self._polling_thread: Optional[threading.Thread] = None
-        self._start_time: Optional[datetime] = None
-
-        # Health tracking
-        self._retry_counts: Dict[str, int] = {"camera": 0, "microphone": 0, "air_quality": 0}
-        self._last_read_time: Dict[str, Optional[datetime]] = {
-            "camera": None,
-            "microphone": None,
-            "air_quality": None,
-        }
-        self._error_counts: Dict[str, int] = {"camera": 0, "microphone": 0, "air_quality": 0}
+        self._wakeup = threading.Event()  # Interrupts the polling loop's wait
+        self._start_ns: Optional[int] = None  # time.monotonic_ns() at start
+        # Converts monotonic stamps to wall-clock time, only when serializing
+        self._wall_offset_ns = time.time_ns() - time.monotonic_ns()
+
+        # Health tracking, one record per sensor in SENSOR_NAMES order
+        self._slots = tuple(SensorSlot(name, getattr(self, name)) for name in self.SENSOR_NAMES)
+        self._slot_map: Dict[str, SensorSlot] = {slot.name: slot for slot in self._slots}
 
         # Simulation mode
         self.simulation_controller = SimulationController() if SIMULATION_AVAILABLE else None
         self.simulation_mode = False
+        # Reads dispatch through this attribute, swapped by start/stop_simulation,
+        # so the hot path does not re-check the mode on every call
+        self._read_all = self._read_all_real
 
-        logger.info(f"SensorManager initialized (polling={self.polling_interval}s)")
+        logger.info("SensorManager initialized (polling=%ss)", self.polling_interval)
+
+    @property
+    def status(self) -> ManagerStatus:
+        """Current manager state."""
+        return self._status
+
+    @status.setter
+    def status(self, value: ManagerStatus) -> None:
+        # Keep the plain string alongside, so status builds skip Enum attribute access
+        self._status = value
+        self._status_value = value.value
 
     def start_all(self) -> bool:
         """
@@ -140,30 +287,31 @@ class SensorManager:
                 return True
 
             self.status = ManagerStatus.STARTING
+            self._status_cache = None
             logger.info("Starting all sensors...")
 
             # Start individual sensors
-            camera_ok = self._start_sensor(self.camera, "camera")
-            microphone_ok = self._start_sensor(self.microphone, "microphone")
-            air_quality_ok = self._start_sensor(self.air_quality, "air_quality")
+            started = {
+                slot.name: self._start_sensor(slot.sensor, slot.name) for slot in self._slots
+            }
 
-            if not camera_ok and not microphone_ok and not air_quality_ok:
+            if not any(started.values()):
                 logger.error("Failed to start any sensors")
                 self.status = ManagerStatus.ERROR
                 return False
 
             # Start polling thread
             self.running = True
+            self._wakeup.clear()
             self._polling_thread = threading.Thread(
                 target=self._polling_loop, daemon=True, name="SensorManagerPolling"
             )
             self._polling_thread.start()
 
             self.status = ManagerStatus.RUNNING
-            self._start_time = datetime.now()  # Set start time when running
-            logger.info(
-                f"SensorManager started (camera={camera_ok}, microphone={microphone_ok}, air_quality={air_quality_ok})"
-            )
+            self._start_ns = time.monotonic_ns()  # Set start time when running
+            self._wall_offset_ns = time.time_ns() - self._start_ns  # Pick up clock changes
+            logger.info("SensorManager started (%s)", self._format_results(started))
             return True
 
     def stop_all(self) -> bool:
@@ -186,173 +334,292 @@ class SensorManager:
 
             # Stop polling thread
             self.running = False
+            self._wakeup.set()  # End the loop's wait now instead of after an interval
             if self._polling_thread and self._polling_thread.is_alive():
                 self._polling_thread.join(timeout=self.THREAD_STOP_TIMEOUT)
 
             # Stop individual sensors
-            camera_ok = self._stop_sensor(self.camera, "camera")
-            microphone_ok = self._stop_sensor(self.microphone, "microphone")
-            air_quality_ok = self._stop_sensor(self.air_quality, "air_quality")
+            stopped = {slot.name: self._stop_sensor(slot.sensor, slot.name) for slot in self._slots}
+
+            if self._read_pool is not None:
+                self._read_pool.shutdown(wait=False, cancel_futures=True)
+                self._read_pool = None
 
             self.status = ManagerStatus.STOPPED
-            self._start_time = None  # Clear start time after calculating uptime
+            self._status_cache = None
+            self._last_snapshot = None
+            self._start_ns = None  # Clear start time after calculating uptime
             logger.info(
-                f"SensorManager stopped (camera={camera_ok}, microphone={microphone_ok}, air_quality={air_quality_ok}, uptime={final_uptime}s)"
+                "SensorManager stopped (%s, uptime=%ss)",
+                self._format_results(stopped),
+                final_uptime,
             )
             return True
 
-    def get_all_status(self) -> Dict[str, Any]:
+    def get_all_status(self, ttl_ms: int = 0) -> Dict[str, Any]:
         """
         Get status of all sensors and manager.
 
+        Args:
+            ttl_ms: Return the last status if it is younger than this many
+                milliseconds (0 always rebuilds). Cached results are shared;
+                treat them as read-only.
+
         Returns:
             dict: Status information for manager and all sensors
         """
-        with self._lock:
-            camera_status = self.camera.get_status()
-            microphone_status = self.microphone.get_status()
-            air_quality_status = self.air_quality.get_status()
+        return self._status_and_health(ttl_ms)[0]
+
+    def _status_and_health(self, ttl_ms: int = 0) -> tuple:
+        """Return (status, health_score, issues), reusing a snapshot younger than ttl_ms."""
+        cached = self._status_cache
+        if ttl_ms > 0 and cached is not None:
+            built_ns, *snapshot = cached
+            if time.monotonic_ns() - built_ns < ttl_ms * 1_000_000:
+                return tuple(snapshot)
+
+        snapshot = self._build_status_and_health(ttl_ms)
+        # Stamp after building, so slow get_status() calls don't shorten the TTL
+        self._status_cache = (time.monotonic_ns(), *snapshot)
+        return snapshot
+
+    def _build_status_and_health(self, ttl_ms: int = 0) -> tuple:
+        """
+        Build the status dict and score health in the same pass over the sensors.
 
-            return {
-                "manager": {
-                    "status": self.status.value,
-                    "running": self.running,
-                    "polling_interval": self.polling_interval,
-                    "uptime": self._calculate_uptime(),
-                    "simulation_mode": self.simulation_mode,
-                },
-                "sensors": {
-                    "camera": {
-                        **camera_status,
-                        "error_count": self._error_counts["camera"],
-                        "retry_count": self._retry_counts["camera"],
-                        "last_read": (
-                            self._last_read_time["camera"].isoformat()
-                            if self._last_read_time["camera"]
-                            else None
-                        ),
-                    },
-                    "microphone": {
-                        **microphone_status,
-                        "error_count": self._error_counts["microphone"],
-                        "retry_count": self._retry_counts["microphone"],
-                        "last_read": (
-                            self._last_read_time["microphone"].isoformat()
-                            if self._last_read_time["microphone"]
-                            else None
-                        ),
-                    },
-                    "air_quality": {
-                        **air_quality_status,
-                        "error_count": self._error_counts["air_quality"],
-                        "retry_count": self._retry_counts["air_quality"],
-                        "last_read": (
-                            self._last_read_time["air_quality"].isoformat()
-                            if self._last_read_time["air_quality"]
-                            else None
-                        ),
-                    },
-                },
-                "timestamp": datetime.now().isoformat(),
+        Issue strings are only formatted for sensors that lose points, so a
+        healthy system does no string work.
+
+        Args:
+            ttl_ms: Maximum age of reused per-sensor statuses (0 fetches fresh ones)
+
+        Returns:
+            tuple: (status dict, health score 0-100, list of issues)
+        """
+        # Lock-free reads of single attributes (see __init__)
+        status_value = self._status_value
+        manager = {
+            "status": status_value,
+            "running": self.running,
+            "polling_interval": self.polling_interval,
+            "uptime": self._calculate_uptime(),
+            "simulation_mode": self.simulation_mode,
+        }
+        wall_offset_ns = self._wall_offset_ns
+        counters = [
+            (slot, slot.error_count, slot.retry_count, slot.last_read_iso(wall_offset_ns))
+            for slot in self._slots
+        ]
+
+        health_score = 100
+        issues = []
+
+        if status_value != _STATUS_RUNNING:
+            health_score -= 50
+            issues.append(f"Manager not running: {status_value}")
+
+        sensors = {}
+        for slot, error_count, retry_count, last_read in counters:
+            sensor_status = self._cached_status(slot, ttl_ms * 1_000_000)
+            sensors[slot.name] = {
+                **sensor_status,
+                "error_count": error_count,
+                "retry_count": retry_count,
+                "last_read": last_read,
             }
 
+            # Penalize for non-active sensors
+            state = sensor_status.get("status", "unknown")
+            if state not in _ACTIVE_STATUSES:
+                health_score -= 20
+                issues.append(f"{slot.name} not active: {state}")
+
+            # Penalize for errors
+            if error_count > 0:
+                health_score -= min(
+                    self.HEALTH_ERROR_PENALTY * error_count, self.HEALTH_ERROR_MAX_PENALTY
+                )
+                issues.append(f"{slot.name} has {error_count} errors")
+
+        status = {
+            "manager": manager,
+            "sensors": sensors,
+            "timestamp": iso_now(),
+        }
+        return status, max(0, health_score), issues
+
     def read_all(self) -> Dict[str, Any]:
         """
         Read data from all active sensors or simulation.
 
+        In demand-driven mode a snapshot from the polling loop younger than one
+        polling interval is returned instead of reading the sensors again.
+
         Returns:
             dict: Data from all sensors that successfully read
         """
-        with self._lock:
-            # If simulation mode is active, use simulated data
-            if self.simulation_mode and self.simulation_controller:
-                sensor_data = self.simulation_controller.generate_sensor_data()
-                return {
-                    "timestamp": sensor_data["timestamp"],
-                    "data": {
-                        "camera": sensor_data["camera"],
-                        "microphone": sensor_data["microphone"],
-                        "emotion": sensor_data["emotion"],
-                    },
-                    "errors": {},
-                    "simulation_mode": True,
-                    "scenario": sensor_data["scenario"],
-                }
-            
-            result = {"timestamp": datetime.now().isoformat(), "data": {}, "errors": {}}
+        if self.demand_driven and self.running and not self.simulation_mode:
+            now = time.monotonic_ns()
+            snapshot = self._last_snapshot
+            if snapshot is not None and now - snapshot[0] <= self.polling_interval * 1e9:
+                self._snapshot_consumed.set()  # Have the loop prepare the next one
+                return snapshot[1]
+            result = self._read_all()
+            self._last_snapshot = (now, result)
+            return result
 
-            # Read camera
-            try:
-                camera_data = self.camera.read()
-                result["data"]["camera"] = camera_data
-                self._last_read_time["camera"] = datetime.now()
-                self._error_counts["camera"] = 0  # Reset on success
-            except Exception as e:
-                logger.error(f"Error reading camera: {e}")
-                result["errors"]["camera"] = str(e)
-                self._error_counts["camera"] += 1
+        return self._read_all()
 
-            # Read microphone
-            try:
-                microphone_data = self.microphone.read()
-                result["data"]["microphone"] = microphone_data
-                self._last_read_time["microphone"] = datetime.now()
-                self._error_counts["microphone"] = 0  # Reset on success
-            except Exception as e:
-                logger.error(f"Error reading microphone: {e}")
-                result["errors"]["microphone"] = str(e)
-                self._error_counts["microphone"] += 1
+    async def read_all_async(self) -> Dict[str, Any]:
+        """
+        Read data from all sensors without blocking the event loop.
 
-            # Read air quality
-            try:
-                air_quality_data = self.air_quality.read()
-                result["data"]["air_quality"] = air_quality_data
-                self._last_read_time["air_quality"] = datetime.now()
-                self._error_counts["air_quality"] = 0  # Reset on success
-            except Exception as e:
-                logger.error(f"Error reading air_quality: {e}")
-                result["errors"]["air_quality"] = str(e)
-                self._error_counts["air_quality"] += 1
+        For async callers such as the WebSocket stream: read_all() runs in a
+        worker thread, so other coroutines keep running while sensors block.
 
-            return result
+        Returns:
+            dict: Same as read_all()
+        """
+        return await asyncio.to_thread(self.read_all)
 
-    def get_health(self) -> Dict[str, Any]:
+    def _set_reader(self, reader) -> None:
         """
-        Get detailed health information.
+        Install reader as _read_all and drop the snapshot taken by the previous one.
 
-        Returns:
-            dict: Health metrics for manager and all sensors
+        Args:
+            reader: _read_all_real or _read_all_sim
         """
-        status = self.get_all_status()
+        self._read_all = reader
+        self._last_snapshot = None
+        self._snapshot_consumed.clear()
+
+    def _read_all_sim(self) -> Dict[str, Any]:
+        """Generate simulated data (installed as _read_all during simulation)."""
+        with self._sim_lock:
+            sensor_data = self.simulation_controller.generate_sensor_data()
+        return {
+            "timestamp": sensor_data["timestamp"],
+            "data": {
+                "camera": sensor_data["camera"],
+                "microphone": sensor_data["microphone"],
+                "emotion": sensor_data["emotion"],
+            },
+            "errors": {},
+            "simulation_mode": True,
+            "scenario": sensor_data["scenario"],
+        }
 
-        # Calculate health score (0-100)
-        health_score = 100
-        issues = []
+    def _read_all_real(self) -> Dict[str, Any]:
+        """Read all sensors now, bypassing the snapshot (the default _read_all)."""
+        result = {"timestamp": iso_now(), "data": {}, "errors": {}}
+
+        # Sensors with a background sampler (sample_hz) answer from their history
+        # buffer without blocking, so they are read inline; only sensors that
+        # capture on read() go to the pool
+        sampled, capturing = [], []
+        for slot in self._slots:
+            (sampled if slot.sensor.is_sampling() else capturing).append(slot)
+
+        # Collect outcomes first, then apply them under one lock acquisition
+        outcomes = []
+        futures = []
+        timeout = self.polling_interval * 0.9
+        if capturing:
+            # Capturing reads run concurrently: the cycle takes as long as the
+            # slowest sensor rather than the sum of all of them
+            pool = self._get_read_pool()
+            now = time.monotonic_ns()
+            for slot in capturing:
+                in_flight = slot.in_flight
+                if in_flight is not None and not in_flight[0].done():
+                    if now - in_flight[1] >= timeout * 1e9:
+                        # Still stuck from an earlier cycle: a running future can't
+                        # be cancelled, and resubmitting would only park another
+                        # worker on slot.lock, starving the healthy sensors
+                        outcomes.append((slot, None, None, "timeout"))
+                    else:
+                        futures.append((slot, in_flight[0]))  # Share a concurrent caller's read
+                    continue
+                future = pool.submit(self._read_one, slot)
+                slot.in_flight = (future, now)
+                futures.append((slot, future))
+
+        for slot in sampled:
+            data, read_time, error = self._read_one(slot)
+            outcomes.append((slot, data, read_time, None if error is None else str(error)))
+
+        if futures:
+            wait([future for _, future in futures], timeout=timeout)
+        for slot, future in futures:
+            if future.done():
+                data, read_time, error = future.result()
+                if error is not None:
+                    error = str(error)  # Formatted outside the lock, failures only
+                outcomes.append((slot, data, read_time, error))
+            else:
+                future.cancel()
+                outcomes.append((slot, None, None, "timeout"))
+
+        # Merge results here; the workers never touch shared state
+        data_out, errors_out = result["data"], result["errors"]
+        with self._state_lock:
+            for slot, data, read_time, error in outcomes:
+                if error is None:
+                    data_out[slot.name] = data
+                    slot.last_read_ns = read_time
+                    if slot.error_count:  # Healthy sensors skip the reset write
+                        slot.error_count = 0
+                        slot.status_cache = None  # Recovered; status may have changed
+                else:
+                    errors_out[slot.name] = error
+                    slot.error_count += 1
+                    slot.status_cache = None
+
+        return result
+
+    def _read_one(self, slot: SensorSlot) -> tuple:
+        """
+        Read one sensor (on the read pool, or inline for sampled sensors).
 
-        # Check manager status
-        if self.status != ManagerStatus.RUNNING:
-            health_score -= 50
-            issues.append(f"Manager not running: {self.status.value}")
+        Holds only this sensor's lock, so a slow camera does not stall the
+        microphone or status queries.
 
-        # Check sensor health
-        for sensor_name, sensor_info in status["sensors"].items():
-            sensor_status = sensor_info.get("status", "unknown")
-            error_count = sensor_info.get("error_count", 0)
+        Returns:
+            tuple: (data, monotonic read time in ns, exception or None)
+        """
+        with slot.lock:
+            try:
+                data = slot.sensor.read()
+                return data, time.monotonic_ns(), None
+            except Exception as e:
+                # Deferred formatting: nothing is rendered if ERROR logging is off
+                logger.error("Error reading %s: %s", slot.name, e)
+                return None, None, e
+
+    def _get_read_pool(self) -> ThreadPoolExecutor:
+        """Return the sensor read pool, creating it if needed."""
+        pool = self._read_pool
+        if pool is not None:
+            return pool  # Fast path: no lock once the pool exists
+
+        with self._state_lock:
+            if self._read_pool is None:
+                self._read_pool = ThreadPoolExecutor(
+                    max_workers=len(self.SENSOR_NAMES), thread_name_prefix="sensor-read"
+                )
+            return self._read_pool
 
-            # Penalize for non-active sensors
-            if sensor_status not in ["ACTIVE", "MOCK_MODE"]:
-                health_score -= 20
-                issues.append(f"{sensor_name} not active: {sensor_status}")
+    def get_health(self, ttl_ms: int = 0) -> Dict[str, Any]:
+        """
+        Get detailed health information.
 
-            # Penalize for errors
-            if error_count > 0:
-                penalty = min(
-                    self.HEALTH_ERROR_PENALTY * error_count, self.HEALTH_ERROR_MAX_PENALTY
-                )
-                health_score -= penalty
-                issues.append(f"{sensor_name} has {error_count} errors")
+        Args:
+            ttl_ms: Maximum age of a reused status snapshot (see get_all_status)
 
-        health_score = max(0, health_score)
+        Returns:
+            dict: Health metrics for manager and all sensors
+        """
+        status, health_score, issues = self._status_and_health(ttl_ms)
 
         return {
             "health_score": health_score,
@@ -361,9 +628,8 @@ class SensorManager:
                 if health_score >= 80
                 else "degraded" if health_score >= 50 else "unhealthy"
             ),
-            "issues": issues,
-            "timestamp": datetime.now().isoformat(),
-            **status,
+            "issues": list(issues),
+            **status,  # manager, sensors and the snapshot's timestamp
         }
 
     def update_config(self, new_config: Dict[str, Any]) -> bool:
@@ -381,7 +647,7 @@ class SensorManager:
                 # Update polling interval
                 if "polling_interval" in new_config:
                     self.polling_interval = float(new_config["polling_interval"])
-                    logger.info(f"Updated polling_interval to {self.polling_interval}s")
+                    logger.info("Updated polling_interval to %ss", self.polling_interval)
 
                 # Update other config
                 if "auto_recover" in new_config:
@@ -390,14 +656,29 @@ class SensorManager:
                 if "max_retries" in new_config:
                     self.max_retries = int(new_config["max_retries"])
 
+                if "demand_driven" in new_config:
+                    self.demand_driven = bool(new_config["demand_driven"])
+
+                if "max_snapshot_age" in new_config:
+                    self.max_snapshot_age = float(new_config["max_snapshot_age"])
+
                 # Store new config
                 self.config.update(new_config)
+                self._status_cache = None
+
+                # Apply a new polling interval now rather than after the current wait
+                self._wakeup.set()
 
                 return True
             except Exception as e:
-                logger.error(f"Error updating config: {e}")
+                logger.error("Error updating config: %s", e)
                 return False
 
+    @staticmethod
+    def _format_results(results: Dict[str, bool]) -> str:
+        """Format per-sensor start/stop results as 'camera=True, microphone=False'."""
+        return ", ".join(f"{name}={ok}" for name, ok in results.items())
+
     def _start_sensor(self, sensor, name: str) -> bool:
         """
         Start an individual sensor with retry logic.
@@ -409,17 +690,21 @@ class SensorManager:
         Returns:
             bool: True if sensor started successfully
         """
+        slot = self._slot_map[name]
         try:
             success = sensor.start()
+            slot.status_cache = None
             if success:
-                self._retry_counts[name] = 0
-                logger.info(f"{name} sensor started successfully")
+                with self._state_lock:
+                    slot.retry_count = 0
+                    slot.next_recover_ns = 0
+                logger.info("%s sensor started successfully", name)
                 return True
             else:
-                logger.warning(f"{name} sensor failed to start")
+                logger.warning("%s sensor failed to start", name)
                 return False
         except Exception as e:
-            logger.error(f"Error starting {name} sensor: {e}")
+            logger.error("Error starting %s sensor: %s", name, e)
             return False
 
     def _stop_sensor(self, sensor, name: str) -> bool:
@@ -435,14 +720,15 @@ class SensorManager:
         """
         try:
             success = sensor.stop()
+            self._slot_map[name].status_cache = None
             if success:
-                logger.info(f"{name} sensor stopped successfully")
+                logger.info("%s sensor stopped successfully", name)
                 return True
             else:
-                logger.warning(f"{name} sensor failed to stop cleanly")
+                logger.warning("%s sensor failed to stop cleanly", name)
                 return False
         except Exception as e:
-            logger.error(f"Error stopping {name} sensor: {e}")
+            logger.error("Error stopping %s sensor: %s", name, e)
             return False
 
     def _polling_loop(self) -> None:
@@ -451,16 +737,32 @@ class SensorManager:
 
         Continuously reads from all sensors at the configured interval.
         Handles errors and auto-recovery if configured.
+
+        Cycles are anchored to monotonic deadlines rather than sleeping a full
+        interval after each read, so read latency does not stretch the period.
         """
         logger.info("Polling loop started")
 
+        deadline = time.monotonic()
         while self.running:
             try:
-                # Read from all sensors
-                sensor_data = self.read_all()
-                
+                # Read from all sensors, unless nobody took the last snapshot
+                sensor_data = None
+                if self._poll_due():
+                    # Clear first: a consumer arriving mid-read asks for the next one
+                    self._snapshot_consumed.clear()
+                    reader = self._read_all
+                    sensor_data = reader()
+                    if self._read_all is reader:  # Don't publish data from a swapped-out mode
+                        self._last_snapshot = (time.monotonic_ns(), sensor_data)
+
                 # Persist simulation data to database
-                if self.simulation_mode and DATABASE_AVAILABLE and sensor_data.get("data"):
+                if (
+                    self.simulation_mode
+                    and DATABASE_AVAILABLE
+                    and sensor_data
+                    and sensor_data.get("data")
+                ):
                     try:
                         data = sensor_data["data"]
                         
@@ -474,47 +776,81 @@ class SensorManager:
                         
                         logger.debug("Simulation data persisted to database")
                     except Exception as e:
-                        logger.error(f"Error persisting simulation data: {e}")
+                        logger.error("Error persisting simulation data: %s", e)
 
                 # Auto-recover failed sensors if enabled (skip during simulation mode)
                 # During simulation, we don't use real sensors so recovery is unnecessary
                 if self.auto_recover and not self.simulation_mode:
                     self._check_and_recover()
 
-                # Sleep for polling interval
-                time.sleep(self.polling_interval)
-
-            except Exception as e:
-                logger.error(f"Error in polling loop: {e}")
-                time.sleep(1.0)  # Brief pause before retrying
+                # Wait until the next deadline; stop_all/update_config cut it short
+                deadline += self.polling_interval
+                remaining = deadline - time.monotonic()
+                if remaining < -self.polling_interval:
+                    logger.warning(
+                        "Polling fell %.2fs behind schedule, skipping missed cycles", -remaining
+                    )
+                    deadline = time.monotonic()
+                elif remaining > 0 and self._wakeup.wait(timeout=remaining):
+                    self._wakeup.clear()
+                    deadline = time.monotonic()  # Woken early: restart the schedule from now
+
+            except Exception:
+                # Keep polling, but with the traceback: this only catches manager bugs
+                logger.exception("Error in polling loop")
+                self._wakeup.wait(timeout=1.0)  # Brief pause before retrying
+                self._wakeup.clear()
+                deadline = time.monotonic()
 
         logger.info("Polling loop stopped")
 
+    def _poll_due(self) -> bool:
+        """
+        Decide whether this polling cycle should read the sensors.
+
+        Always true outside demand-driven mode and during simulation (whose
+        data is persisted every cycle). Otherwise only when read_all() consumed
+        the last snapshot or it is older than max_snapshot_age.
+
+        Returns:
+            bool: True if the sensors should be read
+        """
+        if not self.demand_driven or self.simulation_mode:
+            return True
+        if self._snapshot_consumed.is_set():
+            return True
+        snapshot = self._last_snapshot
+        return snapshot is None or time.monotonic_ns() - snapshot[0] >= self.max_snapshot_age * 1e9
+
     def _check_and_recover(self) -> None:
         """
         Check sensor health and attempt recovery if needed.
 
-        Restarts sensors that have failed if they haven't exceeded max retries.
+        Restarts sensors that have failed if they haven't exceeded max retries,
+        waiting RECOVERY_BACKOFF seconds after a failed attempt (doubling each retry).
+        A sensor in error or unavailable state fails its reads, so a failed read
+        is the signal: only sensors with read errors have their status queried.
+        Each sensor is stopped before it is restarted so its hardware handle and
+        sampler are released before initialize() runs again.
         """
-        # Check camera
-        if self._should_recover("camera", self.camera):
-            logger.info(
-                f"Attempting to recover camera sensor (retry {self._retry_counts['camera'] + 1}/{self.max_retries})"
-            )
-            if self._start_sensor(self.camera, "camera"):
-                logger.info("Camera sensor recovered successfully")
-            else:
-                self._retry_counts["camera"] += 1
+        for slot in self._slots:
+            if not slot.error_count or not self._should_recover(slot.name, slot.sensor):
+                continue
 
-        # Check microphone
-        if self._should_recover("microphone", self.microphone):
             logger.info(
-                f"Attempting to recover microphone sensor (retry {self._retry_counts['microphone'] + 1}/{self.max_retries})"
+                "Attempting to recover %s sensor (retry %d/%d)",
+                slot.name,
+                slot.retry_count + 1,
+                self.max_retries,
             )
-            if self._start_sensor(self.microphone, "microphone"):
-                logger.info("Microphone sensor recovered successfully")
+            self._stop_sensor(slot.sensor, slot.name)
+            if self._start_sensor(slot.sensor, slot.name):
+                logger.info("%s sensor recovered successfully", slot.name)
             else:
-                self._retry_counts["microphone"] += 1
+                with self._state_lock:
+                    slot.retry_count += 1
+                    backoff = self.RECOVERY_BACKOFF * 2 ** (slot.retry_count - 1)
+                    slot.next_recover_ns = time.monotonic_ns() + int(backoff * 1e9)
 
     def _should_recover(self, name: str, sensor) -> bool:
         """
@@ -528,14 +864,43 @@ class SensorManager:
             bool: True if sensor should be recovered
         """
         # Don't recover if max retries exceeded
-        if self._retry_counts[name] >= self.max_retries:
+        slot = self._slot_map[name]
+        if slot.retry_count >= self.max_retries:
+            return False
+
+        # Back off after a failed attempt instead of re-checking every poll
+        if slot.next_recover_ns and time.monotonic_ns() < slot.next_recover_ns:
             return False
 
-        # Check if sensor is in error state
-        status = sensor.get_status()
+        # Check if sensor is in error state; a status from the last half interval will do
+        status = self._cached_status(slot, int(self.polling_interval * 500_000_000))
         current_status = status.get("status", "")
 
-        return current_status in ["ERROR", "UNAVAILABLE"]
+        return current_status.lower() in _RECOVERABLE_STATUSES
+
+    def _cached_status(self, slot: SensorSlot, max_age_ns: int) -> Dict[str, Any]:
+        """
+        Return the sensor's status, reusing one fetched within max_age_ns.
+
+        Reads, starts and stops clear the cached entry when the sensor may have
+        changed state, so between transitions the status is fetched at most once
+        per max_age_ns instead of by every caller.
+
+        Args:
+            slot: Sensor record
+            max_age_ns: Maximum age of a reused status (0 always fetches)
+
+        Returns:
+            dict: Sensor status as returned by get_status()
+        """
+        now = time.monotonic_ns()
+        cached = slot.status_cache
+        if max_age_ns > 0 and cached is not None and now - cached[0] < max_age_ns:
+            return cached[1]
+
+        status = slot.sensor.get_status()
+        slot.status_cache = (now, status)
+        return status
 
     def _calculate_uptime(self) -> Optional[float]:
         """
@@ -544,10 +909,11 @@ class SensorManager:
         Returns:
             float: Uptime in seconds, or None if not running
         """
-        if self._start_time:
-            return (datetime.now() - self._start_time).total_seconds()
+        start_ns = self._start_ns  # Read once; stop_all may clear it concurrently
+        if start_ns is not None:
+            return (time.monotonic_ns() - start_ns) / 1e9
         return None
-    
+
     def start_simulation(self, scenario: str = "calm") -> bool:
         """
         Start simulation mode with specified scenario.
@@ -571,21 +937,26 @@ class SensorManager:
                 self.stop_all()
             
             # Start simulation
-            if self.simulation_controller.start(scenario):
+            with self._sim_lock:
+                started = self.simulation_controller.start(scenario)
+            if started:
                 self.simulation_mode = True
+                self._set_reader(self._read_all_sim)
+                self._status_cache = None
                 
                 # Restart manager if not running (for polling)
                 if not self.running:
                     self.status = ManagerStatus.STARTING
                     self.running = True
+                    self._wakeup.clear()
                     self._polling_thread = threading.Thread(
                         target=self._polling_loop, daemon=True, name="SimulationPolling"
                     )
                     self._polling_thread.start()
                     self.status = ManagerStatus.RUNNING
-                    self._start_time = datetime.now()
+                    self._start_ns = time.monotonic_ns()
                 
-                logger.info(f"Simulation mode started with scenario: {scenario}")
+                logger.info("Simulation mode started with scenario: %s", scenario)
                 return True
             else:
                 logger.error("Failed to start simulation controller")
@@ -608,8 +979,11 @@ class SensorManager:
                 return True
             
             # Stop simulation
-            self.simulation_controller.stop()
+            with self._sim_lock:
+                self.simulation_controller.stop()
             self.simulation_mode = False
+            self._set_reader(self._read_all_real)
+            self._status_cache = None
             
             logger.info("Simulation mode stopped")
             return True
@@ -659,9 +1033,10 @@ class SensorManager:
             return False
         
         try:
-            self.simulation_controller.set_custom_parameters(params)
-            logger.info(f"Custom simulation parameters updated: {params}")
+            with self._sim_lock:
+                self.simulation_controller.set_custom_parameters(params)
+            logger.info("Custom simulation parameters updated: %s", params)
             return True
         except Exception as e:
-            logger.error(f"Failed to set custom parameters: {e}")
+            logger.error("Failed to set custom parameters: %s", e)
             return False
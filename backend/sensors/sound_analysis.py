@@ -13,7 +13,7 @@ import logging
 
 try:
     from scipy import signal
-    from scipy.fft import fft, fftfreq
+    from scipy.fft import rfft, rfftfreq
 
     SCIPY_AVAILABLE = True
 except ImportError:
@@ -84,6 +84,8 @@ class SoundAnalyzer(BaseSensor):
         # Analysis settings
         self.window_function = "hann"  # Hanning window for FFT
         self.freq_resolution = sample_rate / self.buffer_size
+        self._window: Optional[np.ndarray] = None  # Built on first FFT (needs SciPy)
+        self._band_slices: Optional[tuple] = None  # ((bins, sample_rate), band index ranges)
 
         # History for rolling averages
         self.analysis_history: List[Dict[str, Any]] = []
@@ -112,25 +114,18 @@ class SoundAnalyzer(BaseSensor):
                         f"Device {self.device_index} has no input channels"
                     )
             else:
-                # Check for any input device
-                input_devices = [
-                    d for d in devices if isinstance(d, dict) and d.get("max_input_channels", 0) > 0
-                ]
-                if not input_devices:
+                # Check for any input device (stops at the first match)
+                if not any(d.get("max_input_channels", 0) > 0 for d in devices):
                     raise SensorUnavailableError("No audio input devices found")
 
-            # Test recording
-            test_recording = sd.rec(
-                int(0.1 * self.sample_rate),
+            # Validate the capture settings without opening a stream and recording;
+            # raises if the device rejects them
+            sd.check_input_settings(
+                device=self.device_index,
                 samplerate=self.sample_rate,
                 channels=1,
-                device=self.device_index,
                 dtype="float32",
             )
-            sd.wait()
-
-            if test_recording is None:
-                raise SensorUnavailableError("Failed to record test audio")
 
             logger.info(
                 f"Sound analyzer initialized (SR: {self.sample_rate} Hz, "
@@ -178,8 +173,8 @@ class SoundAnalyzer(BaseSensor):
                     "error": "Failed to record audio",
                 }
 
-            # Flatten to 1D array
-            audio_data = recording.flatten()
+            # Mono column as a 1D view (no copy)
+            audio_data = recording[:, 0]
 
             # Analyze audio
             result = self._analyze_audio(audio_data)
@@ -229,6 +224,10 @@ class SoundAnalyzer(BaseSensor):
             Dict with analysis results
         """
         try:
+            # Single precision throughout (a no-op for float32 recordings), so the
+            # FFT produces complex64 and every pass moves half the bytes
+            audio_data = np.asarray(audio_data, dtype=np.float32)
+
             # Calculate amplitude metrics
             amplitude_metrics = self._calculate_amplitudes(audio_data)
 
@@ -269,11 +268,11 @@ class SoundAnalyzer(BaseSensor):
         Returns:
             Dict with amplitude metrics
         """
-        # Calculate RMS (Root Mean Square)
-        rms = np.sqrt(np.mean(audio_data**2))
+        # Calculate RMS (Root Mean Square); the dot product avoids a squared copy
+        rms = np.sqrt(np.dot(audio_data, audio_data) / max(len(audio_data), 1))
 
-        # Peak amplitude
-        peak = np.max(np.abs(audio_data))
+        # Peak amplitude, without allocating an abs() copy
+        peak = max(float(audio_data.max()), -float(audio_data.min())) if len(audio_data) else 0.0
 
         # Convert to dB scale
         epsilon = 1e-10
@@ -302,15 +301,15 @@ class SoundAnalyzer(BaseSensor):
             Dict with FFT results
         """
         # Apply window function to reduce spectral leakage
-        window = signal.get_window(self.window_function, len(audio_data))
-        windowed_data = audio_data * window
+        windowed_data = audio_data * self._get_window(len(audio_data))
 
-        # Perform FFT
-        fft_values = fft(windowed_data)
-        fft_freqs = fftfreq(len(windowed_data), 1 / self.sample_rate)
+        # Real-input FFT: audio is real, so only the non-negative frequency bins
+        # are computed (half the work of a full complex FFT)
+        fft_values = rfft(windowed_data)
+        fft_freqs = rfftfreq(len(windowed_data), 1 / self.sample_rate)
 
-        # Get magnitude spectrum (positive frequencies only)
-        n = len(fft_values) // 2
+        # Get magnitude spectrum (positive frequencies below Nyquist, as before)
+        n = len(windowed_data) // 2
         magnitudes = np.abs(fft_values[:n])
         frequencies = fft_freqs[:n]
 
@@ -326,6 +325,25 @@ class SoundAnalyzer(BaseSensor):
             "dominant_magnitude": round(dominant_magnitude, 2),
         }
 
+    def _get_window(self, length: int) -> np.ndarray:
+        """
+        Return the FFT window for the given length, computed once and reused.
+
+        Captures are always buffer_size samples, so the window is only rebuilt
+        if a caller analyzes audio of a different length.
+
+        Args:
+            length: Number of samples
+
+        Returns:
+            float32 window coefficients
+        """
+        window = self._window
+        if window is None or len(window) != length:
+            window = signal.get_window(self.window_function, length).astype(np.float32)
+            self._window = window
+        return window
+
     def _analyze_spectrum(self, fft_results: Dict[str, Any]) -> Dict[str, float]:
         """
         Analyze frequency spectrum by bands.
@@ -336,19 +354,14 @@ class SoundAnalyzer(BaseSensor):
         Returns:
             Dict with energy per frequency band
         """
-        frequencies = fft_results["frequencies"]
         magnitudes = fft_results["magnitudes"]
 
         spectrum = {}
 
-        for band_name, (freq_min, freq_max) in self.FREQ_BANDS.items():
-            # Find indices for this frequency band
-            band_mask = (frequencies >= freq_min) & (frequencies < freq_max)
-            band_magnitudes = magnitudes[band_mask]
-
-            # Calculate average energy in this band
-            if len(band_magnitudes) > 0:
-                energy = float(np.mean(band_magnitudes))
+        for band_name, start, stop in self._get_band_slices(fft_results["frequencies"]):
+            # Average energy in this band (a contiguous run of sorted bins)
+            if stop > start:
+                energy = float(np.mean(magnitudes[start:stop]))
             else:
                 energy = 0.0
 
@@ -356,6 +369,33 @@ class SoundAnalyzer(BaseSensor):
 
         return spectrum
 
+    def _get_band_slices(self, frequencies: np.ndarray) -> tuple:
+        """
+        Return (band name, start, stop) bin ranges for FREQ_BANDS.
+
+        FFT bins are sorted and fixed for a given length and sample rate, so
+        each band's [freq_min, freq_max) range is located once with a binary
+        search and reused instead of masking the whole spectrum per band.
+
+        Args:
+            frequencies: Sorted bin frequencies from _perform_fft
+
+        Returns:
+            tuple of (band name, start index, stop index)
+        """
+        key = (len(frequencies), self.sample_rate)
+        cached = self._band_slices
+        if cached is None or cached[0] != key:
+            bounds = np.array(list(self.FREQ_BANDS.values()), dtype=np.float64)
+            starts = np.searchsorted(frequencies, bounds[:, 0], side="left")
+            stops = np.searchsorted(frequencies, bounds[:, 1], side="left")
+            slices = tuple(
+                (name, int(start), int(stop))
+                for name, start, stop in zip(self.FREQ_BANDS, starts, stops)
+            )
+            cached = self._band_slices = (key, slices)
+        return cached[1]
+
     def _classify_noise(self, db_level: float) -> str:
         """
         Classify noise level based on dB.
@@ -504,7 +544,7 @@ def get_audio_devices() -> List[Dict[str, Any]]:
                 "sample_rate": d["default_samplerate"],
             }
             for i, d in enumerate(devices)
-            if isinstance(d, dict) and d.get("max_input_channels", 0) > 0
+            if d.get("max_input_channels", 0) > 0
         ]
     except Exception as e:
         logger.error(f"Error listing audio devices: {e}")
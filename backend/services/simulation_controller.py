@@ -24,6 +24,45 @@ class SimulationScenario(str, Enum):
     CUSTOM = "custom"
 
 
+# Scenario catalogue; static, so it is built once at import
+SCENARIO_INFO = (
+    {
+        "id": "calm",
+        "name": "Calm Flow",
+        "description": "High greenery, low noise, positive emotions. Ideal workspace conditions.",
+        "greenery": "60-90%",
+        "noise": "20-40 dB (Quiet)",
+        "emotion": "Positive (Happy, Content)",
+    },
+    {
+        "id": "stress",
+        "name": "High Stress",
+        "description": "Low greenery, high noise, negative emotions. Stressful environment.",
+        "greenery": "5-20%",
+        "noise": "70-95 dB (Very Noisy)",
+        "emotion": "Negative (Stressed, Anxious)",
+    },
+    {
+        "id": "dynamic",
+        "name": "Dynamic",
+        "description": (
+            "Fluctuates between calm and stress over time. Simulates changing conditions."
+        ),
+        "greenery": "Variable",
+        "noise": "Variable",
+        "emotion": "Variable",
+    },
+    {
+        "id": "custom",
+        "name": "Custom",
+        "description": "User-defined parameters for testing specific scenarios.",
+        "greenery": "Custom",
+        "noise": "Custom",
+        "emotion": "Custom",
+    },
+)
+
+
 class SimulationController:
     """
     Simulation Engine for generating realistic sensor data patterns.
@@ -169,42 +208,10 @@ class SimulationController:
         Get list of available scenarios with descriptions.
         
         Returns:
-            List of scenario information dictionaries
+            List of scenario information dictionaries (copies; changing them
+            does not affect SCENARIO_INFO)
         """
-        return [
-            {
-                "id": "calm",
-                "name": "Calm Flow",
-                "description": "High greenery, low noise, positive emotions. Ideal workspace conditions.",
-                "greenery": "60-90%",
-                "noise": "20-40 dB (Quiet)",
-                "emotion": "Positive (Happy, Content)",
-            },
-            {
-                "id": "stress",
-                "name": "High Stress",
-                "description": "Low greenery, high noise, negative emotions. Stressful environment.",
-                "greenery": "5-20%",
-                "noise": "70-95 dB (Very Noisy)",
-                "emotion": "Negative (Stressed, Anxious)",
-            },
-            {
-                "id": "dynamic",
-                "name": "Dynamic",
-                "description": "Fluctuates between calm and stress over time. Simulates changing conditions.",
-                "greenery": "Variable",
-                "noise": "Variable",
-                "emotion": "Variable",
-            },
-            {
-                "id": "custom",
-                "name": "Custom",
-                "description": "User-defined parameters for testing specific scenarios.",
-                "greenery": "Custom",
-                "noise": "Custom",
-                "emotion": "Custom",
-            },
-        ]
+        return [dict(info) for info in SCENARIO_INFO]
     
     def generate_sensor_data(self) -> Dict[str, Any]:
         """
@@ -220,18 +227,23 @@ class SimulationController:
         if self.current_scenario == SimulationScenario.DYNAMIC:
             self._update_dynamic_phase()
         
+        # One clock read and format per tick, shared by all generated readings
+        timestamp = datetime.now().isoformat()
         return {
-            "camera": self.generate_camera_data(),
-            "microphone": self.generate_microphone_data(),
-            "emotion": self.generate_emotion_data(),
-            "timestamp": datetime.now().isoformat(),
+            "camera": self.generate_camera_data(timestamp),
+            "microphone": self.generate_microphone_data(timestamp),
+            "emotion": self.generate_emotion_data(timestamp),
+            "timestamp": timestamp,
             "scenario": self.current_scenario.value,
         }
     
-    def generate_camera_data(self) -> Dict[str, Any]:
+    def generate_camera_data(self, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """
         Generate camera sensor data (greenery detection).
         
+        Args:
+            timestamp: ISO 8601 time of the reading (default: now)
+
         Returns:
             Dict with greenery percentage and metadata
         """
@@ -242,7 +254,7 @@ class SimulationController:
         greenery_pct = max(0, min(100, greenery_pct + variation))
         
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp or datetime.now().isoformat(),
             "sensor_type": "camera",
             "greenery_percentage": round(greenery_pct, 2),
             "resolution": (640, 480),
@@ -250,10 +262,13 @@ class SimulationController:
             "scenario": self.current_scenario.value,
         }
     
-    def generate_microphone_data(self) -> Dict[str, Any]:
+    def generate_microphone_data(self, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """
         Generate microphone sensor data (noise analysis).
         
+        Args:
+            timestamp: ISO 8601 time of the reading (default: now)
+
         Returns:
             Dict with dB levels and classification
         """
@@ -281,7 +296,7 @@ class SimulationController:
         rms = 10 ** (raw_db / 20.0)
         
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp or datetime.now().isoformat(),
             "sensor_type": "microphone",
             "db_level": round(db_level, 2),
             "raw_db": round(raw_db, 2),
@@ -291,10 +306,13 @@ class SimulationController:
             "scenario": self.current_scenario.value,
         }
     
-    def generate_emotion_data(self) -> Dict[str, Any]:
+    def generate_emotion_data(self, timestamp: Optional[str] = None) -> Dict[str, Any]:
         """
         Generate emotion detection data.
         
+        Args:
+            timestamp: ISO 8601 time of the reading (default: now)
+
         Returns:
             Dict with emotion probabilities
         """
@@ -309,7 +327,7 @@ class SimulationController:
         dominant = max(emotions.items(), key=lambda x: x[1])[0]
         
         return {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp or datetime.now().isoformat(),
             "sensor_type": "emotion",
             "emotions": {k: round(v, 3) for k, v in emotions.items()},
             "dominant_emotion": dominant,
@@ -301,8 +301,8 @@ async def websocket_endpoint(websocket: WebSocket, sensor_manager=None):
             # Stream sensor data if throttle allows
             if throttler.should_send() and sensor_manager:
                 try:
-                    # Get sensor data from manager
-                    sensor_data = sensor_manager.read_all()
+                    # Get sensor data from manager (off the event loop)
+                    sensor_data = await sensor_manager.read_all_async()
 
                     # Get system info (optional)
                     import psutil
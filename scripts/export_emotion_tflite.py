@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Emotion Model Export Script for CV-Mindcare
+
+This script converts DeepFace's Keras emotion model to TensorFlow Lite with
+dynamic-range int8 quantization, for use by the emotion detector's
+`tflite_model_path` option:
+- Roughly halves inference latency on x86, more on ARM (Raspberry Pi)
+- Cuts the model's memory footprint about 4x
+
+Requires the ML extras (deepface, tensorflow) on the exporting machine only;
+the Pi itself just needs tflite-runtime.
+
+Usage:
+    python scripts/export_emotion_tflite.py [output_path]
+"""
+
+import sys
+
+DEFAULT_OUTPUT = "emotion_int8.tflite"
+
+
+def export_emotion_tflite(output_path: str = DEFAULT_OUTPUT):
+    """
+    Convert DeepFace's emotion model to a quantized TFLite file.
+
+    Args:
+        output_path: Where to write the .tflite model
+    """
+    import tensorflow as tf
+    from deepface import DeepFace
+
+    print("Building DeepFace emotion model...")
+    try:
+        model = DeepFace.build_model(task="facial_attribute", model_name="Emotion")
+    except TypeError:
+        # Older DeepFace releases take only the model name
+        model = DeepFace.build_model("Emotion")
+
+    # Newer DeepFace wraps the Keras model in a client object
+    keras_model = getattr(model, "model", model)
+
+    print("Converting to TFLite (dynamic-range int8)...")
+    converter = tf.lite.TFLiteConverter.from_keras_model(keras_model)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    tflite_model = converter.convert()
+
+    with open(output_path, "wb") as f:
+        f.write(tflite_model)
+
+    print(f"Wrote {output_path} ({len(tflite_model) / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    export_emotion_tflite(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_OUTPUT)
@@ -5,10 +5,16 @@ Tests for camera sensor with greenery detection and mock mode support.
 """
 
 import numpy as np
+import pytest
 from datetime import datetime
 from unittest.mock import patch, MagicMock
 
-from backend.sensors.camera_sensor import CameraSensor, get_camera_reading, check_camera_available
+from backend.sensors.camera_sensor import (
+    CameraSensor,
+    get_camera_reading,
+    check_camera_available,
+    NUMBA_AVAILABLE,
+)
 from backend.sensors.base import SensorStatus
 
 
@@ -194,6 +200,61 @@ class TestCameraOpenCVBackend:
         assert data["greenery_percentage"] > 0
         assert data["mock_mode"] is False
 
+    def test_capture_reuses_frame_buffer(self, mock_videocapture):
+        """Test OpenCV captures decode into the previously returned buffer."""
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        mock_cap.read.return_value = (True, mock_frame)
+        mock_videocapture.return_value = mock_cap
+
+        sensor = CameraSensor(config={"backend": "opencv"})
+        sensor.initialize()
+
+        first = sensor._capture_opencv()
+        second = sensor._capture_opencv()
+
+        assert first is second
+        mock_cap.read.assert_called_with(mock_frame)
+
+        sensor.cleanup()
+        assert sensor._frame_buf is None
+
+    def test_initialize_warms_up_numba_kernel(self, mock_videocapture):
+        """Test the Numba kernel is compiled during initialize, not on first capture."""
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.read.return_value = (True, np.zeros((480, 640, 3), dtype=np.uint8))
+        mock_videocapture.return_value = mock_cap
+
+        sensor = CameraSensor(config={"backend": "opencv", "use_numba": True})
+        with patch.object(CameraSensor, "_warm_up_numba") as warm:
+            assert sensor.initialize() is True
+
+        assert warm.call_count == (1 if NUMBA_AVAILABLE else 0)
+
+    def test_min_interval_returns_cached_result(self, mock_videocapture):
+        """Test captures arriving within min_interval_s reuse the last result."""
+        mock_cap = MagicMock()
+        mock_cap.isOpened.return_value = True
+        mock_cap.read.return_value = (True, np.zeros((480, 640, 3), dtype=np.uint8))
+        mock_videocapture.return_value = mock_cap
+
+        sensor = CameraSensor(config={"backend": "opencv", "min_interval_s": 60})
+        sensor.initialize()
+        reads_after_init = mock_cap.read.call_count
+
+        first = sensor.capture()
+        second = sensor.capture()
+
+        assert mock_cap.read.call_count == reads_after_init + 1
+        assert second == first
+        assert second is not first
+
+        sensor._last_capture_t -= 60
+        sensor.capture()
+        assert mock_cap.read.call_count == reads_after_init + 2
+
     def test_cleanup_opencv(self, mock_videocapture):
         """Test OpenCV cleanup."""
         mock_cap = MagicMock()
@@ -289,6 +350,128 @@ class TestGreeneryDetectionAlgorithm:
 
         assert data["greenery_percentage"] == 100.0
 
+    def test_downsampled_analysis_matches_full_resolution(self):
+        """Test downsampling before HSV keeps the greenery percentage."""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        frame[0:240, :] = (30, 160, 40)  # BGR foliage green (50%)
+
+        full = CameraSensor(config={"backend": "opencv", "analysis_downsample": 1})
+        small = CameraSensor(config={"backend": "opencv"})
+
+        assert small.analysis_downsample == 4
+        assert full._analyze_greenery(frame) == 50.0
+        assert small._analyze_greenery(frame) == 50.0
+
+    @patch("cv2.cvtColor")
+    def test_downsample_shrinks_hsv_input(self, mock_cvtcolor):
+        """Test HSV conversion runs on the downsampled frame."""
+        mock_cvtcolor.return_value = np.zeros((120, 160, 3), dtype=np.uint8)
+        sensor = CameraSensor(config={"backend": "opencv"})
+
+        sensor._analyze_greenery(np.zeros((480, 640, 3), dtype=np.uint8))
+
+        assert mock_cvtcolor.call_args[0][0].shape == (120, 160, 3)
+
+    def test_hsv_buffers_reused_until_shape_changes(self):
+        """Test HSV and mask outputs are written into persistent buffers."""
+        frame = np.zeros((480, 640, 3), dtype=np.uint8)
+        frame[0:240, :] = (30, 160, 40)  # BGR foliage green (50%)
+        sensor = CameraSensor(config={"backend": "opencv"})
+
+        assert sensor._analyze_greenery(frame) == 50.0
+        hsv_buf, mask_buf = sensor._hsv_buf, sensor._hsv_mask_buf
+        assert sensor._analyze_greenery(frame) == 50.0
+        assert sensor._hsv_buf is hsv_buf
+        assert sensor._hsv_mask_buf is mask_buf
+
+        sensor._analyze_greenery(np.zeros((240, 320, 3), dtype=np.uint8))
+        assert sensor._hsv_buf.shape == (60, 80, 3)
+
+    def test_hsv_bounds_follow_config_updates(self):
+        """Test precomputed inRange bounds are rebuilt when config changes."""
+        sensor = CameraSensor()
+        assert sensor._lower_green.tolist() == [35, 40, 40]
+        assert sensor._upper_green.tolist() == [85, 255, 255]
+
+        sensor.update_config({"green_hue_range": (30, 90), "value_min": 60})
+
+        assert sensor._lower_green.tolist() == [30, 40, 60]
+        assert sensor._upper_green.tolist() == [90, 255, 255]
+        assert sensor.capture_mock_data()["hsv_params"] == {
+            "hue_range": (30, 90),
+            "saturation_min": 40,
+            "value_min": 60,
+        }
+
+    def test_hsv_params_not_shared_between_readings(self):
+        """Test mutating a reading's hsv_params leaves the sensor and other readings intact."""
+        sensor = CameraSensor()
+        first = sensor.capture_mock_data()
+        first["hsv_params"]["value_min"] = 0
+
+        assert sensor.capture_mock_data()["hsv_params"]["value_min"] == 40
+        assert sensor._hsv_params["value_min"] == 40
+
+    @patch("cv2.cvtColor")
+    def test_fast_greenery_skips_hsv(self, mock_cvtcolor):
+        """Test fast_greenery thresholds BGR directly, matching the NumPy rule."""
+        rng = np.random.default_rng(1)
+        frame = rng.integers(0, 256, (120, 160, 3), dtype=np.uint8)
+        sensor = CameraSensor(
+            config={"backend": "opencv", "fast_greenery": True, "analysis_downsample": 1}
+        )
+
+        percentage = sensor._analyze_greenery(frame)
+
+        mock_cvtcolor.assert_not_called()
+        assert percentage == sensor._analyze_greenery_numpy(frame)
+
+    def test_yuv420_chroma_threshold(self):
+        """Test picamera2 YUV420 frames are classified on the U/V planes."""
+        height, width = 8, 8
+        frame = np.full((height * 3 // 2, width), 128, dtype=np.uint8)
+        u = frame[height : height + height // 4].reshape(height // 2, width // 2)
+        v = frame[height + height // 4 :].reshape(height // 2, width // 2)
+        u[0:2, :] = 90  # Top half of chroma is green (U, V < 120)
+        v[0:2, :] = 90
+
+        sensor = CameraSensor(config={"backend": "picamera2", "picamera2_yuv": True})
+
+        assert sensor._analyze_greenery(frame) == 50.0
+
+    @pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+    def test_numba_kernel_matches_opencv(self):
+        """Test the fused Numba kernel agrees with cvtColor + inRange."""
+        rng = np.random.default_rng(0)
+        frame = rng.integers(0, 256, (120, 160, 3), dtype=np.uint8)
+
+        opencv = CameraSensor(config={"backend": "opencv", "analysis_downsample": 1})
+        fused = CameraSensor(
+            config={"backend": "opencv", "analysis_downsample": 1, "use_numba": True}
+        )
+
+        assert abs(opencv._analyze_greenery(frame) - fused._analyze_greenery(frame)) < 0.1
+
+    def test_numpy_fallback_without_opencv(self):
+        """Test greenery detection falls back to NumPy when cv2 is missing."""
+        frame = np.zeros((100, 100, 3), dtype=np.uint8)
+        frame[0:50, :] = (30, 160, 40)  # BGR foliage green (50%)
+        frame[50:75, :] = (120, 130, 125)  # Grey, not green-dominant
+
+        sensor = CameraSensor(config={"backend": "opencv"})
+        with patch("backend.sensors.camera_sensor.CV2_AVAILABLE", False):
+            percentage = sensor._analyze_greenery(frame)
+
+        assert percentage == 50.0
+
+    def test_numpy_fallback_rgb_order(self):
+        """Test NumPy fallback honours picamera2 RGB channel order."""
+        frame = np.zeros((10, 10, 3), dtype=np.uint8)
+        frame[:, :] = (40, 160, 30)  # RGB green
+
+        sensor = CameraSensor(config={"backend": "picamera2"})
+        assert sensor._analyze_greenery_numpy(frame) == 100.0
+
 
 class TestCameraFallbackMechanism:
     """Test automatic fallback to mock mode."""
@@ -0,0 +1,326 @@
+"""
+Unit Tests for Emotion Detection
+--------------------------------
+Tests for the emotion detector's mock mode, background inference worker,
+face box cache and TFLite path, with DeepFace and TFLite mocked out.
+"""
+
+import threading
+import time
+
+import numpy as np
+import pytest
+from unittest.mock import patch, MagicMock
+
+from backend.sensors.emotion_detection import EmotionDetector
+from backend.sensors.base import SensorStatus
+
+
+def _deepface_result(region, emotion="happy"):
+    """Build a DeepFace.analyze() style result with one dominant emotion."""
+    scores = {e: 0.0 for e in EmotionDetector.EMOTIONS}
+    scores[emotion] = 90.0
+    scores["neutral"] += 10.0
+    return [{"emotion": scores, "region": region}]
+
+
+def _fake_interpreter(scores):
+    """Build a float32 TFLite interpreter double returning fixed scores."""
+    interpreter = MagicMock()
+    interpreter.get_input_details.return_value = [
+        {"index": 0, "shape": np.array([1, 48, 48, 1]), "dtype": np.float32}
+    ]
+    interpreter.get_output_details.return_value = [{"index": 1, "dtype": np.float32}]
+    interpreter.get_tensor.return_value = np.array([scores], dtype=np.float32)
+    return interpreter
+
+
+@pytest.fixture
+def detector():
+    """Emotion detector with the inference worker stopped afterwards."""
+    sensor = EmotionDetector(config={"inference_cpus": []})
+    yield sensor
+    sensor._stop_worker()
+
+
+@pytest.fixture
+def deepface():
+    """Mock DeepFace (not installed in the test environment)."""
+    with patch("backend.sensors.emotion_detection.DeepFace", create=True) as mock:
+        yield mock
+
+
+def _activate(sensor, frame):
+    """Make the detector capture `frame` from a mocked camera."""
+    sensor.status = SensorStatus.ACTIVE
+    sensor.cap = MagicMock()
+    sensor.cap.read.return_value = (True, frame)
+
+
+class TestEmotionDetectorMockMode:
+    """Test emotion detector mock mode."""
+
+    def test_read_in_mock_mode(self):
+        """Test that the detector can be created and read in mock mode."""
+        sensor = EmotionDetector(config={"mock_mode": True})
+        assert sensor.start() is True
+        assert sensor.status == SensorStatus.MOCK_MODE
+
+        data = sensor.read()
+
+        assert data["mock_mode"] is True
+        assert data["face_detected"] is True
+        assert data["dominant_emotion"] in EmotionDetector.EMOTIONS
+        assert sum(data["emotions"].values()) == pytest.approx(1.0, abs=0.01)
+        assert sensor.get_emotion_distribution()["samples"] == 1
+        assert len(data["timestamp"].rsplit(".", 1)[1]) == 6  # iso_now() format
+        sensor.stop()
+
+
+class TestEmotionInferenceWorker:
+    """Test the background inference worker."""
+
+    def test_capture_returns_worker_result(self, detector, deepface):
+        """Test that capture() hands the frame to the worker and returns its analysis."""
+        deepface.analyze.return_value = _deepface_result({"x": 10, "y": 20, "w": 50, "h": 60})
+        _activate(detector, np.zeros((240, 320, 3), dtype=np.uint8))
+        detector._start_worker()
+
+        result = detector.capture()
+
+        assert result["face_detected"] is True
+        assert result["dominant_emotion"] == "happy"
+        assert result["face_coordinates"] == {"x": 10, "y": 20, "w": 50, "h": 60}
+        assert result["sensor_type"] == "emotion_detection"
+        deepface.analyze.assert_called_once()
+
+    def test_capture_stops_waiting_after_first_result_timeout(self, detector, deepface):
+        """Test that a slow first inference yields a no-face result after the timeout."""
+        release = threading.Event()
+        deepface.analyze.side_effect = lambda **kwargs: release.wait(5.0) and []
+        _activate(detector, np.zeros((240, 320, 3), dtype=np.uint8))
+        detector._start_worker()
+
+        try:
+            with patch.object(EmotionDetector, "FIRST_RESULT_TIMEOUT", 0.1):
+                start = time.monotonic()
+                result = detector.capture()
+                elapsed = time.monotonic() - start
+        finally:
+            release.set()
+
+        assert elapsed < 1.0
+        assert result["available"] is True
+        assert result["face_detected"] is False
+
+
+class TestEmotionFaceBoxCache:
+    """Test reuse of the last face box between detections."""
+
+    def test_face_box_reused_until_detect_interval(self, deepface):
+        """Test that tracked frames classify the cached crop and re-detect every N frames."""
+        sensor = EmotionDetector(config={"detect_interval": 3, "inference_cpus": []})
+        deepface.analyze.return_value = _deepface_result({"x": 40, "y": 30, "w": 80, "h": 80})
+        model = MagicMock(spec=["predict"])
+        model.predict.return_value = np.array([[0.0, 0.0, 0.0, 0.8, 0.0, 0.0, 0.2]])
+        sensor._emotion_model = model
+        frame = np.zeros((240, 320, 3), dtype=np.uint8)
+
+        results = [sensor._analyze_frame(frame, track=True) for _ in range(4)]
+
+        # Frame 1 detects, frames 2-3 reuse the box, frame 4 detects again
+        assert deepface.analyze.call_count == 2
+        assert model.predict.call_count == 2
+        assert all(r["dominant_emotion"] == "happy" for r in results)
+        assert results[1]["face_coordinates"] == {"x": 40, "y": 30, "w": 80, "h": 80}
+
+    def test_low_confidence_forces_redetection(self, deepface):
+        """Test that a crop classified below the threshold drops the cached box."""
+        sensor = EmotionDetector(config={"detect_interval": 5, "inference_cpus": []})
+        deepface.analyze.return_value = _deepface_result({"x": 40, "y": 30, "w": 80, "h": 80})
+        model = MagicMock(spec=["predict"])
+        model.predict.return_value = np.full((1, 7), 1.0 / 7)
+        sensor._emotion_model = model
+        frame = np.zeros((240, 320, 3), dtype=np.uint8)
+
+        sensor._analyze_frame(frame, track=True)
+        sensor._analyze_frame(frame, track=True)
+
+        assert sensor._last_bbox is None
+
+    def test_untracked_image_without_face_keeps_cached_box(self, detector, deepface, tmp_path):
+        """Test that analyze_image() on a faceless still image leaves the live face box alone."""
+        import cv2
+
+        path = tmp_path / "empty.png"
+        cv2.imwrite(str(path), np.zeros((120, 160, 3), dtype=np.uint8))
+        box = {"x": 40, "y": 30, "w": 80, "h": 80}
+        detector._last_bbox = dict(box)
+        detector._frames_since_detect = 2
+
+        # DeepFace path
+        deepface.analyze.return_value = []
+        assert detector.analyze_image(str(path))["face_detected"] is False
+
+        # TFLite path
+        detector._use_tflite = True
+        detector._tflite = _fake_interpreter([0.0] * 7)
+        detector._face_cascade = MagicMock()
+        detector._face_cascade.detectMultiScale.return_value = []
+        assert detector.analyze_image(str(path))["face_detected"] is False
+
+        assert detector._last_bbox == box
+        assert detector._frames_since_detect == 2
+
+
+class TestEmotionTFLitePath:
+    """Test classification with a TFLite model."""
+
+    def test_tflite_classifies_detected_face(self, detector):
+        """Test the cascade plus TFLite path, with coordinates in original frame units."""
+        detector._use_tflite = True
+        detector._tflite = _fake_interpreter([0.0, 0.0, 0.0, 0.7, 0.0, 0.0, 0.3])
+        detector._face_cascade = MagicMock()
+        detector._face_cascade.detectMultiScale.return_value = [(10, 10, 60, 60)]
+
+        # 640x480 is downscaled 2x to the default 320x240 analysis size
+        result = detector._analyze_frame(np.zeros((480, 640, 3), dtype=np.uint8))
+
+        assert result["dominant_emotion"] == "happy"
+        assert result["dominant_confidence"] == pytest.approx(0.7)
+        assert result["face_coordinates"] == {"x": 20, "y": 20, "w": 120, "h": 120}
+        detector._tflite.invoke.assert_called_once()
+
+    def test_tflite_no_face(self, detector):
+        """Test that no cascade hit gives the no-face result without inference."""
+        detector._use_tflite = True
+        detector._tflite = _fake_interpreter([0.0] * 7)
+        detector._face_cascade = MagicMock()
+        detector._face_cascade.detectMultiScale.return_value = []
+
+        result = detector._analyze_frame(np.zeros((240, 320, 3), dtype=np.uint8))
+
+        assert result["face_detected"] is False
+        detector._tflite.invoke.assert_not_called()
+
+
+class TestEmotionBatchAnalysis:
+    """Test analyzing image files in batches."""
+
+    def test_analyze_images_serializes_inference_with_worker(self, detector, tmp_path):
+        """Test batch analysis never runs the shared interpreter concurrently with the worker."""
+        import cv2
+
+        active, overlaps = [0], []
+        lock = threading.Lock()
+
+        def invoke():
+            with lock:
+                active[0] += 1
+                overlaps.append(active[0])
+            time.sleep(0.005)
+            with lock:
+                active[0] -= 1
+
+        detector._use_tflite = True
+        detector._tflite = _fake_interpreter([0.0, 0.0, 0.0, 0.8, 0.0, 0.0, 0.2])
+        detector._tflite.invoke.side_effect = invoke
+        detector._face_cascade = MagicMock()
+        detector._face_cascade.detectMultiScale.return_value = [(10, 10, 60, 60)]
+
+        paths = []
+        for i in range(8):
+            path = tmp_path / f"face{i}.png"
+            cv2.imwrite(str(path), np.zeros((120, 160, 3), dtype=np.uint8))
+            paths.append(str(path))
+
+        frame = np.zeros((240, 320, 3), dtype=np.uint8)
+        _activate(detector, frame)
+        detector._start_worker()
+        stop = threading.Event()
+
+        def feed():
+            while not stop.is_set():
+                detector._submit_frame(frame)
+                time.sleep(0.001)
+
+        feeder = threading.Thread(target=feed)
+        feeder.start()
+        try:
+            results = detector.analyze_images(paths, workers=4)
+        finally:
+            stop.set()
+            feeder.join()
+
+        assert [r["source"] for r in results] == paths
+        assert all(r["dominant_emotion"] == "happy" for r in results)
+        assert len(overlaps) > len(paths)  # The worker ran inference meanwhile
+        assert max(overlaps) == 1
+
+
+class TestEmotionInferencePinning:
+    """Test CPU pinning and TensorFlow thread sizing for the inference worker."""
+
+    @pytest.fixture
+    def affinity(self, monkeypatch):
+        """Set the process affinity mask the detector sees."""
+        from backend.sensors import emotion_detection
+
+        def set_mask(cpus):
+            monkeypatch.setattr(
+                emotion_detection.os, "sched_getaffinity", lambda pid: set(cpus), raising=False
+            )
+            monkeypatch.setattr(
+                emotion_detection.os, "sched_setaffinity", lambda pid, cpus: None, raising=False
+            )
+
+        return set_mask
+
+    @pytest.fixture
+    def tf(self):
+        """Stand-in for an already imported TensorFlow."""
+        tf = MagicMock()
+        with patch.dict("sys.modules", {"tensorflow": tf}):
+            yield tf
+
+    def test_default_cpus_follow_affinity_mask(self, affinity):
+        """Test the default reserves the last two cores the process may use."""
+        affinity({0, 1, 5, 7})
+        assert EmotionDetector._default_inference_cpus() == {5, 7}
+
+        affinity({0, 1, 2})
+        assert EmotionDetector._default_inference_cpus() == set()
+
+    def test_intra_threads_match_reserved_cores(self, affinity, tf):
+        """Test the intra-op pool is sized to reserved cores inside the mask."""
+        affinity(range(8))
+        sensor = EmotionDetector(config={"inference_cpus": [6, 7]})
+
+        sensor._configure_tf_threads()
+
+        tf.config.threading.set_intra_op_parallelism_threads.assert_called_once_with(2)
+
+    def test_intra_threads_ignore_unpinnable_cores(self, affinity, tf):
+        """Test cores outside the mask don't cap the intra-op pool."""
+        affinity({0, 1, 2, 3})
+        sensor = EmotionDetector(config={"inference_cpus": [14, 15]})
+
+        sensor._configure_tf_threads()
+
+        tf.config.threading.set_intra_op_parallelism_threads.assert_called_once_with(3)
+
+    def test_pinning_failure_logged_as_warning(self, monkeypatch, caplog):
+        """Test a rejected affinity request is reported at warning level."""
+        from backend.sensors import emotion_detection
+
+        def reject(pid, cpus):
+            raise OSError("Invalid argument")
+
+        monkeypatch.setattr(emotion_detection.os, "sched_setaffinity", reject, raising=False)
+        sensor = EmotionDetector(config={"inference_cpus": [14, 15]})
+        sensor._infer_stop.set()
+
+        with caplog.at_level("WARNING", logger="backend.sensors.emotion_detection"):
+            sensor._infer_loop()
+
+        assert "Could not pin emotion inference thread" in caplog.text
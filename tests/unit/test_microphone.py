@@ -0,0 +1,201 @@
+"""
+Unit Tests for the Legacy Microphone Module
+--------------------------------------------
+Tests for streamed continuous monitoring, its single-capture fallback,
+availability caching and measurement averaging.
+"""
+
+import sys
+import numpy as np
+import pytest
+from unittest.mock import patch, MagicMock
+
+# Mock sounddevice before importing microphone to avoid PortAudio dependency
+sys.modules.setdefault("sounddevice", MagicMock())
+
+from backend.sensors import microphone  # noqa: E402
+from backend.sensors.microphone import MicrophoneSensor  # noqa: E402
+from backend.sensors.microphone_sensor import _classify  # noqa: E402
+
+
+def _fake_input_stream(blocks):
+    """Build an InputStream factory whose start() delivers the given blocks."""
+
+    def factory(**kwargs):
+        stream = MagicMock()
+
+        def start():
+            for block in blocks:
+                kwargs["callback"](block, len(block), None, None)
+
+        stream.start.side_effect = start
+        return stream
+
+    return factory
+
+
+def _tone(amplitude, n=10):
+    """Mono float32 block of constant amplitude, shaped like stream input."""
+    return np.full((n, 1), amplitude, dtype=np.float32)
+
+
+class TestMonitorContinuous:
+    """Test streamed continuous monitoring."""
+
+    def test_streamed_blocks_are_measured(self):
+        """Test each streamed block becomes one measurement."""
+        sensor = MicrophoneSensor(sample_rate=100)
+        blocks = [_tone(0.01), _tone(0.5)]
+
+        with patch.object(microphone, "sd") as sd:
+            sd.InputStream.side_effect = _fake_input_stream(blocks)
+            results = sensor.monitor_continuous(duration=0.2, interval=0.1)
+
+        assert [m["avg_db"] for m in results] == [sensor.calculate_db_level(b) for b in blocks]
+        assert all(m["available"] for m in results)
+
+    def test_stream_start_failure_falls_back(self):
+        """Test a stream that fails to start falls back to a single capture."""
+        sensor = MicrophoneSensor(sample_rate=100)
+
+        with patch.object(microphone, "sd") as sd:
+            stream = sd.InputStream.return_value
+            stream.start.side_effect = OSError("device busy")
+            sd.rec.return_value = np.full((20, 1), 0.1, dtype=np.float32)
+            results = sensor.monitor_continuous(duration=0.2, interval=0.1)
+
+        stream.close.assert_called_once()
+        sd.rec.assert_called_once()
+        assert len(results) == 2
+        assert all(m["available"] for m in results)
+
+    def test_missing_blocks_reported_unavailable(self):
+        """Test intervals whose block never arrived are reported, not dropped."""
+        sensor = MicrophoneSensor(sample_rate=100)
+
+        with patch.object(microphone, "sd") as sd:
+            sd.InputStream.side_effect = _fake_input_stream([_tone(0.1)])
+            results = sensor.monitor_continuous(duration=0.02, interval=0.01)
+
+        assert len(results) == 2
+        assert results[0]["available"] is True
+        assert results[1]["available"] is False
+        assert results[1]["error"] == "No audio received"
+
+    def test_analysis_error_keeps_worker_running(self):
+        """Test a block that fails analysis is reported and later blocks still measured."""
+        sensor = MicrophoneSensor(sample_rate=100)
+        blocks = [_tone(0.1), _tone(0.2)]
+        real_level = sensor.calculate_db_level(blocks[1])
+
+        sensor.calculate_db_level = MagicMock(side_effect=[ValueError("bad block"), real_level])
+
+        with patch.object(microphone, "sd") as sd:
+            sd.InputStream.side_effect = _fake_input_stream(blocks)
+            results = sensor.monitor_continuous(duration=0.2, interval=0.1)
+
+        assert results[0]["available"] is False
+        assert results[0]["error"] == "bad block"
+        assert results[1]["available"] is True
+        assert results[1]["avg_db"] == real_level
+
+
+class TestMonitorSingleCapture:
+    """Test the one-recording fallback used when streaming is unavailable."""
+
+    def test_window_levels_match_per_slice_levels(self):
+        """Test each window's level equals calculate_db_level on that slice."""
+        sensor = MicrophoneSensor(sample_rate=100)
+        rng = np.random.default_rng(0)
+        recording = rng.standard_normal((30, 1)).astype(np.float32)
+        recording[:10] *= 0.001  # One quiet, one moderate and one loud window
+        recording[10:20] *= 0.05
+        recording[20:] *= 0.8
+
+        with patch.object(microphone, "sd") as sd:
+            sd.rec.return_value = recording
+            results = sensor._monitor_single_capture(duration=0.3, interval=0.1)
+
+        sd.rec.assert_called_once()
+        assert sd.rec.call_args.args[0] == 30
+        assert len(results) == 3
+        for i, measurement in enumerate(results):
+            expected = sensor.calculate_db_level(recording[i * 10 : (i + 1) * 10])
+            assert measurement["avg_db"] == pytest.approx(expected, abs=0.01)
+            assert measurement["classification"] == _classify(measurement["avg_db"])
+            assert measurement["available"] is True
+        assert results[0]["timestamp"] < results[1]["timestamp"] < results[2]["timestamp"]
+
+    def test_recording_failure_returns_error_entry(self):
+        """Test a failed recording is reported as a single unavailable entry."""
+        sensor = MicrophoneSensor(sample_rate=100)
+
+        with patch.object(microphone, "sd") as sd:
+            sd.rec.side_effect = OSError("no device")
+            results = sensor._monitor_single_capture(duration=0.3, interval=0.1)
+
+        assert len(results) == 1
+        assert results[0]["available"] is False
+        assert results[0]["avg_db"] == 0.0
+        assert results[0]["error"] == "Failed to record audio"
+        assert "timestamp" in results[0]
+
+
+class TestAvailability:
+    """Test the cached microphone availability probe."""
+
+    def test_availability_is_cached(self):
+        """Test repeated checks within the TTL query devices once."""
+        sensor = MicrophoneSensor()
+
+        with patch.object(microphone, "sd") as sd:
+            sd.query_devices.return_value = [{"max_input_channels": 1}]
+            assert sensor.is_available() is True
+            assert sensor.is_available() is True
+
+        sd.query_devices.assert_called_once()
+
+    def test_refresh_availability_reprobes(self):
+        """Test refresh_availability bypasses the cache and records the result."""
+        sensor = MicrophoneSensor()
+
+        with patch.object(microphone, "sd") as sd:
+            sd.query_devices.return_value = [{"max_input_channels": 1}]
+            assert sensor.is_available() is True
+
+            sd.query_devices.return_value = [{"max_input_channels": 0}]
+            assert sensor.is_available() is True  # Still cached
+            assert sensor.refresh_availability() is False
+
+        assert sd.query_devices.call_count == 2
+        assert sensor._hw_ok is False
+
+
+class TestGetAverageLevel:
+    """Test aggregation of multiple measurements."""
+
+    def test_average_includes_classifications(self):
+        """Test statistics cover available measurements and classify each one."""
+        sensor = MicrophoneSensor()
+        measurements = [
+            {"avg_db": 20.0, "available": True},
+            {"avg_db": 60.0, "available": True},
+            {"avg_db": 0.0, "available": False, "error": "Failed to record audio"},
+        ]
+
+        result = sensor.get_average_level(measurements)
+
+        assert result["avg_db"] == 40.0
+        assert result["min_db"] == 20.0
+        assert result["max_db"] == 60.0
+        assert result["samples"] == 2
+        assert result["classifications"] == [_classify(20.0), _classify(60.0)]
+
+    def test_average_without_available_measurements(self):
+        """Test empty or all-failed input yields zeroed statistics."""
+        sensor = MicrophoneSensor()
+
+        for measurements in ([], [{"avg_db": 0.0, "available": False}]):
+            result = sensor.get_average_level(measurements)
+            assert result["samples"] == 0
+            assert result["classifications"] == []
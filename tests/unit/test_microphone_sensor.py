@@ -5,6 +5,8 @@ Tests for microphone sensor with RMS dB calculation, noise classification,
 and mock mode support.
 """
 
+import os
+import select
 import pytest
 import numpy as np
 from datetime import datetime
@@ -20,6 +22,11 @@ from backend.sensors.microphone_sensor import (
     get_microphone_reading,
     check_microphone_available,
     list_audio_devices,
+    NUMBA_AVAILABLE,
+    _classify,
+    _classify_array,
+    _get_sensor,
+    _release_sensors,
 )
 from backend.sensors.base import SensorStatus, SensorError
 
@@ -130,6 +137,18 @@ class TestMicrophoneMockMode:
         valid_classifications = ["Quiet", "Normal", "Moderate", "Noisy", "Very Noisy"]
         assert data["noise_classification"] in valid_classifications
 
+    def test_mock_batch(self):
+        """Test batched mock levels stay within the scenario range."""
+        sensor = MicrophoneSensor(config={"mock_mode": True})
+
+        db_levels, classifications = sensor.capture_mock_batch(1000)
+
+        assert db_levels.shape == (1000,)
+        assert db_levels.dtype == np.float32
+        assert db_levels.min() >= 0 and db_levels.max() <= 95
+        assert classifications == _classify_array(db_levels)
+        assert len(set(classifications)) >= 3
+
     def test_mock_noise_classifications(self):
         """Test mock data generates all noise classification types."""
         sensor = MicrophoneSensor(config={"mock_mode": True})
@@ -182,6 +201,20 @@ class TestMicrophoneSounddeviceBackend:
 
         assert available is False
 
+    def test_hardware_check_cached_until_cleanup(self, mock_query_devices):
+        """Test device enumeration is cached and invalidated by cleanup."""
+        mock_query_devices.return_value = [{"name": "Microphone", "max_input_channels": 1}]
+
+        sensor = MicrophoneSensor()
+        assert sensor.check_hardware_available() is True
+        assert sensor.check_hardware_available() is True
+        assert mock_query_devices.call_count == 1
+
+        sensor.cleanup()
+        mock_query_devices.return_value = []
+        assert sensor.check_hardware_available() is False
+        assert mock_query_devices.call_count == 2
+
     @patch("sounddevice.rec")
     @patch("sounddevice.wait")
     def test_initialize_sounddevice(self, mock_wait, mock_rec, mock_query_devices):
@@ -198,6 +231,107 @@ class TestMicrophoneSounddeviceBackend:
 
         assert result is True
 
+    @patch("sounddevice.InputStream")
+    def test_stream_ring_buffer_capture(self, mock_input_stream, mock_query_devices):
+        """Test the persistent stream feeds a ring buffer read by capture."""
+        mock_query_devices.return_value = {"name": "Microphone", "max_input_channels": 1}
+        sensor = MicrophoneSensor(config={"sample_rate": 100, "sample_duration": 1.0})
+        assert sensor.initialize() is True
+        mock_input_stream.return_value.start.assert_called_once()
+
+        # Push 450 samples in 50-sample blocks; the 400-sample ring wraps once
+        for block in range(9):
+            indata = np.arange(block * 50, (block + 1) * 50, dtype=np.float32)[:, None]
+            sensor._audio_callback(indata, 50, None, None)
+
+        audio = sensor._capture_sounddevice()
+
+        np.testing.assert_array_equal(audio, np.arange(350, 450, dtype=np.float32))
+
+        sensor.cleanup()
+        mock_input_stream.return_value.close.assert_called_once()
+        assert sensor.stream is None
+
+
+class TestMicrophoneAlsaBackend:
+    """Test ALSA backend capture."""
+
+    def test_capture_alsa_fills_buffer(self):
+        """Test ALSA periods are packed into a normalized float32 array."""
+        sensor = MicrophoneSensor(
+            config={"backend": "alsa", "sample_rate": 1000, "sample_duration": 0.25}
+        )
+        period = np.arange(100, dtype=np.int16) * 300
+        sensor.alsa_device = MagicMock()
+        sensor.alsa_device.read.return_value = (100, period.tobytes())
+
+        audio = sensor._capture_alsa()
+
+        assert audio.dtype == np.float32
+        assert len(audio) == 250
+        np.testing.assert_array_equal(audio[:100], period / 32768.0)
+        np.testing.assert_array_equal(audio[200:], period[:50] / 32768.0)
+
+    @pytest.mark.parametrize("use_numba", [False, NUMBA_AVAILABLE])
+    def test_int16_analysis_matches_float(self, use_numba):
+        """Test int16 analysis gives the same levels as the float32 path."""
+        sensor = MicrophoneSensor(config={"backend": "alsa", "use_numba": use_numba})
+        pcm = (np.random.randn(44100) * 3000).clip(-32768, 32767).astype(np.int16)
+
+        rms_i, raw_i, norm_i, cls_i = sensor._analyze_audio_i16(pcm)
+        rms_f, raw_f, norm_f, cls_f = sensor._analyze_audio(pcm / 32768.0)
+
+        assert rms_i == pytest.approx(rms_f, rel=1e-5)
+        assert raw_i == pytest.approx(raw_f, abs=1e-3)
+        assert norm_i == pytest.approx(norm_f, abs=1e-3)
+        assert cls_i == cls_f
+
+    def test_initialize_alsa_period_size(self):
+        """Test the ALSA period follows period_ms and the size the driver accepts."""
+        sensor = MicrophoneSensor(config={"backend": "alsa", "sample_rate": 48000, "period_ms": 10})
+        pcm = sys.modules["alsaaudio"].PCM.return_value
+        pcm.setperiodsize.reset_mock()
+        pcm.setperiodsize.return_value = 512
+
+        assert sensor._initialize_alsa() is True
+
+        pcm.setperiodsize.assert_called_once_with(480)
+        assert sensor._period_frames == 512
+
+    def test_capture_alsa_waits_on_poll_descriptors(self):
+        """Test reads happen only once the device's descriptors report data."""
+        sensor = MicrophoneSensor(
+            config={"backend": "alsa", "sample_rate": 1000, "sample_duration": 0.1}
+        )
+        read_fd, write_fd = os.pipe()
+        try:
+            os.write(write_fd, b"x")  # Readable: a period is "ready"
+            sensor._poll_fds = [(read_fd, select.POLLIN)]
+            sensor.alsa_device = MagicMock()
+            sensor.alsa_device.read.return_value = (50, np.ones(50, dtype=np.int16).tobytes())
+
+            audio = sensor._capture_alsa()
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+        assert len(audio) == 100
+        assert sensor.alsa_device.read.call_count == 2
+
+    def test_capture_alsa_incomplete(self):
+        """Test a stalled ALSA device returns only the samples read."""
+        sensor = MicrophoneSensor(
+            config={"backend": "alsa", "sample_rate": 1000, "sample_duration": 0.25}
+        )
+        periods = iter([(10, np.ones(10, dtype=np.int16).tobytes())])
+        sensor.alsa_device = MagicMock()
+        sensor.alsa_device.read.side_effect = lambda: next(periods, (0, b""))
+
+        audio = sensor._capture_alsa()
+
+        # The wall-clock deadline ends the capture with what was read
+        assert len(audio) == 10
+
 
 class TestMicrophoneAudioAnalysis:
     """Test audio analysis algorithms."""
@@ -215,6 +349,17 @@ class TestMicrophoneAudioAnalysis:
         assert normalized_db < 10  # Very quiet
         assert classification == "Quiet"
 
+    def test_silent_buffers_short_circuit(self):
+        """Test all-zero buffers skip the RMS kernels on both paths."""
+        sensor = MicrophoneSensor(config={"backend": "alsa"})
+        expected = (0.0, -200.0, 0.0, "Quiet")
+
+        with patch("numpy.dot") as mock_dot:
+            assert sensor._analyze_audio(np.zeros(1024, dtype=np.float32)) == expected
+            mock_dot.assert_not_called()
+        assert sensor._analyze_audio_i16(np.zeros(1024, dtype=np.int16)) == expected
+        assert sensor._analyze_audio(np.array([], dtype=np.float32)) == expected
+
     def test_db_calculation_loud(self):
         """Test dB calculation for loud audio."""
         sensor = MicrophoneSensor(config={"mock_mode": True})
@@ -274,6 +419,15 @@ class TestMicrophoneAudioAnalysis:
             assert abs(calc_db - db_level) < 5
             assert classification == expected_classification
 
+    def test_classification_band_edges(self):
+        """Test band edges belong to the upper band, scalar and batched."""
+        levels = [0, 29.9, 30, 50, 69.9, 70, 85, 100]
+        expected = ["Quiet", "Quiet", "Normal", "Moderate", "Moderate", "Noisy"]
+        expected += ["Very Noisy", "Very Noisy"]
+
+        assert [_classify(db) for db in levels] == expected
+        assert _classify_array(np.array(levels)) == expected
+
 
 class TestMicrophoneCapture:
     """Test microphone capture functionality."""
@@ -354,6 +508,13 @@ class TestMicrophoneFallbackMechanism:
 class TestConvenienceFunctions:
     """Test convenience functions."""
 
+    @pytest.fixture(autouse=True)
+    def _fresh_sensor_cache(self):
+        """Isolate the module-level sensor cache between tests."""
+        _release_sensors()
+        yield
+        _release_sensors()
+
     @patch("backend.sensors.microphone_sensor.MicrophoneSensor")
     def test_get_microphone_reading(self, mock_sensor_class):
         """Test get_microphone_reading convenience function."""
@@ -367,12 +528,68 @@ class TestConvenienceFunctions:
         mock_sensor_class.return_value = mock_sensor
 
         result = get_microphone_reading(device_index=0)
+        get_microphone_reading(device_index=0)
 
         assert result is not None
         assert "db_level" in result
+        # The started sensor is reused, not set up and torn down per reading
+        mock_sensor_class.assert_called_once()
         mock_sensor.start.assert_called_once()
+        mock_sensor.stop.assert_not_called()
+        assert mock_sensor.read.call_count == 2
+
+        _release_sensors()
         mock_sensor.stop.assert_called_once()
 
+    @patch("backend.sensors.microphone_sensor.MicrophoneSensor")
+    def test_get_microphone_reading_recovers_after_failed_read(self, mock_sensor_class):
+        """Test that one failed read doesn't leave a broken sensor cached."""
+        broken = MagicMock()
+        broken.read.side_effect = SensorError("transient glitch")
+        healthy = MagicMock()
+        healthy.read.return_value = {"db_level": 45.0, "mock_mode": False}
+        mock_sensor_class.side_effect = [broken, healthy]
+
+        first = get_microphone_reading(device_index=0)
+        second = get_microphone_reading(device_index=0)
+
+        assert first["error"] == "transient glitch"
+        broken.stop.assert_called_once()
+        assert second == {"db_level": 45.0, "mock_mode": False}
+        assert mock_sensor_class.call_count == 2
+
+    @patch("backend.sensors.microphone_sensor.MicrophoneSensor")
+    def test_get_microphone_reading_replaces_inactive_sensor(self, mock_sensor_class):
+        """Test that a cached sensor which is no longer active is restarted fresh."""
+        stale, fresh = MagicMock(), MagicMock()
+        mock_sensor_class.side_effect = [stale, fresh]
+
+        get_microphone_reading(device_index=0)
+        stale.is_active.return_value = False
+        get_microphone_reading(device_index=0)
+
+        stale.stop.assert_called_once()
+        fresh.start.assert_called_once()
+        fresh.read.assert_called_once()
+
+    @patch("backend.sensors.microphone_sensor.MicrophoneSensor.initialize", return_value=True)
+    @patch("backend.sensors.microphone_sensor.MicrophoneSensor.check_hardware_available")
+    def test_mock_fallback_reprobes_after_ttl(self, mock_available, mock_init):
+        """Test that a microphone plugged in after a mock fallback is picked up."""
+        mock_available.return_value = False
+        fallback = _get_sensor(device_index=0)
+        assert fallback.status == SensorStatus.MOCK_MODE
+
+        mock_available.return_value = True
+        assert _get_sensor(device_index=0) is fallback  # Within AVAILABILITY_TTL
+
+        fallback._start_monotonic -= fallback.AVAILABILITY_TTL
+        sensor = _get_sensor(device_index=0)
+
+        assert sensor is not fallback
+        assert sensor.status == SensorStatus.ACTIVE
+        assert fallback.status == SensorStatus.INACTIVE
+
     @patch("backend.sensors.microphone_sensor.MicrophoneSensor")
     def test_check_microphone_available(self, mock_sensor_class):
         """Test check_microphone_available convenience function."""
@@ -384,6 +601,8 @@ class TestConvenienceFunctions:
 
         assert result is True
         mock_sensor.check_hardware_available.assert_called_once()
+        # An availability probe must not open (and hold) the input stream
+        mock_sensor.start.assert_not_called()
 
     @patch("sounddevice.query_devices")
     def test_list_audio_devices(self, mock_query_devices):
@@ -518,3 +737,17 @@ class TestRMSCalculation:
         rms, _, _, _ = sensor._analyze_audio(zero_signal)
 
         assert rms < 1e-9  # Essentially zero
+
+    @pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba not installed")
+    def test_numba_kernel_matches_numpy(self):
+        """Test the fused Numba RMS/dB kernel agrees with the NumPy path."""
+        rng = np.random.default_rng(0)
+        audio = (rng.standard_normal(44100) * 0.05).astype(np.float32)
+
+        numpy_result = MicrophoneSensor()._analyze_audio(audio)
+        numba_result = MicrophoneSensor(config={"use_numba": True})._analyze_audio(audio)
+
+        assert numba_result[0] == pytest.approx(numpy_result[0], rel=1e-5)
+        assert numba_result[1] == pytest.approx(numpy_result[1], abs=1e-3)
+        assert numba_result[2] == pytest.approx(numpy_result[2], abs=1e-3)
+        assert numba_result[3] == numpy_result[3]
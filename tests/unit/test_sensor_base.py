@@ -5,6 +5,7 @@ Tests for the abstract base sensor with all status states and mock mode support.
 """
 
 import pytest
+import threading
 import time
 from datetime import datetime
 from typing import Dict, Any
@@ -15,6 +16,7 @@ from backend.sensors.base import (
     SensorError,
     SensorUnavailableError,
     SensorConfigError,
+    iso_now,
 )
 
 
@@ -78,6 +80,19 @@ class TestSensorStatus:
         assert SensorStatus.MOCK_MODE.value == "mock_mode"
 
 
+class TestIsoNow:
+    """Test cached ISO 8601 timestamp helper."""
+
+    def test_parses_as_current_time(self):
+        """Test iso_now() returns a parseable timestamp close to now."""
+        stamp = datetime.fromisoformat(iso_now())
+        assert abs((datetime.now() - stamp).total_seconds()) < 1.0
+
+    def test_microsecond_precision(self):
+        """Test iso_now() always carries a microsecond suffix."""
+        assert len(iso_now().rsplit(".", 1)[1]) == 6
+
+
 class TestBaseSensorInitialization:
     """Test sensor initialization."""
 
@@ -383,3 +398,124 @@ class TestSensorEdgeCases:
 
         assert status["uptime_seconds"] > 0
         assert status["uptime_seconds"] < 1  # Should be less than 1 second
+
+
+class TestBackgroundSampling:
+    """Test optional background sampling into the history buffer."""
+
+    def test_read_serves_buffered_sample(self):
+        """Test read() returns the sampler's reading without capturing again."""
+        sensor = MockSensor(config={"sample_hz": 50})
+        sensor.start()
+        try:
+            time.sleep(0.1)
+            assert sensor._history.latest(max_age=1.0) is not None
+
+            sensor.capture_called = False
+            sensor._sampler_stop.set()  # Freeze the buffer
+            sensor._sampler_thread.join(timeout=1.0)
+
+            data = sensor.read()
+            assert data["value"] == 42.0
+            assert data["mock_mode"] is False
+            assert sensor.capture_called is False
+        finally:
+            sensor.stop()
+
+    def test_read_falls_back_when_sample_expired(self):
+        """Test read() captures directly once the buffered sample is stale."""
+        sensor = MockSensor(config={"sample_hz": 50})
+        sensor.start()
+        try:
+            sensor._sampler_stop.set()
+            sensor._sampler_thread.join(timeout=1.0)
+            time.sleep(0.1)  # Older than 2 sampling periods
+
+            sensor.capture_called = False
+            sensor.read()
+            assert sensor.capture_called is True
+        finally:
+            sensor.stop()
+
+    def test_stop_shuts_down_sampler(self):
+        """Test stop() joins the sampler thread and clears the buffer."""
+        sensor = MockSensor(config={"sample_hz": 20})
+        sensor.start()
+        thread = sensor._sampler_thread
+
+        assert sensor.is_sampling() is True
+        assert sensor.stop() is True
+        assert not thread.is_alive()
+        assert sensor._history is None
+        assert sensor.is_sampling() is False
+
+    def test_restart_from_error_replaces_sampler(self):
+        """Test restarting from ERROR without stop() leaves a single sampler thread."""
+        sensor = MockSensor(config={"sample_hz": 20})
+        sensor.start()
+        try:
+            for _ in range(3):
+                sensor.status = SensorStatus.ERROR
+                sensor.start()
+
+            samplers = [t for t in threading.enumerate() if t.name == "test-sampler"]
+            assert samplers == [sensor._sampler_thread]
+        finally:
+            sensor.stop()
+
+    def test_no_sampler_by_default(self):
+        """Test sensors capture on every read() unless sample_hz is set."""
+        sensor = MockSensor()
+        sensor.start()
+
+        assert sensor._sampler_thread is None
+        assert sensor._history is None
+        assert sensor.is_sampling() is False
+
+
+class TestPackedRead:
+    """Test binary serialization of sensor readings."""
+
+    def test_read_packed_json(self):
+        """Test read_packed(fmt="json") emits compact JSON."""
+        import json
+        import numpy as np
+
+        sensor = MockSensor()
+        sensor.start()
+        sensor.capture = lambda: {"value": np.float64(1.5), "shape": np.array([2, 3])}
+
+        payload = sensor.read_packed(fmt="json")
+
+        assert isinstance(payload, bytes)
+        assert json.loads(payload) == {"value": 1.5, "shape": [2, 3], "mock_mode": False}
+
+    def test_read_packed_msgpack_missing(self, monkeypatch):
+        """Test read_packed() refuses to silently switch formats without msgpack."""
+        from backend.sensors import base
+
+        monkeypatch.setattr(base, "MSGPACK_AVAILABLE", False)
+        sensor = MockSensor()
+        sensor.start()
+
+        with pytest.raises(SensorError, match="msgpack"):
+            sensor.read_packed()
+
+    def test_read_packed_unknown_format(self):
+        """Test read_packed() rejects formats it cannot produce."""
+        sensor = MockSensor()
+        sensor.start()
+
+        with pytest.raises(ValueError):
+            sensor.read_packed(fmt="xml")
+
+    def test_read_packed_msgpack(self):
+        """Test read_packed() round-trips through MessagePack when installed."""
+        msgpack = pytest.importorskip("msgpack")
+        sensor = MockSensor()
+        sensor.start()
+
+        data = msgpack.unpackb(sensor.read_packed(), raw=False)
+
+        assert data["value"] == 42.0
+        assert data["mock_mode"] is False
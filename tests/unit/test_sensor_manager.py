@@ -4,10 +4,15 @@ Tests for Sensor Manager (Phase 5).
 Comprehensive test suite for the unified sensor management system.
 """
 
+import asyncio
 import time
 import threading
-from unittest.mock import Mock
+from datetime import datetime
+from unittest.mock import Mock, patch
 
+import pytest
+
+from backend.sensors.base import SensorStatus
 from backend.sensors.sensor_manager import SensorManager, ManagerStatus
 
 
@@ -53,6 +58,12 @@ class TestSensorManagerInitialization:
         assert manager.camera is not None
         assert manager.microphone is not None
 
+    def test_init_uses_fixed_attribute_layout(self):
+        """Test that the manager has no per-instance __dict__."""
+        manager = SensorManager()
+
+        assert not hasattr(manager, "__dict__")
+
 
 class TestSensorManagerStartStop:
     """Test starting and stopping the sensor manager."""
@@ -97,6 +108,16 @@ class TestSensorManagerStartStop:
         # Cleanup
         manager.stop_all()
 
+    def test_start_all_fails_when_no_sensor_starts(self):
+        """Test start_all reports failure only when every registered sensor fails."""
+        manager = SensorManager()
+        with patch.object(SensorManager, "_start_sensor", return_value=False) as start:
+            result = manager.start_all()
+
+        assert result is False
+        assert manager.status == ManagerStatus.ERROR
+        assert [c.args[1] for c in start.call_args_list] == list(SensorManager.SENSOR_NAMES)
+
     def test_stop_not_running(self):
         """Test stopping when not running."""
         manager = SensorManager()
@@ -152,6 +173,44 @@ class TestSensorManagerStatus:
         assert "retry_count" in status["sensors"]["microphone"]
         assert "last_read" in status["sensors"]["microphone"]
 
+    def test_last_read_formatted_once_per_read(self):
+        """Test that last_read is an ISO string reused until the next read."""
+        config = {"camera": {"mock_mode": True}, "microphone": {"mock_mode": True}}
+        manager = SensorManager(config)
+
+        assert manager.get_all_status()["sensors"]["camera"]["last_read"] is None
+
+        manager.start_all()
+        manager.read_all()
+        first = manager.get_all_status()["sensors"]["camera"]["last_read"]
+        assert datetime.fromisoformat(first)
+        assert manager.get_all_status()["sensors"]["camera"]["last_read"] is first
+
+        manager.read_all()
+        assert manager.get_all_status()["sensors"]["camera"]["last_read"] is not first
+
+        manager.stop_all()
+
+
+class TestSensorManagerStatusCache:
+    """Test the get_all_status TTL cache."""
+
+    def test_status_cached_within_ttl(self):
+        """Test a TTL reuses the last status until it expires or state changes."""
+        manager = SensorManager()
+        manager.camera.get_status = Mock(wraps=manager.camera.get_status)
+
+        first = manager.get_all_status()
+        assert manager.get_all_status(ttl_ms=60_000) is first
+        assert manager.camera.get_status.call_count == 1
+
+        # ttl_ms=0 always rebuilds
+        assert manager.get_all_status() is not first
+        assert manager.camera.get_status.call_count == 2
+
+        manager.update_config({"max_retries": 5})
+        assert manager.get_all_status(ttl_ms=60_000) is not first
+
 
 class TestSensorManagerReading:
     """Test reading from sensors."""
@@ -184,8 +243,8 @@ class TestSensorManagerReading:
         manager.read_all()
 
         # Check that timestamps were updated
-        assert manager._last_read_time["camera"] is not None
-        assert manager._last_read_time["microphone"] is not None
+        assert manager._slot_map["camera"].last_read_ns is not None
+        assert manager._slot_map["microphone"].last_read_ns is not None
 
         # Cleanup
         manager.stop_all()
@@ -207,7 +266,140 @@ class TestSensorManagerReading:
 
         # Camera should have error
         assert "camera" in data["errors"]
-        assert manager._error_counts["camera"] > 0
+        assert manager._slot_map["camera"].error_count > 0
+
+    def test_read_all_resets_error_count_on_success(self):
+        """Test that a successful read clears the sensor's error count."""
+        config = {"camera": {"mock_mode": True}, "microphone": {"mock_mode": True}}
+        manager = SensorManager(config)
+        manager.camera.start()  # No polling thread to race with the reads below
+        manager.microphone.start()
+
+        manager.camera.read = Mock(side_effect=[Exception("Test error"), {"ok": True}])
+        manager.read_all()
+        assert manager._slot_map["camera"].error_count == 1
+
+        data = manager.read_all()
+        assert data["data"]["camera"] == {"ok": True}
+        assert manager._slot_map["camera"].error_count == 0
+        assert manager._slot_map["microphone"].error_count == 0
+
+    @patch("backend.sensors.sensor_manager.insert_sensor_data")
+    def test_read_all_switches_with_simulation_mode(self, mock_insert):
+        """Test that read_all follows start_simulation/stop_simulation."""
+        manager = SensorManager({"polling_interval": 30.0})
+        manager.camera.read = Mock(wraps=manager.camera.read)
+
+        assert manager.start_simulation("calm") is True
+        data = manager.read_all()
+        assert data["simulation_mode"] is True
+        assert "emotion" in data["data"]
+        assert manager.camera.read.call_count == 0
+
+        assert manager.stop_simulation() is True
+        data = manager.read_all()
+        assert "simulation_mode" not in data
+        assert manager.camera.read.call_count == 1
+
+        manager.stop_all()
+
+    def test_read_all_reads_sensors_concurrently(self):
+        """Test sensor reads overlap instead of running back to back."""
+        manager = SensorManager({"polling_interval": 5.0})
+
+        def slow_read():
+            time.sleep(0.3)
+            return {"ok": True}
+
+        for name in manager.SENSOR_NAMES:
+            setattr(getattr(manager, name), "read", Mock(side_effect=slow_read))
+
+        start = time.monotonic()
+        data = manager.read_all()
+        elapsed = time.monotonic() - start
+
+        assert set(data["data"]) == set(manager.SENSOR_NAMES)
+        assert elapsed < 0.8  # Serial reads would take 0.9s
+
+    def test_read_all_reads_sampled_sensors_inline(self):
+        """Test that background-sampled sensors are read without the thread pool."""
+        sensor_config = {"mock_mode": True, "sample_hz": 50}
+        config = {name: sensor_config for name in SensorManager.SENSOR_NAMES}
+        manager = SensorManager(config)
+        for name in SensorManager.SENSOR_NAMES:
+            getattr(manager, name).start()
+
+        try:
+            time.sleep(0.1)  # Let the samplers fill their buffers
+            data = manager.read_all()
+
+            assert set(data["data"]) == set(SensorManager.SENSOR_NAMES)
+            assert data["errors"] == {}
+            assert manager._read_pool is None
+        finally:
+            for name in SensorManager.SENSOR_NAMES:
+                getattr(manager, name).stop()
+
+    @pytest.mark.asyncio
+    async def test_read_all_async_does_not_block_event_loop(self):
+        """Test that async reads leave the event loop free while sensors block."""
+        manager = SensorManager({"polling_interval": 5.0})
+
+        def slow_read():
+            time.sleep(0.3)
+            return {"ok": True}
+
+        manager.camera.read = Mock(side_effect=slow_read)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        data = await manager.read_all_async()
+        ticker_task.cancel()
+
+        assert data["data"]["camera"] == {"ok": True}
+        assert ticks >= 10
+
+    def test_read_all_times_out_slow_sensor(self):
+        """Test a sensor slower than the polling interval is reported as a timeout."""
+        manager = SensorManager({"polling_interval": 0.2})
+        manager.camera.read = Mock(side_effect=lambda: time.sleep(1.0))
+
+        data = manager.read_all()
+
+        assert data["errors"]["camera"] == "timeout"
+        assert manager._slot_map["camera"].error_count == 1
+
+    def test_hung_sensor_does_not_starve_other_sensors(self):
+        """Test a read stuck across cycles is not resubmitted and others keep reading."""
+        manager = SensorManager({"polling_interval": 0.2})
+        release = threading.Event()
+        manager.camera.read = Mock(side_effect=lambda: release.wait(5.0) and {"frame": 1})
+        manager.microphone.read = Mock(return_value={"db_level": 40.0})
+        manager.air_quality.read = Mock(return_value={"ppm": 400})
+
+        try:
+            for _ in range(4):
+                data = manager.read_all()
+                assert data["errors"] == {"camera": "timeout"}
+                assert set(data["data"]) == {"microphone", "air_quality"}
+
+            # One stuck read, not one per cycle
+            assert manager.camera.read.call_count == 1
+            assert manager._slot_map["camera"].error_count == 4
+            assert manager._slot_map["microphone"].error_count == 0
+        finally:
+            release.set()
+
+        manager._slot_map["camera"].in_flight[0].result(timeout=1.0)
+        data = manager.read_all()
+        assert data["data"]["camera"] == {"frame": 1}
+        assert manager._slot_map["camera"].error_count == 0
 
 
 class TestSensorManagerHealth:
@@ -230,6 +422,24 @@ class TestSensorManagerHealth:
         # Cleanup
         manager.stop_all()
 
+    def test_get_health_mock_sensors_fully_healthy(self):
+        """Test active mock-mode sensors count as healthy."""
+        config = {
+            "polling_interval": 0.1,
+            "camera": {"mock_mode": True},
+            "microphone": {"mock_mode": True},
+            "air_quality": {"mock_mode": True},
+        }
+        manager = SensorManager(config)
+
+        manager.start_all()
+        health = manager.get_health()
+        manager.stop_all()
+
+        assert health["health_score"] == 100
+        assert health["status"] == "healthy"
+        assert health["issues"] == []
+
     def test_get_health_not_running(self):
         """Test health when manager not running."""
         manager = SensorManager()
@@ -247,8 +457,8 @@ class TestSensorManagerHealth:
         manager = SensorManager(config)
 
         # Introduce errors
-        manager._error_counts["camera"] = 3
-        manager._error_counts["microphone"] = 2
+        manager._slot_map["camera"].error_count = 3
+        manager._slot_map["microphone"].error_count = 2
 
         health = manager.get_health()
 
@@ -327,6 +537,40 @@ class TestSensorManagerPolling:
         if manager._polling_thread:
             assert not manager._polling_thread.is_alive()
 
+    def test_stop_interrupts_polling_wait(self):
+        """Test that stop_all does not wait out a long polling interval."""
+        config = {
+            "polling_interval": 30.0,
+            "camera": {"mock_mode": True},
+            "microphone": {"mock_mode": True},
+        }
+        manager = SensorManager(config)
+
+        manager.start_all()
+        time.sleep(0.1)  # Let the loop enter its wait
+
+        start = time.monotonic()
+        manager.stop_all()
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 2.0
+        assert not manager._polling_thread.is_alive()
+
+    def test_polling_survives_loop_error_with_traceback(self, caplog):
+        """Test that an unexpected loop error is logged with its traceback and polling continues."""
+        manager = SensorManager({"camera": {"mock_mode": True}, "microphone": {"mock_mode": True}})
+        manager._read_all = Mock(side_effect=RuntimeError("boom"))
+
+        with caplog.at_level("ERROR", logger="backend.sensors.sensor_manager"):
+            manager.start_all()
+            time.sleep(0.2)
+            alive = manager._polling_thread.is_alive()
+            manager.stop_all()
+
+        assert alive
+        records = [r for r in caplog.records if r.getMessage() == "Error in polling loop"]
+        assert records and records[0].exc_info is not None
+
     def test_polling_updates_data(self):
         """Test that polling updates sensor data."""
         config = {
@@ -342,12 +586,102 @@ class TestSensorManagerPolling:
         time.sleep(1.0)
 
         # Should have read timestamps
-        assert manager._last_read_time["camera"] is not None
-        assert manager._last_read_time["microphone"] is not None
+        assert manager._slot_map["camera"].last_read_ns is not None
+        assert manager._slot_map["microphone"].last_read_ns is not None
 
         # Cleanup
         manager.stop_all()
 
+    def test_polling_rate_does_not_drift_with_read_latency(self):
+        """Test that slow reads do not stretch the polling period."""
+        config = {
+            "polling_interval": 0.1,
+            "auto_recover": False,
+            "camera": {"mock_mode": True},
+            "microphone": {"mock_mode": True},
+        }
+        manager = SensorManager(config)
+        original_read = manager.camera.read
+
+        def slow_read():
+            time.sleep(0.05)
+            return original_read()
+
+        manager.camera.read = Mock(side_effect=slow_read)
+
+        manager.start_all()
+        time.sleep(1.0)
+        manager.stop_all()
+
+        # Sleeping a full interval after each read would manage only ~7 cycles
+        assert manager.camera.read.call_count >= 9
+
+    def test_demand_driven_skips_unconsumed_polls(self):
+        """Test that demand-driven polling reads only after read_all() consumed a snapshot."""
+        config = {
+            "polling_interval": 0.2,
+            "demand_driven": True,
+            "camera": {"mock_mode": True},
+            "microphone": {"mock_mode": True},
+        }
+        manager = SensorManager(config)
+        manager.camera.read = Mock(wraps=manager.camera.read)
+
+        manager.start_all()
+        time.sleep(0.1)
+        assert manager.camera.read.call_count == 1
+
+        # A fresh snapshot is served as-is and the loop prepares the next one
+        snapshot = manager._last_snapshot[1]
+        assert manager.read_all() is snapshot
+        assert manager.camera.read.call_count == 1
+        time.sleep(0.5)  # Several cycles, only the first has a consumer
+        assert manager.camera.read.call_count == 2
+
+        # A stale snapshot is re-read directly, without waking the loop
+        data = manager.read_all()
+        assert "camera" in data["data"]
+        assert manager.camera.read.call_count == 3
+        time.sleep(0.3)
+        assert manager.camera.read.call_count == 3
+
+        manager.stop_all()
+
+    @patch("backend.sensors.sensor_manager.insert_sensor_data")
+    def test_demand_driven_drops_simulated_snapshot_on_stop(self, mock_insert):
+        """Test that read_all() serves no simulated snapshot once simulation stops."""
+        manager = SensorManager({"polling_interval": 30.0, "demand_driven": True})
+
+        assert manager.start_simulation("calm") is True
+        time.sleep(0.3)  # Let the polling loop take a simulated snapshot
+        assert manager.stop_simulation() is True
+
+        assert manager._last_snapshot is None
+        data = manager.read_all()
+        assert "simulation_mode" not in data
+        assert "emotion" not in data["data"]
+
+        manager.stop_all()
+
+    def test_demand_driven_reads_when_snapshot_too_old(self):
+        """Test that max_snapshot_age forces a poll without consumers."""
+        config = {
+            "polling_interval": 0.05,
+            "demand_driven": True,
+            "max_snapshot_age": 0.1,
+            "camera": {"mock_mode": True},
+            "microphone": {"mock_mode": True},
+        }
+        manager = SensorManager(config)
+        manager.camera.read = Mock(wraps=manager.camera.read)
+
+        manager.start_all()
+        time.sleep(0.5)
+
+        assert manager.camera.read.call_count >= 3
+
+        manager.stop_all()
+
 
 class TestSensorManagerThreadSafety:
     """Test thread-safe operations."""
@@ -380,6 +714,29 @@ class TestSensorManagerThreadSafety:
         # Cleanup
         manager.stop_all()
 
+    def test_status_does_not_wait_for_locks(self):
+        """Test that status reads proceed while lifecycle and counter locks are held."""
+        manager = SensorManager({"camera": {"mock_mode": True}})
+        results = []
+
+        with manager._lock, manager._state_lock:
+            reader = threading.Thread(target=lambda: results.append(manager.get_health()))
+            reader.start()
+            reader.join(timeout=2.0)
+
+        assert len(results) == 1
+        assert "health_score" in results[0]
+
+    def test_read_pool_lookup_skips_lock_once_created(self):
+        """Test that an existing read pool is returned without taking _state_lock."""
+        manager = SensorManager()
+        pool = manager._get_read_pool()
+
+        with manager._state_lock:  # Non-reentrant: would deadlock if taken again
+            assert manager._get_read_pool() is pool
+
+        pool.shutdown()
+
     def test_concurrent_read_all(self):
         """Test concurrent read_all calls are thread-safe."""
         config = {"camera": {"mock_mode": True}, "microphone": {"mock_mode": True}}
@@ -427,13 +784,102 @@ class TestSensorManagerRecovery:
 
         assert should_recover is True
 
+    def test_should_recover_sensor_error_status(self):
+        """Test recovery is triggered by the status values sensors actually report."""
+        manager = SensorManager({"camera": {"mock_mode": True}})
+        manager.camera.status = SensorStatus.ERROR
+
+        assert manager._should_recover("camera", manager.camera) is True
+
+    def test_recovery_check_reuses_sensor_status(self):
+        """Test repeated recovery checks fetch status once until the sensor changes."""
+        manager = SensorManager({"camera": {"mock_mode": True}})
+        manager.camera.get_status = Mock(return_value={"status": "active"})
+
+        manager._should_recover("camera", manager.camera)
+        manager._should_recover("camera", manager.camera)
+        assert manager.camera.get_status.call_count == 1
+
+        # A failed read invalidates the cached status
+        manager.camera.read = Mock(side_effect=Exception("Test error"))
+        manager.read_all()
+        manager._should_recover("camera", manager.camera)
+        assert manager.camera.get_status.call_count == 2
+
+    def test_check_and_recover_skips_healthy_sensors(self):
+        """Test that the recovery sweep queries nothing when no sensor has errors."""
+        manager = SensorManager({"camera": {"mock_mode": True}})
+        manager.camera.get_status = Mock(return_value={"status": "error"})
+
+        manager._check_and_recover()
+
+        manager.camera.get_status.assert_not_called()
+
+    def test_check_and_recover_queries_only_failing_sensors(self):
+        """Test that only sensors with read errors have their status checked."""
+        manager = SensorManager()
+        manager.camera.get_status = Mock(return_value={"status": "active"})
+        manager.microphone.get_status = Mock(return_value={"status": "active"})
+        manager._slot_map["microphone"].error_count = 1
+
+        manager._check_and_recover()
+
+        manager.camera.get_status.assert_not_called()
+        manager.microphone.get_status.assert_called_once()
+
+    def test_check_and_recover_includes_air_quality(self):
+        """Test that a failed air quality sensor is restarted too."""
+        manager = SensorManager()
+        manager.air_quality.get_status = Mock(return_value={"status": "error"})
+        manager.air_quality.start = Mock(return_value=False)
+        manager._slot_map["air_quality"].error_count = 1
+
+        manager._check_and_recover()
+
+        manager.air_quality.start.assert_called_once()
+        assert manager._slot_map["air_quality"].retry_count == 1
+
+    def test_failed_recovery_backs_off(self):
+        """Test that a failed restart is not retried until its backoff expires."""
+        manager = SensorManager()
+        manager.air_quality.get_status = Mock(return_value={"status": "error"})
+        manager.air_quality.start = Mock(return_value=False)
+        slot = manager._slot_map["air_quality"]
+        slot.error_count = 1
+
+        manager._check_and_recover()
+        manager._check_and_recover()
+        assert manager.air_quality.start.call_count == 1
+
+        slot.next_recover_ns = time.monotonic_ns() - 1  # Backoff expired
+        manager._check_and_recover()
+        assert manager.air_quality.start.call_count == 2
+        assert slot.retry_count == 2
+
+    def test_recovery_stops_sensor_before_restart(self):
+        """Test that recovery releases the hardware before initializing it again."""
+        manager = SensorManager({"camera": {"mock_mode": False}})
+        camera = manager.camera
+        calls = []
+        camera.check_hardware_available = Mock(return_value=True)
+        camera.initialize = Mock(side_effect=lambda: calls.append("initialize") or True)
+        camera.cleanup = Mock(side_effect=lambda: calls.append("cleanup") or True)
+        camera.status = SensorStatus.ERROR
+        manager._slot_map["camera"].error_count = 1
+
+        manager._check_and_recover()
+
+        assert calls == ["cleanup", "initialize"]
+        assert camera.status == SensorStatus.ACTIVE
+        assert camera.mock_mode is False
+
     def test_should_not_recover_max_retries_exceeded(self):
         """Test that recovery stops after max retries."""
         config = {"camera": {"mock_mode": True}, "microphone": {"mock_mode": True}}
         manager = SensorManager(config)
 
         # Set retry count to max
-        manager._retry_counts["camera"] = manager.max_retries
+        manager._slot_map["camera"].retry_count = manager.max_retries
 
         should_recover = manager._should_recover("camera", manager.camera)
 
@@ -490,7 +936,7 @@ class TestSensorManagerHelperMethods:
         success = manager._start_sensor(manager.camera, "camera")
 
         assert success is True
-        assert manager._retry_counts["camera"] == 0
+        assert manager._slot_map["camera"].retry_count == 0
 
     def test_stop_sensor_success(self):
         """Test stopping individual sensor."""
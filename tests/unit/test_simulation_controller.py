@@ -76,6 +76,27 @@ class TestSimulationController:
         assert all("name" in s for s in scenarios)
         assert all("description" in s for s in scenarios)
 
+    def test_available_scenarios_list_is_independent(self):
+        """Test callers get their own copy of the shared scenario catalogue."""
+        controller = SimulationController()
+        scenarios = controller.get_available_scenarios()
+        scenarios[0]["name"] = "Changed"
+        scenarios.clear()
+
+        scenarios = SimulationController().get_available_scenarios()
+        assert len(scenarios) == 4
+        assert scenarios[0]["name"] == "Calm Flow"
+
+    def test_generate_sensor_data_shares_timestamp(self):
+        """Test one tick's readings carry the same timestamp."""
+        controller = SimulationController()
+        controller.start("calm")
+        data = controller.generate_sensor_data()
+
+        assert data["camera"]["timestamp"] == data["timestamp"]
+        assert data["microphone"]["timestamp"] == data["timestamp"]
+        assert data["emotion"]["timestamp"] == data["timestamp"]
+
     def test_generate_camera_data_calm(self):
         """Test camera data generation for calm scenario."""
         controller = SimulationController()
@@ -0,0 +1,119 @@
+"""
+Unit Tests for Sound Analysis
+-----------------------------
+Tests for SoundAnalyzer's real-input FFT, cached window and cached
+frequency band slices, checked against the full-FFT / boolean-mask
+computations they replaced.
+"""
+
+import sys
+import numpy as np
+import pytest
+from unittest.mock import MagicMock
+
+# Mock sounddevice before importing sound_analysis to avoid PortAudio dependency
+sys.modules.setdefault("sounddevice", MagicMock())
+
+from backend.sensors.sound_analysis import SoundAnalyzer, SCIPY_AVAILABLE  # noqa: E402
+
+pytestmark = pytest.mark.skipif(not SCIPY_AVAILABLE, reason="SciPy not installed")
+
+
+class _Analyzer(SoundAnalyzer):
+    """Concrete SoundAnalyzer (the base leaves capture_mock_data abstract)."""
+
+    def capture_mock_data(self):
+        return {"sensor_type": self.sensor_type}
+
+
+def _audio(n, seed=0):
+    """Noisy 440 Hz tone at 44.1 kHz as float32."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(n) / 44100.0
+    return (0.5 * np.sin(2 * np.pi * 440.0 * t) + 0.05 * rng.standard_normal(n)).astype(np.float32)
+
+
+def _masked_band_energies(analyzer, fft_results):
+    """Band energies as computed with per-band boolean masks."""
+    frequencies = fft_results["frequencies"]
+    magnitudes = fft_results["magnitudes"]
+    spectrum = {}
+    for band_name, (freq_min, freq_max) in analyzer.FREQ_BANDS.items():
+        band_magnitudes = magnitudes[(frequencies >= freq_min) & (frequencies < freq_max)]
+        energy = float(np.mean(band_magnitudes)) if len(band_magnitudes) > 0 else 0.0
+        spectrum[band_name] = round(energy, 6)
+    return spectrum
+
+
+class TestPerformFFT:
+    """Test the real-input FFT against the full complex FFT."""
+
+    @pytest.mark.parametrize("n", [4410, 4411])
+    def test_matches_full_fft_bins(self, n):
+        """Test rfft returns the same n/2 bins a full FFT cut at n/2 did."""
+        from scipy import signal
+        from scipy.fft import fft, fftfreq
+
+        analyzer = _Analyzer()
+        audio = _audio(n)
+
+        result = analyzer._perform_fft(audio)
+
+        full = fft(audio.astype(np.float64) * signal.get_window("hann", n))
+        expected_magnitudes = np.abs(full[: n // 2])
+        expected_frequencies = fftfreq(n, 1 / analyzer.sample_rate)[: n // 2]
+        assert len(result["magnitudes"]) == n // 2
+        np.testing.assert_allclose(result["frequencies"], expected_frequencies)
+        np.testing.assert_allclose(result["magnitudes"], expected_magnitudes, rtol=1e-3, atol=1e-3)
+        assert result["dominant_freq"] == round(
+            float(expected_frequencies[np.argmax(expected_magnitudes)]), 2
+        )
+
+
+class TestBandSlices:
+    """Test the cached searchsorted band ranges."""
+
+    @pytest.mark.parametrize("n", [64, 4410, 44100])
+    def test_band_energies_match_masked_computation(self, n):
+        """Test slicing yields the same band energies as boolean masks."""
+        analyzer = _Analyzer()
+        fft_results = analyzer._perform_fft(_audio(n))
+
+        assert analyzer._analyze_spectrum(fft_results) == _masked_band_energies(
+            analyzer, fft_results
+        )
+
+    def test_slices_rebuild_on_length_and_sample_rate(self):
+        """Test cached slices are recomputed when the bins change."""
+        analyzer = _Analyzer()
+        short = analyzer._perform_fft(_audio(4410))
+        first = analyzer._get_band_slices(short["frequencies"])
+        assert analyzer._get_band_slices(short["frequencies"]) is first
+
+        long = analyzer._perform_fft(_audio(8820))
+        assert analyzer._get_band_slices(long["frequencies"]) != first
+        assert analyzer._analyze_spectrum(long) == _masked_band_energies(analyzer, long)
+
+        analyzer.sample_rate = 16000
+        resampled = analyzer._perform_fft(_audio(8820))
+        assert analyzer._analyze_spectrum(resampled) == _masked_band_energies(analyzer, resampled)
+        assert analyzer._band_slices[0] == (len(resampled["frequencies"]), 16000)
+
+
+class TestWindowCache:
+    """Test the cached Hann window."""
+
+    def test_window_reused_until_length_changes(self):
+        """Test the window is built once per input length."""
+        from scipy import signal
+
+        analyzer = _Analyzer()
+        window = analyzer._get_window(256)
+
+        assert analyzer._get_window(256) is window
+        assert window.dtype == np.float32
+        np.testing.assert_allclose(window, signal.get_window("hann", 256), rtol=1e-6)
+
+        rebuilt = analyzer._get_window(512)
+        assert rebuilt is not window
+        assert len(rebuilt) == 512